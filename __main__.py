@@ -1,4 +1,6 @@
 # main.py
+import multiprocessing
+
 from app import ConlangApp
 
 def main():
@@ -6,4 +8,5 @@ def main():
     app.mainloop()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # worker processes in the packaged exe
     main()
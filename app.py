@@ -5,6 +5,11 @@ import os
 from constants import LANG_ROOT, CONJ_FILE, CONJ_FIELDS
 from utils.file_io import load_csv
 from utils.file_io import get_languages
+from utils.autosave import AutosaveQueue
+from utils.background import BackgroundExecutor
+from utils.conjugations import ConjugationIndex, set_conjugations
+from utils.lexicon import Lexicon
+from utils.translation_memory import close_translation_memories
 # Tabs
 from widgets import import_export_tab, phonology_tab, fonts_tab, dictionary_tab
 from widgets import grammar_tab, numbers_tab, compare_tab, translation_tab
@@ -31,12 +36,19 @@ class ConlangApp(tk.Tk):
 
         # runtime state
         self.current_language = None
-        self.dictionary = {}
+        self.lexicon = Lexicon()               # headwords + conlang/pronunciation reverse maps
+        self.dictionary = self.lexicon.entries
+        self.dict_store = None   # SQLite dictionary backend, if the language uses one
+        self.dict_journal = None # change journal for dictionary.csv otherwise
+        self.dict_dirty = {}     # dictionary row key -> headword at last save
         self.conjugations = []
+        self.conj_index = ConjugationIndex()  # conjugations hashed by english/base
         self.phonology = []
         self.phonotactics = ""
         self.current_font = None
         self.font_preview_mapping = []
+        self.autosave = AutosaveQueue()  # debounced background saves from cell edits
+        self.executor = BackgroundExecutor(self)  # worker pools; results come back via after()
 
         # Bind methods from tab modules
         self.load_selected_language = import_export_tab.load_selected_language.__get__(self)
@@ -55,6 +67,7 @@ class ConlangApp(tk.Tk):
         # build UI
         self.create_widgets()
         self.refresh_language_list()
+        self.protocol("WM_DELETE_WINDOW", self.on_exit)
 
 
     def create_widgets(self):
@@ -104,9 +117,9 @@ class ConlangApp(tk.Tk):
         # 🔑 Load conjugations
         conj_path = os.path.join(langdir, CONJ_FILE)
         if os.path.exists(conj_path):
-            self.conjugations = load_csv(conj_path, CONJ_FIELDS)
+            set_conjugations(self, load_csv(conj_path, CONJ_FIELDS))
         else:
-            self.conjugations = []
+            set_conjugations(self, [])
 
 
         
@@ -134,15 +147,16 @@ class ConlangApp(tk.Tk):
             entry.focus()
 
             def save_edit(event=None):
+                if not entry.winfo_exists():
+                    return  # FocusOut after Return already saved
                 new_val = entry.get()
                 vals = list(tree.item(rowid, "values"))
                 vals[col_index] = new_val
                 tree.item(rowid, values=vals)
                 entry.destroy()
-                # 🔑 auto-save grammar after any edit
+                # 🔑 auto-save grammar after any edit (debounced, written in the background)
                 try:
-                    from widgets import grammar_tab
-                    grammar_tab.save_grammar(self)
+                    grammar_tab.autosave_grammar(self)
                 except Exception as e:
                     print("Auto-save failed:", e)
 
@@ -183,4 +197,8 @@ class ConlangApp(tk.Tk):
 
     def on_exit(self):
         if messagebox.askyesno("Exit", "Are you sure you want to quit?"):
+            dictionary_tab.close_dictionary(self)
+            self.autosave.stop()
+            self.executor.shutdown()
+            close_translation_memories()
             self.destroy()
@@ -7,12 +7,16 @@ os.makedirs(LANG_ROOT, exist_ok=True)
 
 # Filenames
 DICT_FILE = "dictionary.csv"
+DICT_DB_FILE = "dictionary.db"
+DICT_JOURNAL_FILE = "dictionary.journal"
 PHONO_FILE = "phonology.csv"
 PHONOTEXT = "phonotactics.txt"
 GRAMMAR_TEXT = "grammar.txt"
 CONJ_FILE = "conjugations.csv"
 FONTS_DIRNAME = "fonts"
 NUMBERS_FILE = "numbers.csv"
+SPELLING_FILE = "spelling_rules.csv"
+TM_FILE = "translation_memory.db"
 
 # CSV field definitions
 DICT_FIELDS = [
@@ -22,3 +26,4 @@ DICT_FIELDS = [
 ]
 PHONO_FIELDS = ["ipa", "example", "type", "notes"]
 CONJ_FIELDS = ["english", "base", "past", "present", "future"]
+SPELLING_FIELDS = ["ipa", "romanization"]
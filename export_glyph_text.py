@@ -0,0 +1,57 @@
+# export_glyph_text.py
+"""
+Headless export of text rendered in a conlang's glyphs, one image per line:
+
+    python export_glyph_text.py --lang MyLang --in samples.txt --out-dir samples --format svg --jobs 4
+    python export_glyph_text.py --lang MyLang --in english.txt --out-dir samples --translate --tense past
+
+Glyphs come from a font's mapping.csv (the first font unless --font is
+given). Run from the folder that holds Languages/.
+"""
+import argparse
+import os
+import sys
+
+from constants import LANG_ROOT, FONTS_DIRNAME
+from utils.glyph_atlas import first_font_dir, GLYPH_HEIGHT
+from utils.glyph_export import export_text_file, EXPORT_WIDTH, FORMATS
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Render lines of text in a conlang script to PNG/SVG")
+    p.add_argument("--lang", "-l", required=True, help="Language folder name under Languages/")
+    p.add_argument("--font", help="Font folder under Languages/<lang>/fonts/ (default: first font)")
+    p.add_argument("--in", "-i", dest="src", required=True, help="Text file, one sample per line (UTF-8)")
+    p.add_argument("--out-dir", "-o", required=True, help="Folder for the images and index.csv")
+    p.add_argument("--format", "-f", default="png", choices=FORMATS)
+    p.add_argument("--width", type=int, default=EXPORT_WIDTH, help="Page width in pixels (lines wrap)")
+    p.add_argument("--glyph-height", type=int, default=GLYPH_HEIGHT)
+    p.add_argument("--translate", action="store_true", help="Input is English: translate each line first")
+    p.add_argument("--tense", default="present", choices=["present", "past", "future"])
+    p.add_argument("--jobs", "-j", type=int, default=1, help="Worker processes (default 1)")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.font:
+        fontdir = os.path.join(LANG_ROOT, args.lang, FONTS_DIRNAME, args.font)
+    else:
+        fontdir = first_font_dir(args.lang)
+    if not fontdir or not os.path.isdir(fontdir):
+        sys.exit(f"[ERROR] No font folder for {args.lang}")
+
+    def progress(done, total):
+        pct = 100 * done // total if total else 100
+        print(f"\r[INFO] {pct:3d}%", end="", file=sys.stderr, flush=True)
+
+    count = export_text_file(fontdir, args.src, args.out_dir, fmt=args.format, width=args.width,
+                             glyph_height=args.glyph_height,
+                             translate_lang=args.lang if args.translate else None,
+                             tense=args.tense, jobs=max(1, args.jobs), progress=progress)
+    print(file=sys.stderr)
+    print(f"[DONE] Wrote {count} {args.format.upper()} files to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
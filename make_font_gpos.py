@@ -5,18 +5,24 @@ SVG/PNG -> TTF font builder with:
 - Advance widths from bounding boxes
 - GSUB ligature table for multi-character glyphs
 - GPOS PairPos kerning (LookupType 2)
+- Optional process pool for tracing (--jobs N); the font is assembled in
+  filename order either way, so the output matches a serial build
+- Outline cache in the images folder, so a rebuild only re-traces images
+  whose content (or the tracing settings) changed
 """
 
-import os, io, argparse
+import os, argparse, hashlib, json
 from typing import List, Tuple, Dict
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 
 from fontTools.ttLib import TTFont, newTable
 from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.pens.recordingPen import RecordingPen, replayRecording
 from fontTools.ttLib.tables._c_m_a_p import CmapSubtable
 from fontTools.ttLib.tables import otTables
 
-from svgpathtools import svg2paths, Line, QuadraticBezier, CubicBezier
+from svgpathtools import svg2paths, parse_path, Line, QuadraticBezier, CubicBezier
 from PIL import Image
 import numpy as np
 from skimage import measure
@@ -33,6 +39,9 @@ PNG_THRESHOLD = 128
 CONTOUR_TOLERANCE = 1.0
 KERN_MARGIN = 30
 DEFAULT_KERN_MIN = -200
+OUTLINE_CACHE_FILE = ".outline_cache.json"
+TRACE_SUFFIX = ".trace.svg"   # left next to PNGs by older builds; never a glyph of its own
+OUTLINE_CACHE_VERSION = 1
 
 ALIAS = {"comma": ",", "period": ".", "space": " ", "hyphen": "-", "dash": "-", "underscore": "_"}
 
@@ -52,7 +61,7 @@ def filename_to_sequence(stem: str) -> List[str]:
 def sequence_to_glyphname(seq: List[str]) -> str:
     return "_".join("space" if ch == " " else ch for ch in seq)
 
-# ---------------- PNG -> SVG tracing ----------------
+# ---------------- PNG -> SVG path tracing ----------------
 def png_to_svg_pathlist(png_path: str) -> Tuple[List[str], Tuple[int,int]]:
     img = Image.open(png_path).convert("L")
     w,h = img.size
@@ -79,27 +88,6 @@ def png_to_svg_pathlist(png_path: str) -> Tuple[List[str], Tuple[int,int]]:
         paths.append(" ".join(d))
     return paths, (w,h)
 
-def svg_paths_to_svg_file(path_d_list: List[str], size: Tuple[int,int]) -> str:
-    w,h = size
-    sb = io.StringIO()
-    sb.write(f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {w} {h}" width="{w}" height="{h}">\n')
-    for d in path_d_list:
-        sb.write(f'  <path d="{d}" fill="black"/>\n')
-    sb.write('</svg>\n')
-    return sb.getvalue()
-
-def ensure_svg_from_file(filepath: str) -> str:
-    ext = os.path.splitext(filepath)[1].lower()
-    if ext == ".svg": return filepath
-    if ext == ".png":
-        path_d_list, size = png_to_svg_pathlist(filepath)
-        svg_text = svg_paths_to_svg_file(path_d_list, size)
-        tmp_svg = filepath + ".trace.svg"
-        with open(tmp_svg, "w", encoding="utf-8") as f:
-            f.write(svg_text)
-        return tmp_svg
-    raise ValueError("Unsupported file type: " + ext)
-
 # ---------------- Draw into TTGlyphPen ----------------
 def draw_path_to_pen(paths, pen):
     for path in paths:
@@ -118,6 +106,110 @@ def draw_path_to_pen(paths, pen):
         if started:
             pen.closePath()
 
+# ---------------- Tracing (serial or in worker processes) ----------------
+def trace_outline(src_path: str) -> list:
+    """
+    Trace one SVG/PNG into pen operations (a picklable RecordingPen value).
+    PNG traces are parsed in memory, so nothing is written to the images folder.
+    """
+    ext = os.path.splitext(src_path)[1].lower()
+    if ext == ".png":
+        path_d_list, _ = png_to_svg_pathlist(src_path)
+        paths = [parse_path(d) for d in path_d_list]
+    elif ext == ".svg":
+        paths, _ = svg2paths(src_path)
+    else:
+        raise ValueError("Unsupported file type: " + ext)
+    pen = RecordingPen()
+    draw_path_to_pen(paths, pen)
+    return pen.value
+
+def _trace_or_error(src_path: str):
+    try:
+        return trace_outline(src_path)
+    except Exception as e:
+        return e
+
+def trace_outlines(images_dir: str, filenames: List[str], jobs: int = 1, cache=None):
+    """
+    Yield (filename, cache key, pen operations or the exception raised,
+    cached bbox or None) in the given order. Images found in the cache are
+    not traced again; the rest are traced serially or in a process pool.
+    """
+    paths = [os.path.join(images_dir, fn) for fn in filenames]
+    keys = [cache.key(p) for p in paths] if cache else [None] * len(paths)
+    cached = [cache.get(k) for k in keys] if cache else [None] * len(paths)
+    missing = [p for p, entry in zip(paths, cached) if entry is None]
+
+    def merged(traced):
+        for fn, key, entry in zip(filenames, keys, cached):
+            if entry is not None:
+                yield fn, key, entry["outline"], entry["bbox"]
+            else:
+                yield fn, key, next(traced), None
+
+    if jobs > 1 and len(missing) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            yield from merged(pool.map(_trace_or_error, missing, chunksize=4))
+    else:
+        yield from merged(_trace_or_error(p) for p in missing)
+
+# ---------------- Outline cache ----------------
+class OutlineCache:
+    """
+    Traced outlines and bounding boxes of one images folder, stored in the
+    folder as OUTLINE_CACHE_FILE. Entries are keyed by a hash of the image
+    bytes and the tracing settings (PNG_THRESHOLD, CONTOUR_TOLERANCE, upm),
+    so renaming a file reuses its outline and editing it re-traces it.
+    save() keeps only the entries used by the current build.
+    """
+
+    def __init__(self, folder: str, upm: int):
+        self.path = os.path.join(folder, OUTLINE_CACHE_FILE)
+        self.params = f"{PNG_THRESHOLD}:{CONTOUR_TOLERANCE}:{upm}".encode("ascii")
+        self.entries = {}
+        self.used = {}
+        self.hits = 0
+        self.dirty = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == OUTLINE_CACHE_VERSION:
+                self.entries = data.get("outlines", {})
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}
+
+    def key(self, src_path: str):
+        h = hashlib.sha1(self.params)
+        try:
+            with open(src_path, "rb") as f:
+                h.update(f.read())
+        except OSError:
+            return None
+        return h.hexdigest()
+
+    def get(self, key):
+        entry = self.entries.get(key) if key else None
+        if entry is None:
+            return None
+        self.used[key] = entry
+        self.hits += 1
+        return {"outline": [(op, tuple(tuple(pt) for pt in args)) for op, args in entry["outline"]],
+                "bbox": tuple(entry["bbox"])}
+
+    def put(self, key, outline: list, bbox: Tuple[int,int,int,int]):
+        if key:
+            self.used[key] = {"outline": outline, "bbox": list(bbox)}
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty and self.used.keys() == self.entries.keys():
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": OUTLINE_CACHE_VERSION, "outlines": self.used}, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
 # ---------------- Metrics ----------------
 @dataclass
 class GlyphMetrics:
@@ -289,7 +381,8 @@ def build_gpos_pairpos(font: TTFont, kern_pairs: Dict[Tuple[str,str], int]):
 
 # ---------------- Main font build ----------------
 def build_font(images_dir: str, out_path: str, family: str, style: str, version: str,
-               upm: int, ascent: int, descent: int, cubic_tolerance: float):
+               upm: int, ascent: int, descent: int, cubic_tolerance: float, jobs: int = 1,
+               use_cache: bool = True):
 
     font = TTFont()
     for tag in ["head","hhea","maxp","OS/2","hmtx","cmap","glyf","loca","name","post"]:
@@ -369,24 +462,35 @@ def build_font(images_dir: str, out_path: str, family: str, style: str, version:
     glyph_metrics: Dict[str,GlyphMetrics] = {}
     ligature_map: Dict[Tuple[str,...], str] = {}
 
-    for filename in sorted(os.listdir(images_dir)):
-        ext = os.path.splitext(filename)[1].lower()
-        if ext not in (".svg",".png"): continue
+    filenames = [fn for fn in sorted(os.listdir(images_dir))
+                 if os.path.splitext(fn)[1].lower() in (".svg",".png")
+                 and not fn.lower().endswith(TRACE_SUFFIX)]
+    if jobs > 1:
+        print(f"[INFO] Tracing {len(filenames)} images with {jobs} processes")
+
+    cache = OutlineCache(images_dir, upm) if use_cache else None
+
+    # Outlines arrive in filename order, so tables are filled exactly as in a serial build
+    for filename, key, outline, cached_bbox in trace_outlines(images_dir, filenames, jobs, cache):
         print(f"Processing {filename}...")
         try:
+            if isinstance(outline, Exception):
+                raise outline
             stem = os.path.splitext(filename)[0]
             seq_chars = filename_to_sequence(stem)
             glyph_name = sequence_to_glyphname(seq_chars)
-            src_path = os.path.join(images_dir, filename)
-            svg_path = ensure_svg_from_file(src_path)
-            paths, _ = svg2paths(svg_path)
             pen = TTGlyphPen(None)
-            draw_path_to_pen(paths, pen)
+            replayRecording(outline, pen)
             glyph = pen.glyph()
-            try:
-                xmin,ymin,xmax,ymax = glyph.boundingBox()
-            except Exception:
-                xmin=ymin=0; xmax=ymax=DEFAULT_ADVANCE
+            if cached_bbox is not None:
+                xmin,ymin,xmax,ymax = cached_bbox
+            else:
+                try:
+                    xmin,ymin,xmax,ymax = glyph.boundingBox()
+                except Exception:
+                    xmin=ymin=0; xmax=ymax=DEFAULT_ADVANCE
+                if cache:
+                    cache.put(key, outline, (xmin,ymin,xmax,ymax))
             width = max(xmax-xmin, MIN_ADVANCE)
             advance = max(int(width*(1+ADVANCE_PADDING_RATIO)), MIN_ADVANCE)
 
@@ -409,6 +513,13 @@ def build_font(images_dir: str, out_path: str, family: str, style: str, version:
             print(f"[WARN] Skipping {filename}: {e}")
             continue
 
+    if cache:
+        print(f"[INFO] Reused {cache.hits} cached outlines, traced {len(filenames) - cache.hits}")
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"[WARN] Could not write outline cache: {e}")
+
     # Finalize glyph order once, unique, with .notdef first
     unique_order = []
     seen = set()
@@ -476,10 +587,13 @@ def parse_args():
     p.add_argument("--ascent", type=int, default=DEFAULT_ASCENT)
     p.add_argument("--descent", type=int, default=DEFAULT_DESCENT)
     p.add_argument("--tol", type=float, default=0.75)
+    p.add_argument("--jobs", "-j", type=int, default=1, help="Processes used to trace images (default 1)")
+    p.add_argument("--no-cache", action="store_true", help=f"Re-trace every image and ignore {OUTLINE_CACHE_FILE}")
     return p.parse_args()
 
 
 if __name__ == "__main__":
     args = parse_args()
     build_font(args.images, args.out, args.family, args.style, args.version,
-               args.upm, args.ascent, args.descent, args.tol)
+               args.upm, args.ascent, args.descent, args.tol, max(1, args.jobs),
+               not args.no_cache)
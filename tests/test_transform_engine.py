@@ -0,0 +1,76 @@
+# tests/test_transform_engine.py
+"""
+TransformEngine against the regex implementation it replaced: with a single
+rule the engine must rewrite any text exactly as the old re.sub loop did.
+
+    python -m unittest discover tests
+"""
+import random
+import re
+import unittest
+
+from utils.grammar import TransformEngine
+
+
+def old_apply_phrase_transforms(sentence, transforms):
+    """The pre-TransformEngine apply_phrase_transforms, kept verbatim as the reference."""
+    s = sentence
+    for pattern, replacement in transforms:
+        pattern = pattern.strip().strip('"').strip("'")
+        replacement = replacement.strip().strip('"').strip("'")
+        names = re.findall(r"\{(\w+)\}", pattern)
+        if not names:
+            s = s.replace(pattern, replacement)
+            continue
+        regex = re.escape(pattern)
+        for name in names:
+            regex = regex.replace(r"\{" + name + r"\}", fr"(?P<{name}>[\w']+)")
+        regex = regex.replace(r"\ ", r"\s+")
+        try:
+            s = re.sub(regex, lambda m: replacement.format(**{n: m.group(n) for n in names}), s)
+        except Exception:
+            try:
+                s = re.sub(regex, replacement, s)
+            except Exception:
+                pass
+    return s
+
+
+PATTERN_PARTS = ["a", "b", "ab", "'s", "the", ".", " ", "  ", "{x}", "{y}", "{x}"]
+REPLACEMENTS = ["z", "{x}", "{y} of {x}", "{x}-{y}", "{q}", "", "[{x}]"]
+TEXT_PARTS = ["a", "b", "ab", "the", "cat", "'s", "'", ".", " ", "  ", "   ", "\t", "\n", "é"]
+
+
+def random_pattern(rng):
+    parts = [rng.choice(PATTERN_PARTS) for _ in range(rng.randint(1, 5))]
+    return "".join(parts).strip() or "a"
+
+
+def random_text(rng):
+    return "".join(rng.choice(TEXT_PARTS) for _ in range(rng.randint(0, 14)))
+
+
+class SingleRuleEquivalence(unittest.TestCase):
+
+    def check(self, pattern, replacement, text):
+        expected = old_apply_phrase_transforms(text, [(pattern, replacement)])
+        got = TransformEngine([(pattern, replacement)]).apply(text)
+        self.assertEqual(got, expected, f"{pattern!r} => {replacement!r} on {text!r}")
+
+    def test_examples(self):
+        self.check("{owner}'s {object}", "the {object} of {owner}", "the cat's hat and dog's bone")
+        self.check("I am", "I+be", "I am here, I am")
+        self.check("the  {p}", "X", "the cat")
+        self.check("the  {p}", "X", "the  cat the\t\tdog the   cow")
+        self.check("{x} {x}", "X", "a a")
+
+    def test_random_rules(self):
+        rng = random.Random(12)
+        for _ in range(400):
+            pattern, replacement = random_pattern(rng), rng.choice(REPLACEMENTS)
+            for _ in range(10):
+                self.check(pattern, replacement, random_text(rng))
+
+
+if __name__ == "__main__":
+    unittest.main()
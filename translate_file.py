@@ -0,0 +1,53 @@
+# translate_file.py
+"""
+Headless batch translation, English -> conlang:
+
+    python translate_file.py --lang MyLang --in story.txt --out story_mylang.txt --tense past --jobs 4
+
+Run from the folder that holds Languages/ (the same place the app runs from).
+"""
+import argparse
+import os
+import sys
+
+from constants import LANG_ROOT
+from utils.batch_translate import translate_file
+from utils.translation_memory import get_translation_memory
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Translate an English text file into a conlang, line by line")
+    p.add_argument("--lang", "-l", required=True, help="Language folder name under Languages/")
+    p.add_argument("--in", "-i", dest="src", required=True, help="English input text file (UTF-8)")
+    p.add_argument("--out", "-o", dest="dst", required=True, help="Output text file")
+    p.add_argument("--tense", default="present", choices=["present", "past", "future"])
+    p.add_argument("--jobs", "-j", type=int, default=1, help="Worker processes (default 1)")
+    p.add_argument("--memory", action="store_true",
+                   help="Reuse and update the language's translation memory on disk")
+    p.add_argument("--top", type=int, default=20, help="How many frequent unknown words to list")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if not os.path.isdir(os.path.join(LANG_ROOT, args.lang)):
+        sys.exit(f"[ERROR] No language folder {os.path.join(LANG_ROOT, args.lang)}")
+
+    def progress(done, total):
+        pct = 100 * done // total if total else 100
+        print(f"\r[INFO] {pct:3d}%", end="", file=sys.stderr, flush=True)
+
+    # Repeated lines are translated once; --memory also keeps results across runs
+    memory = get_translation_memory(args.lang, persistent=args.memory)
+    try:
+        stats = translate_file(args.lang, args.src, args.dst, tense=args.tense,
+                               jobs=max(1, args.jobs), memory=memory, progress=progress)
+    finally:
+        memory.close_store()
+    print(file=sys.stderr)
+    print(f"[DONE] Saved {args.dst}")
+    print(stats.summary(top=args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# translate_server.py
+"""
+Local HTTP translation service for scripts and other tools:
+
+    python translate_server.py --lang MyLang --port 8765
+
+Endpoints (POST, JSON in and out; each takes a batch):
+    /translate          {"texts": ["I eat"], "tense": "past"}
+    /reverse-translate  {"texts": ["mi kala"]}
+    /romanize           {"texts": ["kala"]}          (IPA -> spelling rules)
+    /lookup             {"words": ["eat"], "side": "english" | "conlang"}
+GET /status reports the language and its current dictionary/grammar tag.
+Every request may name another language with "lang". Languages are read
+once and re-read only when their files change, so edits in the app are
+picked up without restarting. Run from the folder that holds Languages/.
+"""
+import argparse
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from constants import LANG_ROOT
+from utils.translation_service import TranslationService, ServiceError
+
+MAX_BODY = 16 * 1024 * 1024
+
+
+class TranslationHandler(BaseHTTPRequestHandler):
+    service = None          # set by serve()
+    quiet = False
+
+    def _send(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/status":
+            self._send(200, self.service.status())
+        else:
+            self._send(404, {"error": f"no such endpoint: {self.path}"})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_BODY:
+                raise ServiceError("request body too large", 413)
+            try:
+                payload = json.loads(self.rfile.read(length).decode("utf-8") or "{}")
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                raise ServiceError(f"invalid JSON: {e}")
+            self._send(200, self.service.handle(self.path.strip("/"), payload))
+        except ServiceError as e:
+            self._send(e.status, {"error": str(e)})
+        except Exception as e:
+            self._send(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def serve(lang, host="127.0.0.1", port=8765, memory=True, quiet=False):
+    service = TranslationService(lang, memory=memory)
+    translator = service.warm()
+    handler = type("Handler", (TranslationHandler,), {"service": service, "quiet": quiet})
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"[INFO] {lang}: {len(translator.lexicon)} entries loaded")
+    print(f"[INFO] Serving on http://{host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Serve translations of a conlang over local HTTP")
+    p.add_argument("--lang", "-l", required=True, help="Language folder name under Languages/")
+    p.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: localhost only)")
+    p.add_argument("--port", "-p", type=int, default=8765)
+    p.add_argument("--no-memory", action="store_true", help="Do not cache translated texts")
+    p.add_argument("--quiet", "-q", action="store_true", help="Do not log each request")
+    return p.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if not os.path.isdir(os.path.join(LANG_ROOT, args.lang)):
+        sys.exit(f"[ERROR] No language folder {os.path.join(LANG_ROOT, args.lang)}")
+    serve(args.lang, args.host, args.port, memory=not args.no_memory, quiet=args.quiet)
@@ -0,0 +1,133 @@
+# utils/autosave.py
+import csv
+import time
+import threading
+
+from utils.file_io import write_file_atomic
+
+AUTOSAVE_DELAY = 0.75      # seconds of quiet before a scheduled file is written
+AUTOSAVE_MAX_DELAY = 5.0   # a file that keeps changing is still written at least this often
+
+
+class AutosaveQueue:
+    """
+    Debounced write-behind queue for autosaves. schedule(path, write) keeps
+    only the newest pending write per path and runs it on a background
+    thread once the path has been quiet for `delay` seconds (or `max_delay`
+    after the first pending change), so a burst of cell edits costs one
+    disk write per file. Files are replaced atomically via a temp file.
+
+    Callers must snapshot their data on the Tk thread before scheduling;
+    the write callables run on the worker thread and must not touch Tk.
+    Call flush() before exit to write everything still pending, and
+    cancel(path) or flush(path) before writing path directly.
+    """
+
+    def __init__(self, delay=AUTOSAVE_DELAY, max_delay=AUTOSAVE_MAX_DELAY):
+        self.delay = delay
+        self.max_delay = max_delay
+        self._pending = {}               # path -> [due, deadline, write, newline, seq]
+        self._seq = 0                    # bumped by every schedule() and cancel()
+        self._written = {}               # path -> seq of the newest write or cancel (under _io_lock)
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()  # one write at a time; older seqs are skipped
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    # -------------------------
+    # Scheduling
+    # -------------------------
+
+    def schedule(self, path, write, newline=None):
+        """Queue write(f) for path, replacing any write still pending for it."""
+        now = time.monotonic()
+        with self._cond:
+            job = self._pending.get(path)
+            deadline = job[1] if job else now + self.max_delay
+            self._seq += 1
+            self._pending[path] = [min(now + self.delay, deadline), deadline, write, newline, self._seq]
+            self._cond.notify()
+
+    def schedule_text(self, path, text):
+        self.schedule(path, lambda f: f.write(text))
+
+    def schedule_csv(self, path, fieldnames, rows):
+        """Queue a CSV rewrite; rows are copied now, on the calling thread."""
+        snapshot = [{k: r.get(k, "") for k in fieldnames} for r in rows]
+
+        def write(f):
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(snapshot)
+        self.schedule(path, write, newline="")
+
+    def cancel(self, path):
+        """
+        Drop the pending write for path, wait for one already in progress and
+        make sure no older queued copy lands afterwards, so the caller can
+        then write path itself.
+        """
+        with self._cond:
+            self._pending.pop(path, None)
+            self._seq += 1
+            seq = self._seq
+        with self._io_lock:
+            self._written[path] = seq
+
+    # -------------------------
+    # Writing
+    # -------------------------
+
+    def flush(self, path=None):
+        """
+        Write pending saves now (all of them, or just path) on the calling
+        thread. flush(path) also waits out a write of path already in
+        progress, like cancel(), so path can be read or written directly.
+        """
+        with self._cond:
+            if path is None:
+                jobs = list(self._pending.items())
+                self._pending.clear()
+            else:
+                job = self._pending.pop(path, None)
+                jobs = [(path, job)] if job else []
+        for p, job in jobs:
+            self._write(p, job)
+        if path is not None:
+            self.cancel(path)
+
+    def stop(self):
+        """Flush everything and stop the worker thread."""
+        self.flush()
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join(timeout=5)
+
+    def _write(self, path, job):
+        _, _, write, newline, seq = job
+        with self._io_lock:
+            if seq <= self._written.get(path, 0):
+                return  # superseded by a newer write or a cancel() while it waited
+            self._written[path] = seq
+            try:
+                write_file_atomic(path, write, newline=newline)
+            except Exception as e:
+                print(f"Auto-save of {path} failed:", e)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped:
+                        return
+                    now = time.monotonic()
+                    due = [p for p, job in self._pending.items() if job[0] <= now]
+                    if due:
+                        jobs = [(p, self._pending.pop(p)) for p in due]
+                        break
+                    wait = min((job[0] for job in self._pending.values()), default=None)
+                    self._cond.wait(None if wait is None else wait - now)
+            for p, job in jobs:
+                self._write(p, job)
@@ -0,0 +1,147 @@
+# utils/background.py
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+POLL_MS = 50
+THREAD_WORKERS = 4
+
+
+class JobCancelled(Exception):
+    """Raised inside a thread job by job.check() once it has been cancelled."""
+
+
+class Job:
+    """
+    Handle for one submitted job. Thread jobs receive it as their first
+    argument and may call job.progress(value) or job.check() (raises
+    JobCancelled after cancel()). Process jobs only get their own arguments;
+    cancelling one drops its result, and stops it if it has not started.
+    """
+
+    def __init__(self, executor, on_done, on_error, on_progress):
+        self._executor = executor
+        self._cancel = threading.Event()
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.future = None
+        self.finished = False
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def check(self):
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def progress(self, value):
+        """Hand value to on_progress on the Tk thread (no-op once cancelled)."""
+        if self.on_progress and not self._cancel.is_set():
+            self._executor._post(self, "progress", value)
+
+
+class BackgroundExecutor:
+    """
+    Shared thread/process pools for long-running tab work. Job results,
+    errors and progress values are queued by the workers and delivered to
+    the callbacks on the Tk thread by polling with root.after(), so
+    callbacks may touch widgets freely while the work itself never does.
+    """
+
+    def __init__(self, root, thread_workers=THREAD_WORKERS, process_workers=None, poll_ms=POLL_MS):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._threads = ThreadPoolExecutor(max_workers=thread_workers, thread_name_prefix="worker")
+        self._process_workers = process_workers or os.cpu_count() or 1
+        self._processes = None          # created on first process job
+        self._events = queue.Queue()
+        self._active = set()
+        self._polling = False
+
+    def submit(self, fn, *args, on_done=None, on_error=None, on_progress=None, **kwargs):
+        """Run fn(job, *args, **kwargs) on a worker thread; returns the Job."""
+        job = Job(self, on_done, on_error, on_progress)
+
+        def run():
+            job.check()
+            return fn(job, *args, **kwargs)
+        job.future = self._threads.submit(run)
+        return self._track(job)
+
+    def submit_process(self, fn, *args, on_done=None, on_error=None, **kwargs):
+        """Run picklable fn(*args, **kwargs) in the process pool; returns the Job."""
+        if self._processes is None:
+            # spawn, not fork: the Tk process has threads, locks and open sqlite
+            # connections that a forked child must not inherit
+            self._processes = ProcessPoolExecutor(max_workers=self._process_workers,
+                                                  mp_context=multiprocessing.get_context("spawn"))
+        job = Job(self, on_done, on_error, None)
+        job.future = self._processes.submit(fn, *args, **kwargs)
+        return self._track(job)
+
+    def shutdown(self):
+        """Cancel everything outstanding and stop the pools (without waiting)."""
+        for job in list(self._active):
+            job.cancel()
+        self._threads.shutdown(wait=False, cancel_futures=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+
+    # -------------------------
+    # Delivery to the Tk thread
+    # -------------------------
+
+    def _track(self, job):
+        self._active.add(job)
+        job.future.add_done_callback(lambda f: self._post(job, "done", f))
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+        return job
+
+    def _post(self, job, kind, value):
+        self._events.put((job, kind, value))
+
+    def _poll(self):
+        while True:
+            try:
+                job, kind, value = self._events.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                if kind == "progress":
+                    if not job.cancelled and not job.finished:
+                        job.on_progress(value)
+                else:
+                    self._finish(job, value)
+            except Exception as e:
+                print("Background callback failed:", e)
+        if self._active or not self._events.empty():
+            self.root.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
+
+    def _finish(self, job, future):
+        self._active.discard(job)
+        job.finished = True
+        if job.cancelled or future.cancelled():
+            return
+        err = future.exception()
+        if err is None:
+            if job.on_done:
+                job.on_done(future.result())
+        elif isinstance(err, JobCancelled):
+            return
+        elif job.on_error:
+            job.on_error(err)
+        else:
+            print("Background job failed:", err)
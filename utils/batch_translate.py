@@ -0,0 +1,156 @@
+# utils/batch_translate.py
+import multiprocessing
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.file_io import write_file_atomic, read_line_chunks
+from utils.translator import Translator, TO_CONLANG
+from utils.translation_memory import TranslationMemory
+
+CHUNK_LINES = 500   # lines handed to a worker at a time
+
+
+class BatchStats:
+    """Running totals for a batch translation."""
+
+    def __init__(self):
+        self.lines = 0
+        self.units = 0          # dictionary units translated (a phrase counts once)
+        self.unknown = Counter()
+        self.remembered = 0     # lines served from the translation memory
+
+    @property
+    def unknown_total(self):
+        return sum(self.unknown.values())
+
+    def add(self, units, unknown):
+        self.lines += 1
+        self.units += units
+        self.unknown.update(unknown)
+
+    def summary(self, top=10):
+        pct = 100.0 * self.unknown_total / self.units if self.units else 0.0
+        lines = [f"Lines: {self.lines}",
+                 f"Words/phrases: {self.units}",
+                 f"Unknown: {self.unknown_total} ({pct:.1f}%), {len(self.unknown)} distinct"]
+        if self.remembered:
+            lines.append(f"From translation memory: {self.remembered} lines")
+        if self.unknown:
+            common = ", ".join(f"{w} ({n})" for w, n in self.unknown.most_common(top))
+            lines.append(f"Most frequent unknown: {common}")
+        return "\n".join(lines)
+
+
+# One Translator per worker process, built by the pool initializer
+_worker_translator = None
+
+
+def _init_worker(lang, tense):
+    global _worker_translator
+    _worker_translator = Translator.for_language(lang, tense)
+
+
+def _worker_chunk(lines):
+    return [_worker_translator.translate_line(line) for line in lines]
+
+
+# Worker-local translation memories (lang -> TranslationMemory); workers never
+# touch the app's per-language registry or its on-disk stores
+_worker_memories = {}
+
+
+def translate_lines(lang, tense, lines):
+    """
+    Process-pool job: translate_line() results for lines. The lexicon and
+    grammar caches and a worker-local translation memory live on in the
+    worker, so later jobs for the same language start warm.
+    """
+    memory = _worker_memories.get(lang)
+    if memory is None:
+        memory = _worker_memories[lang] = TranslationMemory()
+    translator = Translator.for_language(lang, tense, memory)
+    return [translator.translate_line(line) for line in lines]
+
+
+def translate_file(lang, src, dst, tense="present", jobs=1, chunk_lines=CHUNK_LINES,
+                   memory=None, progress=None, check=None):
+    """
+    Translate the text file src line by line into dst using the language's
+    dictionary and grammar on disk. Input is read and output written one
+    chunk at a time; with jobs > 1 chunks are translated in a process pool,
+    at most 2 * jobs in flight, and written back in order. progress(done,
+    total) is called with byte counts after each chunk; check() is called
+    between chunks and may raise to abort (dst is then left untouched).
+    With a TranslationMemory, lines translated before under the same
+    grammar and dictionary are taken from it (the parent looks them up, so
+    workers only see new lines). Returns a BatchStats.
+    """
+    total = os.path.getsize(src)
+    stats = BatchStats()
+    done = 0
+    translator = Translator.for_language(lang, tense, memory)
+
+    def emit(f, results, size):
+        nonlocal done
+        for out, units, unknown in results:
+            f.write(out + "\n")
+            stats.add(units, unknown)
+        done += size
+        if progress:
+            progress(done, total)
+        if check:
+            check()
+
+    def write_serial(f):
+        for lines, size in read_line_chunks(src, chunk_lines):
+            before = memory.hits if memory is not None else 0
+            emit(f, [translator.translate_line(line) for line in lines], size)
+            if memory is not None:
+                stats.remembered += memory.hits - before
+
+    def lookup(lines):
+        """Results known so far (None where not) and the distinct lines still to translate."""
+        if memory is None:
+            return [None] * len(lines), list(dict.fromkeys(lines))
+        tag = translator.tag
+        known = [memory.get(line, TO_CONLANG, tense, tag) for line in lines]
+        stats.remembered += sum(r is not None for r in known)
+        return known, list(dict.fromkeys(l for l, r in zip(lines, known) if r is None))
+
+    def collect(lines, known, todo, fut):
+        fresh = dict(zip(todo, fut.result())) if fut is not None else {}
+        if memory is not None:
+            tag = translator.tag
+            for line, result in fresh.items():
+                memory.put(line, TO_CONLANG, tense, tag, result)
+        return [r if r is not None else fresh[l] for l, r in zip(lines, known)]
+
+    def write_parallel(f):
+        # spawn: translate_file also runs on the Translation tab's worker thread
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(lang, tense),
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            pending = deque()
+            try:
+                for lines, size in read_line_chunks(src, chunk_lines):
+                    known, todo = lookup(lines)
+                    fut = pool.submit(_worker_chunk, todo) if todo else None
+                    pending.append((lines, known, todo, fut, size))
+                    if len(pending) >= 2 * jobs:
+                        item = pending.popleft()
+                        emit(f, collect(*item[:4]), item[4])
+                while pending:
+                    item = pending.popleft()
+                    emit(f, collect(*item[:4]), item[4])
+            except BaseException:
+                for item in pending:
+                    if item[3] is not None:
+                        item[3].cancel()
+                raise
+
+    try:
+        write_file_atomic(dst, write_parallel if jobs > 1 else write_serial)
+    finally:
+        if memory is not None:
+            memory.flush()
+    return stats
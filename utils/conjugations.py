@@ -0,0 +1,59 @@
+# utils/conjugations.py
+import hashlib
+
+TENSES = ("present", "past", "future")
+
+
+def _norm(s):
+    return (s or "").strip().lower()
+
+
+class ConjugationIndex:
+    """
+    conjugations.csv rows hashed by lowercase English form and by conlang
+    base, so a lookup is one dict probe instead of a scan over every row.
+    When several rows share a key the first one wins, as the old linear
+    scans did. `digest` hashes the rows (translation memory key).
+    """
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.by_english = {}
+        self.by_base = {}
+        for row in self.rows:
+            eng = _norm(row.get("english"))
+            base = _norm(row.get("base"))
+            if eng:
+                self.by_english.setdefault(eng, row)
+            if base:
+                self.by_base.setdefault(base, row)
+        self.digest = hashlib.sha1(
+            repr([tuple(r.get(f, "") for f in ("english",) + TENSES + ("base",))
+                  for r in self.rows]).encode("utf-8")).hexdigest()
+
+    def __len__(self):
+        return len(self.rows)
+
+    def find(self, english=None, base=None):
+        """Row for an English form, else for a conlang base; None if neither is known."""
+        row = self.by_english.get(_norm(english)) if english else None
+        if row is None and base:
+            row = self.by_base.get(_norm(base))
+        return row
+
+    def form(self, row, tense):
+        return (row.get(tense, "") or "") if row else ""
+
+    def conjugate(self, con_word, english_token, tense):
+        """
+        Apply conjugation using the selected tense. Prefers the row for the
+        English token, then the row whose base is con_word; returns con_word
+        unchanged when there is no row or the tense cell is empty.
+        """
+        return self.form(self.find(english_token, con_word), tense) or con_word
+
+
+def set_conjugations(app, rows):
+    """Replace app.conjugations and rebuild app.conj_index from them."""
+    app.conjugations = list(rows)
+    app.conj_index = ConjugationIndex(app.conjugations)
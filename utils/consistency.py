@@ -0,0 +1,76 @@
+# utils/consistency.py
+import os
+
+from constants import LANG_ROOT, PHONO_FILE, PHONO_FIELDS, SPELLING_FILE, SPELLING_FIELDS
+from utils.file_io import load_csv, file_stamp
+from utils.spelling import SpellingTransducer
+from utils.ipa_segmenter import IpaSegmenter
+
+
+class ConsistencyEngine:
+    """
+    Phoneme inventory and spelling rules of one language, held in memory.
+    Built once per language and rebuilt only when phonology.csv or
+    spelling_rules.csv change on disk (or when invalidated explicitly).
+    """
+
+    def __init__(self, langdir):
+        self.langdir = langdir
+        self.phono_path = os.path.join(langdir, PHONO_FILE)
+        self.rules_path = os.path.join(langdir, SPELLING_FILE)
+        self.reload()
+
+    def _stamp(self):
+        return (file_stamp(self.phono_path), file_stamp(self.rules_path))
+
+    def reload(self):
+        self.stamp = self._stamp()
+        rows = load_csv(self.phono_path, PHONO_FIELDS)
+        self.phonemes = {r["ipa"] for r in rows if r.get("ipa")}
+        self.segmenter = IpaSegmenter(self.phonemes)
+        self.has_rules = self.stamp[1] is not None
+        rows = load_csv(self.rules_path, SPELLING_FIELDS)
+        self.rules = [(r["ipa"], r["romanization"]) for r in rows if r.get("ipa")]
+        self.transducer = SpellingTransducer(self.rules)
+
+    def is_stale(self):
+        return self._stamp() != self.stamp
+
+    def check_phonology(self, ipa_string):
+        """Return True if all IPA symbols in the pronunciation are in the phoneme inventory."""
+        return all(self.segmenter.is_known(seg) for seg in self.segmenter.segment(ipa_string))
+
+    def check_spelling(self, conlang_word, ipa_string):
+        """Return True if applying spelling rules to IPA yields the conlang word."""
+        if not self.has_rules:
+            return True  # no rules defined, assume consistent
+        return self.transducer.romanize(ipa_string) == conlang_word
+
+    def romanize_many(self, ipa_strings):
+        return self.transducer.romanize_many(ipa_strings)
+
+    def check_row(self, conlang_word, ipa_string):
+        """Return the (phon, spell) PASS/FAIL pair shown in the dictionary table."""
+        phon = "PASS" if self.check_phonology(ipa_string) else "FAIL"
+        spell = "PASS" if self.check_spelling(conlang_word, ipa_string) else "FAIL"
+        return phon, spell
+
+
+_engines = {}
+
+
+def get_consistency_engine(lang):
+    """Return the cached engine for a language, rebuilding it if its files changed."""
+    engine = _engines.get(lang)
+    if engine is None or engine.is_stale():
+        engine = ConsistencyEngine(os.path.join(LANG_ROOT, lang))
+        _engines[lang] = engine
+    return engine
+
+
+def invalidate_consistency_engine(lang=None):
+    """Drop the cached engine for a language (or all languages)."""
+    if lang is None:
+        _engines.clear()
+    else:
+        _engines.pop(lang, None)
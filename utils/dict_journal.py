@@ -0,0 +1,111 @@
+# utils/dict_journal.py
+import os
+import json
+
+from constants import DICT_FILE, DICT_FIELDS, DICT_JOURNAL_FILE
+from utils.file_io import load_csv, save_csv
+from utils.dict_store import STORE_FIELDS
+
+COMPACT_AFTER = 500  # journal entries before the CSV is rewritten
+
+
+def _eng_key(english):
+    return (english or "").strip().lower()
+
+
+class DictionaryJournal:
+    """
+    Append-only change log next to dictionary.csv (dictionary.journal).
+    Each edit appends one JSON line instead of rewriting the CSV; the log
+    is replayed on load and compacted back into the CSV periodically or
+    on exit. Entries are addressed by English headword, the same key
+    app.dictionary uses, and replaying twice is harmless.
+    """
+
+    def __init__(self, langdir):
+        self.csv_path = os.path.join(langdir, DICT_FILE)
+        self.path = os.path.join(langdir, DICT_JOURNAL_FILE)
+        self._fh = None
+        self.pending = 0
+
+    def load_rows(self):
+        """Return dictionary.csv rows with the journal replayed on top."""
+        rows = load_csv(self.csv_path, STORE_FIELDS)
+        pos = {}
+        for i, r in enumerate(rows):
+            pos[_eng_key(r.get("english"))] = i  # last duplicate wins, as in app.dictionary
+
+        self.pending = 0
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        op = json.loads(line)
+                    except ValueError:
+                        continue  # torn final line after a crash
+                    self.pending += 1
+                    self._replay(op, rows, pos)
+        return [r for r in rows if r is not None]
+
+    def _replay(self, op, rows, pos):
+        old = op.get("english")
+        if op.get("op") == "del":
+            i = pos.pop(_eng_key(old), None)
+            if i is not None:
+                rows[i] = None
+            return
+        row = {k: op["row"].get(k, "") for k in STORE_FIELDS}
+        new = _eng_key(row.get("english"))
+        i = pos.pop(_eng_key(old), None) if old is not None else None
+        if i is None:
+            i = pos.get(new)
+        elif new in pos and pos[new] != i:
+            rows[pos[new]] = None  # renamed onto an existing headword
+        if i is None:
+            i = len(rows)
+            rows.append(row)
+        else:
+            rows[i] = row
+        pos[new] = i
+
+    # -------------------------
+    # Writing
+    # -------------------------
+
+    def _append(self, op):
+        if self._fh is None:
+            self._fh = open(self.path, "a", encoding="utf-8")
+        self._fh.write(json.dumps(op, ensure_ascii=False) + "\n")
+        self.pending += 1
+
+    def put(self, english, row):
+        """Record a row replacing the entry headed by english (None for a new row)."""
+        self._append({"op": "put", "english": english,
+                      "row": {k: row.get(k, "") for k in STORE_FIELDS}})
+
+    def delete(self, english):
+        self._append({"op": "del", "english": english})
+
+    def flush(self):
+        if self._fh is not None:
+            self._fh.flush()
+
+    def needs_compaction(self):
+        return self.pending >= COMPACT_AFTER
+
+    def compact(self, rows):
+        """Write rows (the full, current lexicon) to the CSV and empty the journal."""
+        save_csv(self.csv_path, DICT_FIELDS, rows)
+        self.reset()
+
+    def reset(self):
+        """Forget the journal after the CSV has been rewritten."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.pending = 0
+
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
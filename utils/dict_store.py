@@ -0,0 +1,144 @@
+# utils/dict_store.py
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from constants import DICT_FIELDS, DICT_FILE, DICT_DB_FILE
+from utils.file_io import load_csv, save_csv
+
+# Columns stored per entry; loanword travels with the row even though the
+# CSV format (DICT_FIELDS) does not carry it.
+STORE_FIELDS = DICT_FIELDS + ["loanword"]
+INDEXED_FIELDS = ("english", "conlang", "pos", "pronunciation")
+
+
+class SqliteDictionaryStore:
+    """
+    Optional per-language dictionary backend (Languages/<lang>/dictionary.db).
+    Rows are addressed by an integer id so a single cell edit costs one
+    UPDATE instead of a full-file rewrite. Round-trips to dictionary.csv
+    via import_csv()/export_csv().
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self._batch_depth = 0
+        cols = ", ".join(f"{c} TEXT NOT NULL DEFAULT ''" for c in STORE_FIELDS)
+        with self.conn:
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS entries (id INTEGER PRIMARY KEY, {cols})")
+            for c in INDEXED_FIELDS:
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_entries_{c} ON entries ({c})")
+
+    def close(self):
+        self.conn.close()
+
+    # -------------------------
+    # Transactions
+    # -------------------------
+
+    @contextmanager
+    def batch(self):
+        """Group writes into one transaction (nested batches join the outer one)."""
+        self._batch_depth += 1
+        try:
+            yield self
+        except Exception:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.rollback()
+            raise
+        else:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.commit()
+
+    def _commit(self):
+        if self._batch_depth == 0:
+            self.conn.commit()
+
+    # -------------------------
+    # Row access
+    # -------------------------
+
+    def all_rows(self):
+        """Return [(id, row_dict)] in insertion order."""
+        cur = self.conn.execute(f"SELECT id, {', '.join(STORE_FIELDS)} FROM entries ORDER BY id")
+        return [(r["id"], {c: r[c] for c in STORE_FIELDS}) for r in cur]
+
+    def get(self, row_id):
+        r = self.conn.execute(f"SELECT {', '.join(STORE_FIELDS)} FROM entries WHERE id = ?",
+                              (row_id,)).fetchone()
+        return {c: r[c] for c in STORE_FIELDS} if r else None
+
+    def find(self, field, value):
+        """Return [(id, row_dict)] whose indexed field equals value."""
+        if field not in INDEXED_FIELDS:
+            raise ValueError(f"Not an indexed field: {field}")
+        cur = self.conn.execute(f"SELECT id, {', '.join(STORE_FIELDS)} FROM entries WHERE {field} = ?",
+                                (value,))
+        return [(r["id"], {c: r[c] for c in STORE_FIELDS}) for r in cur]
+
+    def insert(self, row, row_id=None):
+        vals = [row.get(c, "") or "" for c in STORE_FIELDS]
+        cur = self.conn.execute(
+            f"INSERT INTO entries (id, {', '.join(STORE_FIELDS)}) "
+            f"VALUES (?, {', '.join('?' for _ in STORE_FIELDS)})",
+            [row_id] + vals)
+        self._commit()
+        return cur.lastrowid
+
+    def update(self, row_id, row):
+        """Update the given fields of one row."""
+        fields = [c for c in STORE_FIELDS if c in row]
+        if not fields:
+            return
+        sets = ", ".join(f"{c} = ?" for c in fields)
+        self.conn.execute(f"UPDATE entries SET {sets} WHERE id = ?",
+                          [row[c] or "" for c in fields] + [row_id])
+        self._commit()
+
+    def delete(self, row_id):
+        self.conn.execute("DELETE FROM entries WHERE id = ?", (row_id,))
+        self._commit()
+
+    def replace_all(self, rows):
+        """Replace every entry with rows (list of dicts) in one transaction."""
+        with self.batch():
+            self.conn.execute("DELETE FROM entries")
+            self.conn.executemany(
+                f"INSERT INTO entries ({', '.join(STORE_FIELDS)}) "
+                f"VALUES ({', '.join('?' for _ in STORE_FIELDS)})",
+                ([r.get(c, "") or "" for c in STORE_FIELDS] for r in rows))
+
+    # -------------------------
+    # CSV round-trip
+    # -------------------------
+
+    def import_csv(self, csv_path):
+        """Replace the store with the contents of a DICT_FIELDS CSV."""
+        self.replace_all(load_csv(csv_path, STORE_FIELDS))
+
+    def export_csv(self, csv_path):
+        """Write the store out in the DICT_FIELDS CSV format."""
+        save_csv(csv_path, DICT_FIELDS, [row for _, row in self.all_rows()])
+
+
+def open_dictionary_store(langdir, create=False):
+    """Return the language's SQLite store, or None if it does not use one (unless create)."""
+    path = os.path.join(langdir, DICT_DB_FILE)
+    if not create and not os.path.exists(path):
+        return None
+    return SqliteDictionaryStore(path)
+
+
+def load_dictionary_rows(langdir):
+    """Dictionary rows of a language from whichever backend it uses."""
+    store = open_dictionary_store(langdir)
+    if store is None:
+        return load_csv(os.path.join(langdir, DICT_FILE), STORE_FIELDS)
+    try:
+        return [row for _, row in store.all_rows()]
+    finally:
+        store.close()
@@ -2,6 +2,7 @@
 import os
 import csv
 import sys
+import tempfile
 from constants import LANG_ROOT
 
 def load_csv(path, fieldnames):
@@ -14,14 +15,56 @@ def load_csv(path, fieldnames):
     return rows
 
 def save_csv(path, fieldnames, rows):
-    d = os.path.dirname(path)
-    if d and not os.path.exists(d):
-        os.makedirs(d, exist_ok=True)
-    with open(path, "w", newline="", encoding="utf-8") as f:
+    def write(f):
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for r in rows:
             writer.writerow({k: r.get(k, "") for k in fieldnames})
+    write_file_atomic(path, write, newline="")
+
+def write_file_atomic(path, write, newline=None, binary=False):
+    """Call write(f) on a temp file next to path, then os.replace() it over path."""
+    d = os.path.dirname(path)
+    if d and not os.path.exists(d):
+        os.makedirs(d, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=d or ".", prefix=".", suffix=".tmp")
+    try:
+        if binary:
+            f = os.fdopen(fd, "wb")
+        else:
+            f = os.fdopen(fd, "w", newline=newline, encoding="utf-8")
+        with f:
+            write(f)
+        if os.path.exists(path):
+            os.chmod(tmp, os.stat(path).st_mode & 0o7777)  # mkstemp files are 0600
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+def file_stamp(path):
+    """(mtime, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def read_line_chunks(path, chunk_lines):
+    """Yield (lines, bytes_read) from a UTF-8 text file without holding more than one chunk in memory."""
+    with open(path, "rb") as f:
+        chunk, size = [], 0
+        for raw in f:
+            chunk.append(raw.decode("utf-8", errors="replace").rstrip("\r\n"))
+            size += len(raw)
+            if len(chunk) >= chunk_lines:
+                yield chunk, size
+                chunk, size = [], 0
+        if chunk:
+            yield chunk, size
 
 def ensure_language_dir(lang):
     if not lang:
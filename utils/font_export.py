@@ -27,12 +27,20 @@ def export_font_ttf(app):
         "--out", out_path,
         "--family", f"{lang} {fontname}",
         "--style", "Regular",
-        "--version", "1.000"
+        "--version", "1.000",
+        "--jobs", str(os.cpu_count() or 1)
     ]
 
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    def done(result):
         messagebox.showinfo("Exported", f"Font exported to {out_path}\n\n{result.stdout}")
-    except subprocess.CalledProcessError as e:
-        msg = f"Font export failed:\n\nSTDOUT:\n{e.stdout}\n\nSTDERR:\n{e.stderr}"
+
+    def failed(e):
+        if isinstance(e, subprocess.CalledProcessError):
+            msg = f"Font export failed:\n\nSTDOUT:\n{e.stdout}\n\nSTDERR:\n{e.stderr}"
+        else:
+            msg = f"Font export failed:\n\n{e}"
         messagebox.showerror("Error", msg)
+
+    # make_font_gpos runs as a subprocess; wait for it on a worker thread
+    app.executor.submit(lambda job: subprocess.run(cmd, check=True, capture_output=True, text=True),
+                        on_done=done, on_error=failed)
@@ -0,0 +1,122 @@
+# utils/fuzzy.py
+from itertools import combinations
+
+MAX_DISTANCE = 2
+
+
+def edit_distance(a, b, limit=None):
+    """
+    Optimal-string-alignment distance (Levenshtein plus adjacent swaps).
+    Returns limit + 1 as soon as the distance is known to exceed limit.
+    """
+    if a == b:
+        return 0
+    if limit is not None and abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            cost = 0 if ca == cb else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if prev2 is not None and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if limit is not None and min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+def _deletes(term, max_distance):
+    """term and every string reachable from it by deleting up to max_distance characters."""
+    out = {term}
+    n = len(term)
+    for d in range(1, min(max_distance, n) + 1):
+        for idx in combinations(range(n), d):
+            drop = set(idx)
+            out.add("".join(c for i, c in enumerate(term) if i not in drop))
+    return out
+
+
+class FuzzyIndex:
+    """
+    SymSpell-style deletion-neighbourhood index for bounded edit-distance
+    lookup. Every term is stored under each of its deletion variants (up to
+    max_distance deletions); a query generates its own variants and only
+    verifies the terms that share one, instead of scanning the lexicon.
+    Terms carry payloads (e.g. the English headwords they translate to);
+    add() and remove() keep the index current one term at a time.
+    """
+
+    def __init__(self, max_distance=MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.terms = {}       # term -> set of payloads
+        self.variants = {}    # deletion variant -> set of terms
+
+    def __len__(self):
+        return len(self.terms)
+
+    def add(self, term, payload):
+        term = (term or "").strip().casefold()
+        if not term:
+            return
+        if term not in self.terms:
+            self.terms[term] = set()
+            for v in _deletes(term, self.max_distance):
+                self.variants.setdefault(v, set()).add(term)
+        self.terms[term].add(payload)
+
+    def remove(self, term, payload):
+        """Drop one payload of term; the term itself goes once it has none left."""
+        term = (term or "").strip().casefold()
+        payloads = self.terms.get(term)
+        if payloads is None:
+            return
+        payloads.discard(payload)
+        if payloads:
+            return
+        del self.terms[term]
+        for v in _deletes(term, self.max_distance):
+            holders = self.variants.get(v)
+            if holders is not None:
+                holders.discard(term)
+                if not holders:
+                    del self.variants[v]
+
+    def lookup(self, word, max_distance=None, limit=5):
+        """
+        Return up to limit (distance, term, payloads) tuples within
+        max_distance of word, closest first.
+        """
+        d = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        word = (word or "").strip().casefold()
+        if not word:
+            return []
+        if word in self.terms:
+            exact = [(0, word, self.terms[word])]
+            if d == 0 or limit == 1:
+                return exact
+        candidates = set()
+        for v in _deletes(word, d):
+            candidates |= self.variants.get(v, set())
+        found = []
+        for term in candidates:
+            dist = edit_distance(word, term, d)
+            if dist <= d:
+                found.append((dist, term, self.terms[term]))
+        found.sort(key=lambda t: (t[0], t[1]))
+        return found[:limit]
+
+    def best(self, word, max_distance=None):
+        """Closest (distance, term, payloads) or None."""
+        hits = self.lookup(word, max_distance, limit=1)
+        return hits[0] if hits else None
+
+
+def distance_for(word):
+    """Edit distance worth tolerating for a word of this length."""
+    n = len(word)
+    if n <= 2:
+        return 0
+    return 1 if n <= 5 else 2
@@ -0,0 +1,118 @@
+# utils/glyph_atlas.py
+import os
+
+from PIL import Image
+
+from constants import LANG_ROOT, FONTS_DIRNAME
+from utils.file_io import load_csv, file_stamp
+from utils.trie import LongestMatchTrie
+
+GLYPH_HEIGHT = 50      # rendered glyph height in pixels
+MAPPING_FILE = "mapping.csv"
+
+
+class GlyphAtlas:
+    """
+    One font's mapping.csv as a symbol trie plus its glyph images, each
+    decoded and scaled to `height` once. Call validate() before a render:
+    the mapping is re-read when mapping.csv changes, and a glyph is
+    re-decoded when its image file changes (each file is checked at most
+    once per validate()). Scaled images are plain PIL images, so the atlas
+    works without Tk; photo() adds a cached Tk PhotoImage on top.
+    """
+
+    def __init__(self, fontdir, height=GLYPH_HEIGHT):
+        self.fontdir = fontdir
+        self.height = height
+        self.stamp = None
+        self.trie = LongestMatchTrie()
+        self._glyphs = {}      # filename -> (file stamp, scaled image or None)
+        self._photos = {}      # filename -> PhotoImage of the current scaled image
+        self._checked = set()  # filenames stat'ed since the last validate()
+        self.validate()
+
+    def validate(self):
+        """Pick up changes to mapping.csv and (lazily) to the glyph images."""
+        self._checked.clear()
+        stamp = file_stamp(os.path.join(self.fontdir, MAPPING_FILE))
+        if stamp == self.stamp:
+            return
+        self.stamp = stamp
+        rows = load_csv(os.path.join(self.fontdir, MAPPING_FILE), ["symbol", "filename"])
+        # later rows win for a repeated symbol, as a symbol -> filename dict would
+        self.trie = LongestMatchTrie()
+        for r in rows:
+            if r.get("symbol"):
+                self.trie.insert(r["symbol"], r.get("filename") or "", overwrite=True)
+
+    def segments(self, text):
+        """Yield (symbol, filename or None) for text, longest mapped symbol first."""
+        for start, end, fn in self.trie.scan(text):
+            yield text[start:end], fn
+
+    def glyph(self, filename):
+        """The glyph image scaled to self.height, or None if it is missing or unreadable."""
+        cached = self._glyphs.get(filename)
+        if cached is not None and filename in self._checked:
+            return cached[1]
+        path = os.path.join(self.fontdir, filename)
+        stamp = file_stamp(path)
+        self._checked.add(filename)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        image = None
+        if stamp is not None:
+            try:
+                with Image.open(path) as im:
+                    w, h = im.size
+                    scale = self.height / h if h else 1.0
+                    image = im.resize((int(w * scale), self.height), Image.Resampling.LANCZOS)
+            except Exception:
+                image = None
+        self._glyphs[filename] = (stamp, image)
+        self._photos.pop(filename, None)
+        return image
+
+    def photo(self, filename):
+        """Tk PhotoImage of glyph(filename), or None; kept alive by the atlas."""
+        image = self.glyph(filename)
+        if image is None:
+            return None
+        photo = self._photos.get(filename)
+        if photo is None:
+            from PIL import ImageTk
+            photo = self._photos[filename] = ImageTk.PhotoImage(image)
+        return photo
+
+
+# -------------------------
+# Per-font cache
+# -------------------------
+
+_atlases = {}   # (fontdir, height) -> GlyphAtlas
+_first_fonts = {}   # fonts folder -> (folder stamp, first font folder or None)
+
+
+def get_glyph_atlas(fontdir, height=GLYPH_HEIGHT):
+    """The cached atlas of a font folder, validated against the files on disk."""
+    atlas = _atlases.get((fontdir, height))
+    if atlas is None:
+        atlas = _atlases[(fontdir, height)] = GlyphAtlas(fontdir, height)
+    else:
+        atlas.validate()
+    return atlas
+
+
+def first_font_dir(lang):
+    """Folder of the language's first font (the one glyph previews use), or None."""
+    fontpath = os.path.join(LANG_ROOT, lang, FONTS_DIRNAME)
+    stamp = file_stamp(fontpath)
+    cached = _first_fonts.get(fontpath)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    fonts = []
+    if stamp is not None:
+        fonts = [d for d in os.listdir(fontpath) if os.path.isdir(os.path.join(fontpath, d))]
+    first = os.path.join(fontpath, fonts[0]) if fonts else None
+    _first_fonts[fontpath] = (stamp, first)
+    return first
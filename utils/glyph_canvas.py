@@ -0,0 +1,93 @@
+# utils/glyph_canvas.py
+from bisect import bisect_right
+
+from utils.glyph_layout import MARGIN, TEXT_FONT_SIZE
+
+
+class GlyphView:
+    """
+    Shows a vertical stack of GlyphLayouts on a Tk canvas, creating canvas
+    items only for the rows inside the visible area; scrolling adds the rows
+    coming into view and deletes the ones leaving it. A new canvas width
+    reflows every layout. Pass yscrollcommand=scrollbar.set on the canvas
+    and command=view.yview on the scrollbar.
+    """
+
+    def __init__(self, canvas, top=MARGIN):
+        self.canvas = canvas
+        self.top = top
+        self.blocks = []
+        self.offsets = []            # y of each block's first row
+        self.height = 0
+        self._shown = set()          # (block, row) pairs with items on the canvas
+        self._width = None
+        canvas.bind("<Configure>", self._on_configure, add="+")
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            canvas.bind(seq, self._on_wheel, add="+")
+
+    def width(self):
+        return int(self.canvas.winfo_width() or 1000)
+
+    def set_blocks(self, blocks):
+        """Show these layouts from the top down (an empty list clears the canvas)."""
+        self.blocks = list(blocks)
+        self.offsets = []
+        y = self.top
+        for layout in self.blocks:
+            self.offsets.append(y)
+            y += layout.height
+        self.height = y
+        self._width = self.width()
+        self.canvas.delete("all")
+        self._shown.clear()
+        self.canvas.configure(scrollregion=(0, 0, self._width, y + self.top))
+        self.update()
+
+    def update(self):
+        """Materialize the rows in view and drop the rest."""
+        canvas = self.canvas
+        top = canvas.canvasy(0)
+        bottom = top + canvas.winfo_height()
+        wanted = set()
+        b = max(0, bisect_right(self.offsets, top) - 1)
+        while b < len(self.blocks) and self.offsets[b] < bottom:
+            offset = self.offsets[b]
+            for row in self.blocks[b].rows_between(top - offset, bottom - offset):
+                wanted.add((b, row))
+            b += 1
+        for b, row in self._shown - wanted:
+            canvas.delete(f"r{b}_{row}")
+        for b, row in wanted - self._shown:
+            self._draw_row(b, row)
+        self._shown = wanted
+
+    def _draw_row(self, b, row):
+        layout = self.blocks[b]
+        y = self.offsets[b] + layout.row_top[row]
+        tag = f"r{b}_{row}"
+        for x, sym, fn in layout.row_glyphs(row):
+            photo = layout.atlas.photo(fn) if fn is not None else None
+            if photo is not None:
+                self.canvas.create_image(x, y, anchor="nw", image=photo, tags=tag)
+            else:
+                self.canvas.create_text(x, y, anchor="nw", text=sym, font=("Arial", TEXT_FONT_SIZE), tags=tag)
+
+    def yview(self, *args):
+        self.canvas.yview(*args)
+        self.update()
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self.yview("scroll", -1, "units")
+        else:
+            self.yview("scroll", 1, "units")
+        return "break"
+
+    def _on_configure(self, event):
+        width = self.width()
+        if width != self._width and self.blocks:
+            for layout in self.blocks:
+                layout.reflow(width)
+            self.set_blocks(self.blocks)
+        else:
+            self.update()
@@ -0,0 +1,194 @@
+# utils/glyph_export.py
+import base64
+import io
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+
+from PIL import Image, ImageDraw, ImageFont
+
+from utils.file_io import save_csv, write_file_atomic, read_line_chunks
+from utils.glyph_atlas import get_glyph_atlas, GLYPH_HEIGHT
+from utils.glyph_layout import GlyphLayout, MARGIN, TEXT_FONT_SIZE
+from utils.translator import Translator
+
+EXPORT_WIDTH = 1000        # page width in pixels; text wraps inside it
+EXPORT_CHUNK_LINES = 50    # lines per process-pool job
+FORMATS = ("png", "svg")
+
+
+# -------------------------
+# Rendering one layout
+# -------------------------
+
+def _page_size(layout):
+    return layout.width, layout.height + 2 * MARGIN
+
+
+_text_font = None
+
+
+def text_font():
+    """Font for symbols without a glyph image, sized like the canvas's Arial."""
+    global _text_font
+    if _text_font is None:
+        for name in ("arial.ttf", "Arial.ttf", "DejaVuSans.ttf"):
+            try:
+                _text_font = ImageFont.truetype(name, TEXT_FONT_SIZE)
+                break
+            except OSError:
+                continue
+        else:
+            try:
+                _text_font = ImageFont.load_default(TEXT_FONT_SIZE)
+            except TypeError:   # Pillow < 10.1: fixed-size bitmap font only
+                _text_font = ImageFont.load_default()
+    return _text_font
+
+
+def render_png(layout, path, background="white"):
+    """Compose the layout's glyph images into a PNG file."""
+    size = _page_size(layout)
+    page = Image.new("RGBA", size, background)
+    draw = ImageDraw.Draw(page)
+    converted = {}
+    for row in range(len(layout)):
+        y = MARGIN + layout.row_top[row]
+        for x, sym, fn in layout.row_glyphs(row):
+            if fn is None:
+                draw.text((x, y), sym, fill="black", font=text_font())
+                continue
+            glyph = converted.get(fn)
+            if glyph is None:
+                glyph = converted[fn] = layout.atlas.glyph(fn).convert("RGBA")
+            page.alpha_composite(glyph, (x, y))
+    write_file_atomic(path, lambda f: page.save(f, format="PNG"), binary=True)
+
+
+_data_uris = {}   # (fontdir, height, filename) -> (scaled glyph, PNG data URI)
+
+
+def _glyph_data_uri(atlas, fn):
+    """Scaled glyph as a PNG data URI, encoded once per glyph image."""
+    glyph = atlas.glyph(fn)
+    key = (atlas.fontdir, atlas.height, fn)
+    cached = _data_uris.get(key)
+    if cached is None or cached[0] is not glyph:
+        buf = io.BytesIO()
+        glyph.save(buf, format="PNG")
+        cached = _data_uris[key] = (glyph, "data:image/png;base64," +
+                                    base64.b64encode(buf.getvalue()).decode("ascii"))
+    return cached[1]
+
+
+def render_svg(layout, path):
+    """Write the layout as a standalone SVG document (glyphs embedded as PNG)."""
+    width, height = _page_size(layout)
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+             f'viewBox="0 0 {width} {height}">\n',
+             '<rect width="100%" height="100%" fill="white"/>\n']
+    for row in range(len(layout)):
+        y = MARGIN + layout.row_top[row]
+        for x, sym, fn in layout.row_glyphs(row):
+            if fn is None:
+                parts.append(f'<text x="{x}" y="{y + TEXT_FONT_SIZE}" font-family="Arial" font-size="{TEXT_FONT_SIZE}">'
+                             f'{escape(sym)}</text>\n')
+                continue
+            glyph = layout.atlas.glyph(fn)
+            parts.append(f'<image x="{x}" y="{y}" width="{glyph.width}" height="{glyph.height}" '
+                         f'href="{_glyph_data_uri(layout.atlas, fn)}"/>\n')
+    parts.append("</svg>\n")
+    write_file_atomic(path, lambda f: f.writelines(parts))
+
+
+RENDERERS = {"png": render_png, "svg": render_svg}
+
+
+# -------------------------
+# Batch export of a text file
+# -------------------------
+
+_worker = None   # (atlas, translator or None, width, fmt, out_dir) per process
+
+
+def _init_worker(fontdir, glyph_height, width, fmt, out_dir, lang, tense):
+    global _worker
+    translator = Translator.for_language(lang, tense) if lang else None
+    _worker = (get_glyph_atlas(fontdir, glyph_height), translator, width, fmt, out_dir)
+
+
+def _render_lines(items):
+    """Render (line number, text) items; returns [(file name, source, rendered text)]."""
+    atlas, translator, width, fmt, out_dir = _worker
+    done = []
+    for lineno, source in items:
+        text = translator.translate(source) if translator else source
+        name = f"{lineno:05d}.{fmt}"
+        RENDERERS[fmt](GlyphLayout(atlas, text, width), os.path.join(out_dir, name))
+        done.append((name, source, text))
+    return done
+
+
+def export_text_file(fontdir, src, out_dir, fmt="png", width=EXPORT_WIDTH, glyph_height=GLYPH_HEIGHT,
+                     translate_lang=None, tense="present", jobs=1, progress=None, check=None):
+    """
+    Render every non-empty line of the text file src as its own image in
+    out_dir (00001.png, ...), glyphs taken from the font folder's
+    mapping.csv and wrapped at width. With translate_lang the lines are
+    English and are translated into that language first. Lines are read
+    in chunks and rendered in a process pool when jobs > 1; index.csv lists
+    file, source and rendered text. progress(done, total) gets byte counts;
+    check() may raise to stop. Returns the number of images written.
+    """
+    if fmt not in RENDERERS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    os.makedirs(out_dir, exist_ok=True)
+    init_args = (fontdir, glyph_height, width, fmt, out_dir, translate_lang, tense)
+    total = os.path.getsize(src)
+    index = []
+    done = 0
+    lineno = 0
+
+    def numbered(lines):
+        nonlocal lineno
+        items = []
+        for line in lines:
+            lineno += 1
+            if line.strip():
+                items.append((lineno, line))
+        return items
+
+    def finish(results, size):
+        nonlocal done
+        index.extend(results)
+        done += size
+        if progress:
+            progress(done, total)
+        if check:
+            check()
+
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=init_args) as pool:
+            pending = deque()
+            try:
+                for lines, size in read_line_chunks(src, EXPORT_CHUNK_LINES):
+                    pending.append((pool.submit(_render_lines, numbered(lines)), size))
+                    if len(pending) >= 2 * jobs:
+                        fut, sz = pending.popleft()
+                        finish(fut.result(), sz)
+                while pending:
+                    fut, sz = pending.popleft()
+                    finish(fut.result(), sz)
+            except BaseException:
+                for fut, _ in pending:
+                    fut.cancel()
+                raise
+    else:
+        _init_worker(*init_args)
+        for lines, size in read_line_chunks(src, EXPORT_CHUNK_LINES):
+            finish(_render_lines(numbered(lines)), size)
+
+    save_csv(os.path.join(out_dir, "index.csv"), ["file", "source", "text"],
+             [{"file": n, "source": s, "text": t} for n, s, t in index])
+    return len(index)
@@ -0,0 +1,82 @@
+# utils/glyph_layout.py
+from array import array
+from bisect import bisect_left, bisect_right
+
+MARGIN = 10          # left/top margin in pixels
+LINE_HEIGHT = 60     # minimum row height
+GLYPH_GAP = 4        # space after an image glyph
+TEXT_ADVANCE = 12    # width per character of a symbol drawn as text
+TEXT_FONT_SIZE = 18  # size of that text (Arial on the canvas and in exports)
+WRAP_MARGIN = 60     # a row ends once x passes width - WRAP_MARGIN
+
+
+class GlyphLayout:
+    """
+    Line breaks and glyph positions of one text at one width, computed once
+    from a GlyphAtlas (image sizes only, no Tk). Positions are kept in flat
+    arrays: per glyph an x and an index into `symbols`; per row its first
+    glyph, top and height. Row tops start at 0; whoever draws the layout
+    adds its own offset.
+    """
+
+    def __init__(self, atlas, text, width, x0=MARGIN):
+        self.atlas = atlas
+        self.text = text
+        self.x0 = x0
+        self.reflow(width)
+
+    def __len__(self):
+        return len(self.row_top)
+
+    def reflow(self, width):
+        """(Re)compute the rows for a new width."""
+        atlas, x0 = self.atlas, self.x0
+        self.width = width
+        self.symbols = []               # (symbol, filename) or (symbol, None) for text
+        ids = {}
+        self.glyph = array("i")
+        self.xs = array("i")
+        self.row_start = array("i", [0])
+        self.row_top = array("i")
+        self.row_height = array("i")
+
+        x, y, line_h = x0, 0, LINE_HEIGHT
+        for sym, fn in atlas.segments(self.text):
+            image = atlas.glyph(fn) if fn is not None else None
+            key = (sym, fn if image is not None else None)
+            gid = ids.get(key)
+            if gid is None:
+                gid = ids[key] = len(self.symbols)
+                self.symbols.append(key)
+            self.glyph.append(gid)
+            self.xs.append(x)
+            if image is not None:
+                x += image.width + GLYPH_GAP
+                line_h = max(line_h, image.height + 5)
+            else:
+                x += TEXT_ADVANCE * len(sym)
+            if x > width - WRAP_MARGIN:
+                y = self._end_row(y, line_h)
+                x, line_h = x0, LINE_HEIGHT
+        if x > x0:
+            y = self._end_row(y, line_h)
+        self.height = y
+
+    def _end_row(self, y, line_h):
+        self.row_top.append(y)
+        self.row_height.append(line_h)
+        self.row_start.append(len(self.glyph))
+        return y + line_h
+
+    def rows_between(self, top, bottom):
+        """range of the rows that overlap [top, bottom) (layout coordinates)."""
+        first = max(0, bisect_right(self.row_top, top) - 1)
+        if first < len(self.row_top) and self.row_top[first] + self.row_height[first] <= top:
+            first += 1
+        return range(first, max(first, bisect_left(self.row_top, bottom)))
+
+    def row_glyphs(self, row):
+        """Yield (x, symbol, filename or None) for the glyphs of a row."""
+        for i in range(self.row_start[row], self.row_start[row + 1]):
+            sym, fn = self.symbols[self.glyph[i]]
+            yield self.xs[i], sym, fn
@@ -0,0 +1,392 @@
+# utils/grammar.py
+import os
+import re
+import hashlib
+
+from constants import LANG_ROOT, GRAMMAR_TEXT, CONJ_FILE, CONJ_FIELDS
+from utils.file_io import load_csv, file_stamp
+from utils.conjugations import ConjugationIndex
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+_WORD = re.compile(r"[\w']+")
+_SPACE = re.compile(r"\s+")
+
+
+# -------------------------
+# Parsing
+# -------------------------
+
+def parse_grammar_text(text):
+    """
+    Parse grammar rules from freeform editor text (old style):
+    - prefix(pos): a-, b-
+    - suffix(pos): -x, -y
+    - transforms: left => right
+    """
+    prefixes = {}
+    suffixes = {}
+    transforms = []
+    notes = []
+    for ln in text.splitlines():
+        L = ln.strip()
+        if not L or L.startswith("#"):
+            continue
+
+        if L.lower().startswith("prefix(") and ":" in L:
+            try:
+                inside = L[L.index("(") + 1:L.index(")")]
+                pos = inside.strip().lower()
+                val = L.split(":", 1)[1].strip()
+                prefixes[pos] = [v.strip() for v in val.split(",") if v.strip()]
+            except Exception:
+                notes.append(L)
+            continue
+
+        if L.lower().startswith("suffix(") and ":" in L:
+            try:
+                inside = L[L.index("(") + 1:L.index(")")]
+                pos = inside.strip().lower()
+                val = L.split(":", 1)[1].strip()
+                suffixes[pos] = [v.strip() for v in val.split(",") if v.strip()]
+            except Exception:
+                notes.append(L)
+            continue
+
+        if "=>" in L:
+            left, right = L.split("=>", 1)
+            # Trim stray quotes on right side if present
+            transforms.append((left.strip(), right.strip().strip('"').strip("'")))
+            continue
+
+        notes.append(L)
+
+    return {"prefixes": prefixes, "suffixes": suffixes, "transforms": transforms, "notes": notes}
+
+
+def parse_grammar_sections(text):
+    """
+    Parse grammar.txt (sectioned format saved by grammar_tab):
+    - [PREFIXES] table with header "POS,Prefixes"
+    - [SUFFIXES] table with header "POS,Suffixes"
+    - [TRANSFORMS] lines like "{owner}'s {object} => the {object} of {owner}"
+    Returns same structure as parse_grammar_text.
+    """
+    prefixes = {}
+    suffixes = {}
+    transforms = []
+
+    section = None
+    for raw in text.splitlines():
+        ln = raw.strip()
+        if not ln:
+            continue
+        if ln.startswith("[") and ln.endswith("]"):
+            section = ln.strip("[]").upper()
+            continue
+
+        # Tables
+        if section in ("PREFIXES", "SUFFIXES"):
+            # Skip header line like "POS,Prefixes"
+            if ln.lower().startswith("pos,"):
+                continue
+            if "," in ln:
+                pos, affixes = ln.split(",", 1)
+                pos = pos.strip().lower()
+                # split by commas, allow multiple affixes; skip empties
+                values = [v.strip() for v in affixes.split(",") if v.strip()]
+                if values:
+                    (prefixes if section == "PREFIXES" else suffixes)[pos] = values
+
+        elif section == "TRANSFORMS":
+            # Lines like: pattern => replacement
+            if "=>" in ln:
+                left, right = ln.split("=>", 1)
+                transforms.append((left.strip(), right.strip().strip('"').strip("'")))
+
+    return {"prefixes": prefixes, "suffixes": suffixes, "transforms": transforms}
+
+
+# -------------------------
+# Compiled form
+# -------------------------
+
+def compile_transform(pattern, replacement):
+    """
+    Prepare one "pattern => replacement" rule. Returns (regex, pattern,
+    replacement, names): regex is None for a literal rule, False for one
+    that does not compile, else a pattern with a group per {placeholder}.
+    """
+    # Normalize quotes
+    pattern = pattern.strip().strip('"').strip("'")
+    replacement = replacement.strip().strip('"').strip("'")
+
+    # Find placeholders {name}
+    names = _PLACEHOLDER.findall(pattern)
+    if not names:
+        return None, pattern, replacement, ()
+
+    # Build regex: replace each {name} with a named capture allowing apostrophes
+    regex = re.escape(pattern)
+    for name in names:
+        regex = regex.replace(r"\{" + name + r"\}", fr"(?P<{name}>[\w']+)")
+    # Allow flexible spacing
+    regex = regex.replace(r"\ ", r"\s+")
+    try:
+        return re.compile(regex), pattern, replacement, tuple(names)
+    except re.error:
+        return False, pattern, replacement, tuple(names)  # unusable rule, skipped
+
+
+class _Node:
+    __slots__ = ("chars", "ws", "ph", "rule", "best")
+
+    def __init__(self):
+        self.chars = {}     # literal character -> node
+        self.ws = {}        # minimum whitespace run (spaces in a placeholder rule) -> node
+        self.ph = {}        # placeholder name -> node; consumes part of a [\w']+ run
+        self.rule = None    # lowest rule index ending here
+        self.best = None    # lowest rule index anywhere in this subtree
+
+
+class TransformEngine:
+    """
+    Applies a whole list of "pattern => replacement" transforms in one
+    left-to-right scan. Every rule is a path in one shared trie whose edges
+    are literal characters, whitespace runs (each space in a placeholder
+    rule is a \\s+, as before, so n spaces need a run of n or more) and
+    {placeholders} (a [\\w']+ span, longest first), so the cost of a scan
+    grows with the text, not the rule count. A single rule rewrites text
+    exactly as its old re.sub did.
+
+    Priority: the leftmost match wins; among rules matching at the same
+    position the one listed first wins. Replaced text is not rescanned,
+    so one rule's output is never rewritten by another rule.
+    """
+
+    def __init__(self, transforms):
+        self.root = _Node()
+        self.rules = []     # (replacement, names, formattable)
+        for p, r in transforms:
+            regex, pattern, replacement, names = compile_transform(p, r)
+            if regex is False or not pattern:
+                continue  # unusable rule (e.g. repeated placeholder), skipped
+            self._insert(self._elements(pattern, bool(names)), len(self.rules))
+            self.rules.append((replacement, names, self._formattable(replacement, names)))
+        self._starts = self._start_regex()
+
+    @staticmethod
+    def _elements(pattern, placeholders):
+        """Split a pattern into ("c", char) / ("ws", min run) / ("ph", name) steps."""
+        if not placeholders:
+            return [("c", ch) for ch in pattern]  # literal rules replace the exact text
+        out = []
+        for k, chunk in enumerate(_PLACEHOLDER.split(pattern)):
+            if k % 2:
+                out.append(("ph", chunk))
+                continue
+            for ch in chunk:
+                if ch == " ":
+                    # n spaces were n consecutive \s+, i.e. one run of at least n
+                    if out and out[-1][0] == "ws":
+                        out[-1] = ("ws", out[-1][1] + 1)
+                    else:
+                        out.append(("ws", 1))
+                else:
+                    out.append(("c", ch))
+        return out
+
+    @staticmethod
+    def _formattable(replacement, names):
+        if not names:
+            return False
+        try:
+            replacement.format(**{n: "" for n in names})
+            return True
+        except Exception:
+            return False  # inserted verbatim, as the old re.sub fallback did
+
+    def _insert(self, elements, rule):
+        node = self.root
+        node.best = rule if node.best is None else node.best
+        for kind, val in elements:
+            if kind == "c":
+                node = node.chars.setdefault(val, _Node())
+            elif kind == "ws":
+                node = node.ws.setdefault(val, _Node())
+            else:
+                node = node.ph.setdefault(val, _Node())
+            if node.best is None:
+                node.best = rule
+        if node.rule is None:
+            node.rule = rule
+
+    def _start_regex(self):
+        """Regex finding the positions where some rule could start."""
+        alts = []
+        if self.root.chars:
+            alts.append("[" + "".join(re.escape(c) for c in self.root.chars) + "]")
+        if self.root.ws:
+            alts.append(r"\s")
+        if self.root.ph:
+            alts.append(r"(?<![\w'])[\w']")
+        return re.compile("|".join(alts)) if alts else None
+
+    def _match_at(self, text, i, floor):
+        """Best (rule, end, bindings) starting at i, or None (text before floor is consumed)."""
+        best = None
+
+        def walk(node, j, binds):
+            nonlocal best
+            if best is not None and node.best >= best[0]:
+                return
+            if node.rule is not None and j > i and (best is None or node.rule < best[0]):
+                best = (node.rule, j, binds)
+            if j < len(text):
+                child = node.chars.get(text[j])
+                if child is not None:
+                    walk(child, j + 1, binds)
+            if node.ws:
+                m = _SPACE.match(text, j)
+                if m:
+                    for run, child in node.ws.items():
+                        if m.end() - j >= run:
+                            walk(child, m.end(), binds)
+            if node.ph:
+                m = _WORD.match(text, j)
+                # a leading placeholder starts its word, unless that word was cut by the last match
+                if m and (node is not self.root or j == floor or not _WORD.match(text, j - 1)):
+                    for end in range(m.end(), j, -1):   # greedy, like [\w']+
+                        for name, child in node.ph.items():
+                            walk(child, end, binds + ((name, j, end),))
+
+        walk(self.root, i, ())
+        return best
+
+    def apply(self, text):
+        if self._starts is None:
+            return text
+        out = []
+        last = 0
+        pos = 0
+        while True:
+            if pos == last and last:
+                i = pos   # right after a match; the start regex cannot see this boundary
+            else:
+                m = self._starts.search(text, pos)
+                if m is None:
+                    break
+                i = m.start()
+            hit = self._match_at(text, i, last)
+            if hit is None:
+                pos = i + 1
+                continue
+            rule, end, binds = hit
+            replacement, names, formattable = self.rules[rule]
+            if formattable:
+                replacement = replacement.format(**{n: text[a:b] for n, a, b in binds})
+            out.append(text[last:i])
+            out.append(replacement)
+            last = pos = end
+        out.append(text[last:])
+        return "".join(out)
+
+
+class CompiledGrammar:
+    """
+    Everything the translator needs from a language's grammar, prepared
+    once: affix tables, the phrase transform engine and a ConjugationIndex.
+    """
+
+    def __init__(self, parsed, conjugations=(), digest=None):
+        self.digest = digest
+        self.prefixes = parsed.get("prefixes", {})
+        self.suffixes = parsed.get("suffixes", {})
+        self.transforms = parsed.get("transforms", [])
+        self.transform_engine = TransformEngine(self.transforms)
+        self.conjugations = ConjugationIndex(conjugations)
+
+    def as_dict(self):
+        """The parse_grammar_text()-style dict."""
+        return {"prefixes": self.prefixes, "suffixes": self.suffixes, "transforms": self.transforms}
+
+    def apply_transforms(self, sentence):
+        return self.transform_engine.apply(sentence)
+
+    def affix(self, con_word, pos):
+        if not con_word:
+            return con_word
+        pfx_list = self.prefixes.get(pos, [])
+        sfx_list = self.suffixes.get(pos, [])
+        if pfx_list:
+            con_word = pfx_list[0] + con_word
+        if sfx_list:
+            con_word = con_word + sfx_list[0]
+        return con_word
+
+    def conjugate(self, con_word, english_token, tense):
+        return self.conjugations.conjugate(con_word, english_token, tense)
+
+
+def _digest(*parts):
+    h = hashlib.sha1()
+    for p in parts:
+        h.update(p.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+# -------------------------
+# Per-language cache
+# -------------------------
+
+_grammars = {}   # lang -> (stamps, CompiledGrammar)
+
+
+def get_compiled_grammar(lang):
+    """
+    CompiledGrammar for grammar.txt + conjugations.csv of a language. Files
+    are re-read only when their mtime/size change, and the grammar is only
+    recompiled if the re-read contents actually differ.
+    """
+    langdir = os.path.join(LANG_ROOT, lang)
+    gpath = os.path.join(langdir, GRAMMAR_TEXT)
+    cpath = os.path.join(langdir, CONJ_FILE)
+    stamps = (file_stamp(gpath), file_stamp(cpath))
+
+    cached = _grammars.get(lang)
+    if cached is not None and cached[0] == stamps:
+        return cached[1]
+
+    text = ""
+    if stamps[0] is not None:
+        with open(gpath, "r", encoding="utf-8") as f:
+            text = f.read()
+    conj_rows = load_csv(cpath, CONJ_FIELDS)
+    digest = _digest(text, repr([tuple(r.values()) for r in conj_rows]))
+    if cached is not None and cached[1].digest == digest:
+        grammar = cached[1]   # touched but unchanged
+    else:
+        grammar = CompiledGrammar(parse_grammar_sections(text), conj_rows, digest=digest)
+    _grammars[lang] = (stamps, grammar)
+    return grammar
+
+
+_text_grammars = {}
+
+
+def compile_grammar_text(text, conjugations=()):
+    """CompiledGrammar for freeform editor text, cached by a hash of the text."""
+    conj_rows = list(conjugations)
+    digest = _digest(text, repr([tuple(r.values()) for r in conj_rows]))
+    grammar = _text_grammars.get(digest)
+    if grammar is None:
+        _text_grammars.clear()
+        grammar = _text_grammars[digest] = CompiledGrammar(parse_grammar_text(text), conj_rows, digest=digest)
+    return grammar
+
+
+def invalidate_compiled_grammar(lang=None):
+    if lang is None:
+        _grammars.clear()
+    else:
+        _grammars.pop(lang, None)
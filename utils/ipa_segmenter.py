@@ -0,0 +1,83 @@
+# utils/ipa_segmenter.py
+import os
+import unicodedata
+from functools import lru_cache
+
+from utils.trie import LongestMatchTrie
+from utils.file_io import get_ipa_audio_dir
+
+AUDIO_EXTS = (".mp3", ".wav")
+SEGMENT_CACHE_SIZE = 65536
+
+
+class IpaSegmenter:
+    """
+    Splits an IPA string into phoneme symbols by longest match against a
+    fixed symbol table, so affricates and tie-bar/ejective sequences such
+    as "d͡z", "t͡ʃ" or "kʼ" come out as one segment. Symbols and input are
+    normalized to the same Unicode form (NFC by default, NFD for e.g.
+    filenames coming from macOS). Code points not covered by the table
+    become single-character segments; whitespace is dropped.
+    """
+
+    def __init__(self, symbols, form="NFC"):
+        self.form = form
+        self.symbols = {self.normalize(s) for s in symbols if s}
+        self.trie = LongestMatchTrie((s, s) for s in self.symbols)
+        self.segment = lru_cache(maxsize=SEGMENT_CACHE_SIZE)(self._segment)
+
+    def normalize(self, text):
+        return unicodedata.normalize(self.form, text) if self.form else text
+
+    def _segment(self, ipa_string):
+        text = self.normalize(ipa_string)
+        return tuple(text[start:end] for start, end, _ in self.trie.scan(text)
+                     if not text[start:end].isspace())
+
+    def is_known(self, segment):
+        return segment in self.symbols
+
+
+# -------------------------
+# ipa_audio lookup
+# -------------------------
+
+_audio = {"stamp": None, "files": {}}
+_segmenters = {}
+
+
+def _dir_stamp(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_ipa_audio_files(form="NFC"):
+    """Return {symbol: {ext: path}} for the ipa_audio folder, rescanned when it changes."""
+    audio_dir = get_ipa_audio_dir()
+    stamp = (audio_dir, _dir_stamp(audio_dir), form)
+    if _audio["stamp"] != stamp:
+        files = {}
+        if os.path.isdir(audio_dir):
+            for fn in os.listdir(audio_dir):
+                stem, ext = os.path.splitext(fn)
+                if ext.lower() in AUDIO_EXTS and stem:
+                    sym = unicodedata.normalize(form, stem)
+                    files.setdefault(sym, {})[ext.lower()] = os.path.join(audio_dir, fn)
+        _audio["stamp"], _audio["files"] = stamp, files
+    return _audio["files"]
+
+
+def get_pronunciation_segmenter(phonemes=(), form="NFC"):
+    """
+    Segmenter over a language's phoneme inventory plus every symbol that has
+    an ipa_audio file. Reused until the inventory or the audio folder change.
+    """
+    audio_files = get_ipa_audio_files(form)
+    key = (frozenset(phonemes), _audio["stamp"])
+    seg = _segmenters.get(key)
+    if seg is None:
+        _segmenters.clear()
+        seg = _segmenters[key] = IpaSegmenter(set(phonemes) | set(audio_files), form=form)
+    return seg
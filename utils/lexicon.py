@@ -0,0 +1,194 @@
+# utils/lexicon.py
+import hashlib
+import os
+import unicodedata
+
+from constants import LANG_ROOT, DICT_FILE, DICT_DB_FILE, DICT_JOURNAL_FILE
+from utils.file_io import file_stamp
+from utils.dict_store import open_dictionary_store
+from utils.dict_journal import DictionaryJournal
+from utils.trie import LongestMatchTrie
+from utils.fuzzy import FuzzyIndex
+
+
+def conlang_key(word):
+    return (word or "").strip().lower()
+
+
+def pronunciation_key(ipa):
+    return unicodedata.normalize("NFC", (ipa or "").strip())
+
+
+def phrase_tokens(text):
+    """Lowercased whitespace tokens, the unit the phrase tries work in."""
+    return tuple((text or "").lower().split())
+
+
+def _entry_hash(english, entry):
+    key = "\0".join((english, entry.get("conlang") or "", entry.get("pos") or "",
+                     entry.get("pronunciation") or ""))
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class Lexicon:
+    """
+    A language's dictionary in both directions. `entries` is the English
+    headword -> entry dict the app uses as app.dictionary; alongside it the
+    lexicon keeps conlang -> [english] and pronunciation -> [english]
+    multimaps, so homographs are all kept. Token tries over both sides let
+    the translators take the longest multi-word headword ("ice cream",
+    "give up") at each position. The fuzzy index for typo lookups is built
+    on first use. put()/pop() update everything in place, so a single edit
+    never costs a rebuild.
+
+    `version` is an order-independent hash of the fields translation uses,
+    kept current by put()/pop(): lexicons with the same contents have the
+    same version, in this process or any other, so it can key caches of
+    translated text.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.version = 0
+        self.by_conlang = {}
+        self.by_pronunciation = {}
+        self.english_phrases = LongestMatchTrie()   # headword tokens -> headword
+        self.conlang_phrases = LongestMatchTrie()   # conlang tokens -> conlang key
+        self._fuzzy = None                          # FuzzyIndex, once fuzzy_index() was called
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Lexicon from STORE_FIELDS rows (later duplicates of a headword win)."""
+        lex = cls()
+        for r in rows:
+            eng = (r.get("english") or "").strip()
+            if eng:
+                lex.put(eng.lower(), dict(r))
+        return lex
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, english):
+        return english in self.entries
+
+    def get(self, english, default=None):
+        return self.entries.get(english, default)
+
+    # -------------------------
+    # Updates
+    # -------------------------
+
+    def put(self, english, entry):
+        """Add or replace the entry for an (already lowercased) English headword."""
+        old = self.entries.get(english)
+        if old is not None:
+            self._unindex(english, old)
+        self.entries[english] = entry
+        self._index(english, entry)
+
+    def pop(self, english, default=None):
+        entry = self.entries.pop(english, None)
+        if entry is None:
+            return default
+        self._unindex(english, entry)
+        return entry
+
+    def _pairs(self, entry):
+        return ((self.by_conlang, conlang_key(entry.get("conlang"))),
+                (self.by_pronunciation, pronunciation_key(entry.get("pronunciation"))))
+
+    def _fuzzy_terms(self, entry):
+        return entry.get("conlang") or "", entry.get("pronunciation") or ""
+
+    def _index(self, english, entry):
+        self.version ^= _entry_hash(english, entry)
+        if self._fuzzy is not None:
+            for term in self._fuzzy_terms(entry):
+                self._fuzzy.add(term, english)
+        self.english_phrases.insert(phrase_tokens(english), english, overwrite=True)
+        for table, key in self._pairs(entry):
+            if key:
+                if key not in table and table is self.by_conlang:
+                    self.conlang_phrases.insert(phrase_tokens(key), key)
+                table.setdefault(key, []).append(english)
+
+    def _unindex(self, english, entry):
+        self.version ^= _entry_hash(english, entry)
+        if self._fuzzy is not None:
+            for term in self._fuzzy_terms(entry):
+                self._fuzzy.remove(term, english)
+        self.english_phrases.remove(phrase_tokens(english))
+        for table, key in self._pairs(entry):
+            heads = table.get(key)
+            if heads and english in heads:
+                heads.remove(english)
+                if not heads:
+                    del table[key]
+                    if table is self.by_conlang:
+                        self.conlang_phrases.remove(phrase_tokens(key))
+
+    # -------------------------
+    # Lookups
+    # -------------------------
+
+    def fuzzy_index(self):
+        """FuzzyIndex over conlang forms and pronunciations (payload: English headword)."""
+        if self._fuzzy is None:
+            index = FuzzyIndex()
+            for english, entry in self.entries.items():
+                for term in self._fuzzy_terms(entry):
+                    index.add(term, english)
+            self._fuzzy = index
+        return self._fuzzy
+
+    def conlang_for(self, english):
+        return (self.entries.get((english or "").lower()) or {}).get("conlang", "")
+
+    def english_for(self, conlang):
+        """Every English headword whose conlang form is conlang."""
+        return list(self.by_conlang.get(conlang_key(conlang), ()))
+
+    def english_for_pronunciation(self, ipa):
+        return list(self.by_pronunciation.get(pronunciation_key(ipa), ()))
+
+    def scan_english(self, tokens):
+        """
+        Yield (start, end, headword or None) over a token list, taking the
+        longest English headword at each position.
+        """
+        return self.english_phrases.scan([t.lower() for t in tokens])
+
+    def scan_conlang(self, tokens):
+        """Yield (start, end, [english] or None), longest conlang form first."""
+        for start, end, key in self.conlang_phrases.scan([t.lower() for t in tokens]):
+            yield start, end, (list(self.by_conlang[key]) if key is not None else None)
+
+
+# -------------------------
+# Per-language cache (languages other than the one being edited)
+# -------------------------
+
+_lexicons = {}
+
+
+def load_lexicon_rows(langdir):
+    """Dictionary rows from the SQLite store, else dictionary.csv with its journal replayed."""
+    store = open_dictionary_store(langdir)
+    if store is None:
+        return DictionaryJournal(langdir).load_rows()
+    try:
+        return [row for _, row in store.all_rows()]
+    finally:
+        store.close()
+
+
+def get_lexicon(lang):
+    """Lexicon of a language read from disk, reused until its dictionary files change."""
+    langdir = os.path.join(LANG_ROOT, lang)
+    stamp = tuple(file_stamp(os.path.join(langdir, fn))
+                  for fn in (DICT_FILE, DICT_DB_FILE, DICT_JOURNAL_FILE))
+    cached = _lexicons.get(lang)
+    if cached is None or cached[0] != stamp:
+        cached = _lexicons[lang] = (stamp, Lexicon.from_rows(load_lexicon_rows(langdir)))
+    return cached[1]
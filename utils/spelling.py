@@ -0,0 +1,34 @@
+# utils/spelling.py
+from utils.trie import LongestMatchTrie
+
+
+class SpellingTransducer:
+    """
+    IPA -> romanization converter compiled once from a spelling rule set.
+    Rules are matched longest-first in a single left-to-right pass, so a
+    rule for "t" cannot clobber "t͡ʃ" regardless of rule order. Symbols
+    without a rule are copied through unchanged.
+    """
+
+    def __init__(self, rules):
+        self.trie = LongestMatchTrie()
+        for ipa, roman in rules:
+            if ipa and roman:
+                self.trie.insert(ipa, roman)
+
+    def romanize(self, ipa_string):
+        out = []
+        for start, end, roman in self.trie.scan(ipa_string):
+            out.append(ipa_string[start:end] if roman is None else roman)
+        return "".join(out)
+
+    def romanize_many(self, ipa_strings):
+        """Romanize a batch (e.g. every pronunciation in the lexicon), reusing repeats."""
+        seen = {}
+        out = []
+        for ipa in ipa_strings:
+            roman = seen.get(ipa)
+            if roman is None:
+                roman = seen[ipa] = self.romanize(ipa)
+            out.append(roman)
+        return out
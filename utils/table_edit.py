@@ -12,14 +12,17 @@ def enable_treeview_editing(tree: tk.Widget, save_callback=None, app=None):
     edit = {"entry": None, "item": None, "column": None}
 
     def finish(save: bool):
-        if edit["entry"] is None:
+        entry, item, column = edit["entry"], edit["item"], edit["column"]
+        if entry is None:
             return
+        # clear first: saving may redraw the tree, which calls finish() again
+        edit.update({"entry": None, "item": None, "column": None})
         if save:
-            newval = edit["entry"].get()
-            vals = list(tree.item(edit["item"], "values"))
-            col_index = tree["columns"].index(edit["column"])
+            newval = entry.get()
+            vals = list(tree.item(item, "values"))
+            col_index = tree["columns"].index(column)
             vals[col_index] = newval
-            tree.item(edit["item"], values=vals)
+            tree.item(item, values=vals)
             # 🔑 auto-save after edit
             if save_callback and app:
                 try:
@@ -27,12 +30,9 @@ def enable_treeview_editing(tree: tk.Widget, save_callback=None, app=None):
                 except Exception as e:
                     print("Auto-save failed:", e)
         # cleanup
-        if hasattr(edit["entry"], "ipa_btn"):
-            edit["entry"].ipa_btn.destroy()
-        edit["entry"].destroy()
-        edit["entry"] = None
-        edit["item"] = None
-        edit["column"] = None
+        if hasattr(entry, "ipa_btn"):
+            entry.ipa_btn.destroy()
+        entry.destroy()
 
     def begin_edit(event):
         region = tree.identify("region", event.x, event.y)
@@ -97,3 +97,5 @@ def enable_treeview_editing(tree: tk.Widget, save_callback=None, app=None):
         edit.update({"entry": entry, "item": item, "column": col_name})
 
     tree.bind("<Double-1>", begin_edit, add="+")
+    # a VirtualTreeview about to rebuild its rows (scroll, resize): commit first
+    tree.bind("<<WindowRefresh>>", lambda e: finish(True), add="+")
@@ -0,0 +1,102 @@
+# utils/text_index.py
+import re
+from bisect import bisect_left, insort
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """Casefolded word tokens of text (Unicode-aware, so conlang letters count)."""
+    return _TOKEN.findall((text or "").casefold())
+
+
+class InvertedIndex:
+    """
+    Token -> {key} postings over a few text fields per entry, updated in
+    place as entries change. search() ANDs the query tokens; the last one
+    also matches as a prefix so results narrow while the user is typing.
+    Prefix expansion walks a sorted vocabulary with bisect.
+    """
+
+    def __init__(self):
+        self.postings = {}     # token -> set of keys
+        self.tokens = {}       # key -> frozenset of tokens currently indexed
+        self.vocab = []        # sorted tokens with non-empty postings
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def add(self, key, texts):
+        """Index key under every token of texts (replacing what it had)."""
+        toks = frozenset(tokenize(" ".join(texts)))
+        old = self.tokens.get(key, frozenset())
+        for t in old - toks:
+            self._unpost(t, key)
+        for t in toks - old:
+            keys = self.postings.get(t)
+            if keys is None:
+                keys = self.postings[t] = set()
+                insort(self.vocab, t)
+            keys.add(key)
+        self.tokens[key] = toks
+
+    update = add
+
+    def remove(self, key):
+        for t in self.tokens.pop(key, ()):
+            self._unpost(t, key)
+
+    def clear(self):
+        self.postings.clear()
+        self.tokens.clear()
+        self.vocab.clear()
+
+    def rebuild(self, items):
+        """Replace the index with (key, texts) pairs."""
+        self.clear()
+        for key, texts in items:
+            toks = frozenset(tokenize(" ".join(texts)))
+            self.tokens[key] = toks
+            for t in toks:
+                self.postings.setdefault(t, set()).add(key)
+        self.vocab = sorted(self.postings)
+
+    def _unpost(self, token, key):
+        keys = self.postings.get(token)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del self.postings[token]
+            i = bisect_left(self.vocab, token)
+            if i < len(self.vocab) and self.vocab[i] == token:
+                del self.vocab[i]
+
+    # -------------------------
+    # Queries
+    # -------------------------
+
+    def prefix_keys(self, prefix):
+        """Keys having any token that starts with prefix."""
+        out = set()
+        i = bisect_left(self.vocab, prefix)
+        while i < len(self.vocab) and self.vocab[i].startswith(prefix):
+            out |= self.postings[self.vocab[i]]
+            i += 1
+        return out
+
+    def search(self, query, prefix=True):
+        """Keys matching every token of query; None for an empty query."""
+        toks = tokenize(query)
+        if not toks:
+            return None
+        sets = [self.postings.get(t, set()) for t in toks[:-1]]
+        last = toks[-1]
+        sets.append(self.prefix_keys(last) if prefix else self.postings.get(last, set()))
+        sets.sort(key=len)
+        result = set(sets[0])
+        for s in sets[1:]:
+            if not result:
+                break
+            result &= s
+        return result
@@ -0,0 +1,185 @@
+# utils/translation_memory.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from constants import LANG_ROOT, TM_FILE
+
+TM_CAPACITY = 20000        # entries kept in memory per language
+TM_DISK_CAPACITY = 200000  # rows kept in translation_memory.db
+TM_COMMIT_EVERY = 200      # disk writes between commits
+
+
+class TranslationMemory:
+    """
+    LRU cache of finished translations. An entry is keyed by (text,
+    direction, tense, tag), where tag names the grammar and dictionary it
+    was made with (Translator.tag): any edit to either changes the tag, so
+    old entries stop matching and age out. With a path the entries are also
+    kept in a small SQLite table, so they survive restarts; rows written
+    under an older tag are dropped when the store is closed.
+    Thread-safe; values must be JSON-serializable.
+    """
+
+    def __init__(self, capacity=TM_CAPACITY, path=None, disk_capacity=TM_DISK_CAPACITY):
+        self.capacity = capacity
+        self.disk_capacity = disk_capacity
+        self.hits = 0
+        self.misses = 0
+        self.path = None
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._clock = 0        # last "used" stamp written to disk
+        self._tag = None       # tag of the most recent write
+        self._unsaved = 0
+        if path:
+            self.open_store(path)
+
+    def __len__(self):
+        return len(self._lru)
+
+    @property
+    def persistent(self):
+        return self._db is not None
+
+    # -------------------------
+    # Disk store
+    # -------------------------
+
+    def open_store(self, path):
+        with self._lock:
+            if self._db is not None:
+                return
+            db = sqlite3.connect(path, check_same_thread=False)
+            with db:
+                db.execute("CREATE TABLE IF NOT EXISTS memory ("
+                           "key TEXT PRIMARY KEY, tag TEXT NOT NULL, "
+                           "value TEXT NOT NULL, used INTEGER NOT NULL)")
+                db.execute("CREATE INDEX IF NOT EXISTS idx_memory_used ON memory (used)")
+            self._db = db
+            self.path = path
+            self._clock = db.execute("SELECT COALESCE(MAX(used), 0) FROM memory").fetchone()[0]
+
+    def flush(self):
+        with self._lock:
+            if self._db is not None and self._unsaved:
+                self._db.commit()
+                self._unsaved = 0
+
+    def close_store(self):
+        """Drop stale and least recently used rows, commit and close (memory entries stay)."""
+        with self._lock:
+            db, self._db = self._db, None
+            self.path = None
+            if db is None:
+                return
+            try:
+                if self._tag is not None:
+                    db.execute("DELETE FROM memory WHERE tag != ?", (self._tag,))
+                db.execute("DELETE FROM memory WHERE used <= ("
+                           "SELECT used FROM memory ORDER BY used DESC LIMIT 1 OFFSET ?)",
+                           (self.disk_capacity,))
+                db.commit()
+            finally:
+                db.close()
+
+    # -------------------------
+    # Lookups
+    # -------------------------
+
+    @staticmethod
+    def _key(text, direction, tense, tag):
+        return "\0".join((direction, tense or "", tag, text))
+
+    @staticmethod
+    def _disk_key(key):
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _remember(self, key, value):
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.capacity:
+            self._lru.popitem(last=False)
+
+    def _touch(self, dkey, tag, value=None):
+        self._clock += 1
+        if value is None:
+            self._db.execute("UPDATE memory SET used = ? WHERE key = ?", (self._clock, dkey))
+        else:
+            self._db.execute("INSERT OR REPLACE INTO memory (key, tag, value, used) VALUES (?, ?, ?, ?)",
+                             (dkey, tag, json.dumps(value, ensure_ascii=False), self._clock))
+        self._unsaved += 1
+        if self._unsaved >= TM_COMMIT_EVERY:
+            self._db.commit()
+            self._unsaved = 0
+
+    def get(self, text, direction, tense, tag):
+        """The stored value, or None."""
+        key = self._key(text, direction, tense, tag)
+        with self._lock:
+            value = self._lru.get(key)
+            if value is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return value
+            if self._db is not None:
+                dkey = self._disk_key(key)
+                row = self._db.execute("SELECT value FROM memory WHERE key = ?", (dkey,)).fetchone()
+                if row is not None:
+                    value = json.loads(row[0])
+                    self._remember(key, value)
+                    self._touch(dkey, tag)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def put(self, text, direction, tense, tag, value):
+        key = self._key(text, direction, tense, tag)
+        with self._lock:
+            self._remember(key, value)
+            if self._db is not None:
+                self._tag = tag
+                self._touch(self._disk_key(key), tag, value)
+
+    def clear(self):
+        with self._lock:
+            self._lru.clear()
+            self.hits = self.misses = 0
+
+
+# -------------------------
+# Per-language memories
+# -------------------------
+
+_memories = {}
+_memories_lock = threading.Lock()
+
+
+def get_translation_memory(lang, persistent=False):
+    """
+    The language's TranslationMemory, shared by the Translation tab and batch
+    jobs. persistent=True backs it with Languages/<lang>/translation_memory.db;
+    persistent=False detaches (and saves) that store if one was open.
+    """
+    with _memories_lock:
+        memory = _memories.get(lang)
+        if memory is None:
+            memory = _memories[lang] = TranslationMemory()
+    if persistent and not memory.persistent:
+        memory.open_store(os.path.join(LANG_ROOT, lang, TM_FILE))
+    elif not persistent and memory.persistent:
+        memory.close_store()
+    return memory
+
+
+def close_translation_memories():
+    """Save and close every on-disk store (on exit)."""
+    with _memories_lock:
+        memories = list(_memories.values())
+    for memory in memories:
+        memory.close_store()
@@ -0,0 +1,130 @@
+# utils/translation_service.py
+import os
+
+from constants import LANG_ROOT
+from utils.consistency import get_consistency_engine
+from utils.conjugations import TENSES
+from utils.lexicon import get_lexicon
+from utils.translator import Translator
+from utils.translation_memory import get_translation_memory
+
+
+class ServiceError(Exception):
+    """A bad request; the message is sent back to the client."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def _texts(payload, field="texts"):
+    """The batch in a request: {"texts": [...]} or a single {"text": "..."}."""
+    if field in payload:
+        items = payload[field]
+    elif field.rstrip("s") in payload:
+        items = [payload[field.rstrip("s")]]
+    else:
+        raise ServiceError(f'missing "{field}"')
+    if not isinstance(items, list) or not all(isinstance(t, str) for t in items):
+        raise ServiceError(f'"{field}" must be a list of strings')
+    return items
+
+
+class TranslationService:
+    """
+    The translation pipeline behind the local HTTP server, without any Tk.
+    Every request goes through the per-language caches (lexicon, compiled
+    grammar, spelling rules), which re-read a language only when its files
+    change on disk, so edits made in the app show up on the next request.
+    Payloads and results are plain dicts.
+    """
+
+    def __init__(self, lang, memory=True):
+        self.lang = lang
+        self.memory = memory
+
+    def _lang(self, payload):
+        lang = payload.get("lang") or self.lang
+        # only an existing folder directly under Languages/ (no ".", "..", or paths)
+        if not isinstance(lang, str) or lang in (".", "..") or lang not in os.listdir(LANG_ROOT) \
+                or not os.path.isdir(os.path.join(LANG_ROOT, lang)):
+            raise ServiceError(f"unknown language: {lang}", 404)
+        return lang
+
+    def translator(self, lang, tense="present"):
+        if tense not in TENSES:
+            raise ServiceError(f"tense must be one of {', '.join(TENSES)}")
+        memory = get_translation_memory(lang) if self.memory else None
+        return Translator.for_language(lang, tense, memory)
+
+    def warm(self):
+        """Load the language's dictionary, grammar, fuzzy index and spelling rules up front."""
+        translator = self.translator(self.lang)
+        translator.lexicon.fuzzy_index()
+        get_consistency_engine(self.lang)
+        return translator
+
+    def status(self):
+        translator = self.translator(self.lang)
+        return {"lang": self.lang, "entries": len(translator.lexicon), "tag": translator.tag}
+
+    # -------------------------
+    # Endpoints
+    # -------------------------
+
+    def translate(self, payload):
+        """English -> conlang: {"texts": [...], "tense": "present"}."""
+        translator = self.translator(self._lang(payload), payload.get("tense", "present"))
+        results = []
+        for text in _texts(payload):
+            out, units, unknown = translator.translate_line(text)
+            results.append({"text": out, "units": units, "unknown": unknown})
+        return {"results": results}
+
+    def reverse_translate(self, payload):
+        """Conlang -> English: {"texts": [...]}."""
+        translator = self.translator(self._lang(payload))
+        results = []
+        for text in _texts(payload):
+            out, units, unknown = translator.reverse_line(text)
+            results.append({"text": out, "units": units, "unknown": unknown})
+        return {"results": results}
+
+    def romanize(self, payload):
+        """IPA -> spelling via spelling_rules.csv: {"texts": [...]}."""
+        engine = get_consistency_engine(self._lang(payload))
+        return {"results": engine.romanize_many(_texts(payload))}
+
+    def lookup(self, payload):
+        """
+        Dictionary entries for {"words": [...], "side": "english" | "conlang"};
+        conlang words may match several headwords (and also match pronunciations).
+        """
+        lexicon = get_lexicon(self._lang(payload))
+        side = payload.get("side", "english")
+        results = []
+        for word in _texts(payload, "words"):
+            if side == "english":
+                entry = lexicon.get(word.strip().lower())
+                heads = [word.strip().lower()] if entry else []
+            elif side == "conlang":
+                heads = lexicon.english_for(word) or lexicon.english_for_pronunciation(word)
+            else:
+                raise ServiceError('"side" must be "english" or "conlang"')
+            results.append([dict(lexicon.get(h), english=h) for h in heads])
+        return {"results": results}
+
+    ENDPOINTS = {
+        "translate": translate,
+        "reverse-translate": reverse_translate,
+        "romanize": romanize,
+        "lookup": lookup,
+    }
+
+    def handle(self, endpoint, payload):
+        fn = self.ENDPOINTS.get(endpoint)
+        if fn is None:
+            raise ServiceError(f"no such endpoint: /{endpoint}", 404)
+        if not isinstance(payload, dict):
+            raise ServiceError("request body must be a JSON object")
+        return fn(self, payload)
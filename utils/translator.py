@@ -0,0 +1,127 @@
+# utils/translator.py
+from utils.lexicon import get_lexicon
+from utils.grammar import get_compiled_grammar
+from utils.fuzzy import distance_for
+
+TO_CONLANG = "en>con"
+TO_ENGLISH = "con>en"
+
+
+class Translator:
+    """
+    Translation pipeline without any Tk state. English -> conlang runs
+    phrase transforms, longest-match dictionary lookup, prefixes/suffixes
+    and verb conjugation; conlang -> English runs the reverse lookups with
+    a fuzzy fallback. The Translation tab runs it on app.lexicon and
+    app.conj_index; batch jobs build one per process with for_language().
+    With a TranslationMemory, whole lines are served from it when the
+    same text was translated under the same tag.
+    """
+
+    def __init__(self, lexicon, grammar, conj_index=None, tense="present", lang=None, memory=None):
+        self.lexicon = lexicon
+        self.grammar = grammar
+        self.conj_index = conj_index if conj_index is not None else grammar.conjugations
+        self.tense = tense
+        self.lang = lang
+        self.memory = memory
+
+    @classmethod
+    def for_language(cls, lang, tense="present", memory=None):
+        """Translator over a language's files on disk (cached lexicon and grammar)."""
+        grammar = get_compiled_grammar(lang)
+        return cls(get_lexicon(lang), grammar, grammar.conjugations, tense, lang, memory)
+
+    @property
+    def tag(self):
+        """Names the grammar, conjugations and dictionary in use (translation memory key)."""
+        return f"{self.grammar.digest}:{self.conj_index.digest}:{self.lexicon.version:016x}"
+
+    def _cached(self, text, direction, tense, run):
+        if self.memory is None:
+            return run(text)
+        tag = self.tag
+        hit = self.memory.get(text, direction, tense, tag)
+        if hit is not None:
+            return hit
+        result = run(text)
+        self.memory.put(text, direction, tense, tag, result)
+        return result
+
+    # -------------------------
+    # English -> conlang
+    # -------------------------
+
+    def translate_units(self, text):
+        """Yield (english, conlang, known) for each dictionary unit of text."""
+        # Apply phrase-level transforms (supports {placeholders} and "=>")
+        tokens = self.grammar.apply_transforms(text).split()
+        for start, end, head in self.lexicon.scan_english(tokens):
+            tok = " ".join(tokens[start:end])
+            entry = self.lexicon.get(head) if head else None
+            if entry:
+                con = entry.get("conlang", "") or ""
+                pos = (entry.get("pos", "") or "").lower()
+            else:
+                con = f"[{tok}]"
+                pos = ""
+
+            # Prefixes/Suffixes from the compiled grammar
+            con = self.grammar.affix(con, pos)
+
+            # Conjugations by tense (only for verbs)
+            if pos == "verb":
+                con = self.conj_index.conjugate(con, tok, self.tense)
+
+            yield tok, con, entry is not None
+
+    def _translate_line(self, text):
+        words, unknown = [], []
+        for tok, con, known in self.translate_units(text):
+            words.append(con)
+            if not known:
+                unknown.append(tok.lower())
+        return [" ".join(words), len(words), unknown]
+
+    def translate_line(self, text):
+        """[conlang text, unit count, unknown English units] for text."""
+        return self._cached(text, TO_CONLANG, self.tense, self._translate_line)
+
+    def translate(self, text):
+        return self.translate_line(text)[0]
+
+    # -------------------------
+    # Conlang -> English
+    # -------------------------
+
+    def fuzzy_english(self, word):
+        """
+        English for a conlang word with no exact match: the closest conlang
+        form or pronunciation within a small edit distance, marked "~"; else "[word]".
+        """
+        hit = self.lexicon.fuzzy_index().best(word, distance_for(word))
+        if hit is None:
+            return f"[{word}]"
+        return "~" + sorted(hit[2])[0]
+
+    def _reverse_line(self, text):
+        # Longest conlang phrase first, homographs shown as alternatives ("a/b")
+        words = text.lower().split()
+        out, unknown = [], []
+        for start, end, heads in self.lexicon.scan_conlang(words):
+            if not heads:
+                w = words[start]
+                heads = self.lexicon.english_for_pronunciation(w)
+                if not heads:
+                    out.append(self.fuzzy_english(w))
+                    unknown.append(w)
+                    continue
+            out.append("/".join(heads))
+        return [" ".join(out), len(out), unknown]
+
+    def reverse_line(self, text):
+        """[English text, unit count, unmatched conlang words] for text."""
+        return self._cached(text, TO_ENGLISH, "", self._reverse_line)
+
+    def reverse(self, text):
+        return self.reverse_line(text)[0]
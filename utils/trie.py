@@ -0,0 +1,84 @@
+# utils/trie.py
+
+_END = object()  # marks a node that terminates a key
+
+
+class LongestMatchTrie:
+    """
+    Prefix trie over sequences (strings, or tuples of tokens) that finds
+    the longest key starting at a given position in one walk.
+    """
+
+    def __init__(self, items=None):
+        self.root = {}
+        self.max_len = 0
+        self._count = 0
+        if items:
+            for key, value in items:
+                self.insert(key, value)
+
+    def __len__(self):
+        return self._count
+
+    def insert(self, key, value, overwrite=False):
+        """Add a key; an existing key keeps its first value unless overwrite is set."""
+        if not key:
+            return
+        node = self.root
+        for part in key:
+            node = node.setdefault(part, {})
+        if _END in node and not overwrite:
+            return
+        if _END not in node:
+            self._count += 1
+        node[_END] = value
+        self.max_len = max(self.max_len, len(key))
+
+    def remove(self, key):
+        """Drop a key (and any branch left empty). max_len stays an upper bound."""
+        path = []
+        node = self.root
+        for part in key:
+            nxt = node.get(part)
+            if nxt is None:
+                return False
+            path.append((node, part))
+            node = nxt
+        if _END not in node:
+            return False
+        del node[_END]
+        self._count -= 1
+        for parent, part in reversed(path):
+            if parent[part]:
+                break
+            del parent[part]
+        return True
+
+    def longest_match(self, seq, start=0):
+        """Return (length, value) of the longest key at seq[start:], or (0, None)."""
+        node = self.root
+        best_len, best_val = 0, None
+        i, n = start, len(seq)
+        while i < n:
+            node = node.get(seq[i])
+            if node is None:
+                break
+            i += 1
+            if _END in node:
+                best_len, best_val = i - start, node[_END]
+        return best_len, best_val
+
+    def scan(self, seq):
+        """
+        Yield (start, end, value) left to right, taking the longest match at
+        each position; positions with no match yield value None for one item.
+        """
+        i, n = 0, len(seq)
+        while i < n:
+            length, value = self.longest_match(seq, i)
+            if length:
+                yield i, i + length, value
+                i += length
+            else:
+                yield i, i + 1, None
+                i += 1
@@ -0,0 +1,253 @@
+# utils/virtual_tree.py
+import itertools
+from tkinter import ttk
+
+
+class VirtualTreeview(ttk.Treeview):
+    """
+    ttk.Treeview backed by an in-memory row store that only keeps the
+    visible window of rows as real Treeview items. Rows are materialized
+    on scroll, so loading and redrawing cost the same for 1k or 200k rows.
+
+    Each row has a stable key; the Treeview iid of a materialized row is
+    str(key). Setting an item's values (e.g. from enable_treeview_editing)
+    writes through to the store and calls on_row_changed(key, old, new).
+    set_filter(keys) narrows the displayed rows without touching the store.
+    <<WindowRefresh>> is generated (synchronously) just before the window's
+    items are rebuilt, so a cell editor can commit while its iid still exists.
+    Pass yscrollcommand=scrollbar.set and command=tree.yview as usual.
+    """
+
+    def __init__(self, master=None, formatter=None, **kw):
+        self._yscroll = kw.pop("yscrollcommand", None)
+        super().__init__(master, **kw)
+        self.formatter = formatter      # values -> displayed values, visible rows only
+        self.on_row_changed = None
+        self.rows = []                  # row values, in display order
+        self.keys = []                  # stable row key per position
+        self._pos = {}                  # key -> position
+        self._next_key = itertools.count()
+        self._window = []               # keys currently materialized
+        self._selected = set()          # selected keys, kept across scrolling
+        self._filter = None             # keys to display, or None for all rows
+        self._view = None               # cached filtered key list (store order)
+        self.offset = 0
+        self.page_size = int(kw.get("height", 20))
+
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind(seq, self._on_wheel)
+        self.bind("<Up>", lambda e: self._on_arrow(-1))
+        self.bind("<Down>", lambda e: self._on_arrow(1))
+        self.bind("<Prior>", lambda e: self.yview("scroll", -1, "pages") or "break")
+        self.bind("<Next>", lambda e: self.yview("scroll", 1, "pages") or "break")
+        self.bind("<Configure>", self._on_configure, add="+")
+
+    # -------------------------
+    # Row store
+    # -------------------------
+
+    def set_rows(self, rows, keys=None):
+        """Replace the whole row store and redraw from the top."""
+        self.rows = [tuple(r) for r in rows]
+        self.keys = list(keys) if keys is not None else [next(self._next_key) for _ in self.rows]
+        self._pos = {k: i for i, k in enumerate(self.keys)}
+        self._next_key = itertools.count(max(self.keys, default=-1) + 1)
+        self._selected.clear()
+        self._filter = None
+        self._view = None
+        self.offset = 0
+        self.refresh()
+
+    def append_row(self, values, key=None):
+        if key is None:
+            key = next(self._next_key)
+        self._pos[key] = len(self.rows)
+        self.rows.append(tuple(values))
+        self.keys.append(key)
+        if self._filter is not None:
+            self._filter.add(key)  # new rows stay visible under a filter
+            self._view = None
+        self.refresh()
+        return key
+
+    def delete_row(self, key):
+        pos = self._pos.get(key)
+        if pos is None:
+            return
+        del self.rows[pos]
+        del self.keys[pos]
+        self._pos = {k: i for i, k in enumerate(self.keys)}
+        self._selected.discard(key)
+        if self._filter is not None:
+            self._filter.discard(key)
+            self._view = None
+        self.refresh()
+
+    def row(self, key):
+        return self.rows[self._pos[key]]
+
+    def set_row(self, key, values):
+        """Update a row in the store without firing on_row_changed."""
+        pos = self._pos[key]
+        self.rows[pos] = tuple(values)
+        if key in self._window:
+            super().item(str(key), values=self._display(self.rows[pos]))
+
+    def iter_rows(self):
+        """Yield (key, values) for every row in the store."""
+        return zip(self.keys, self.rows)
+
+    def key_of(self, iid):
+        """Row key of a materialized Treeview item."""
+        return int(iid)
+
+    def set_filter(self, keys=None):
+        """Show only the rows whose key is in keys (None shows every row)."""
+        self._sync_selection()
+        self._filter = set(keys) if keys is not None else None
+        self._view = None
+        self.offset = 0
+        self.refresh()
+
+    def view_keys(self):
+        """Keys of the displayed rows, in display order."""
+        if self._filter is None:
+            return self.keys
+        if self._view is None:
+            self._view = [k for k in self.keys if k in self._filter]
+        return self._view
+
+    def selected_keys(self):
+        self._sync_selection()
+        return [k for k in self.keys if k in self._selected]
+
+    def see_row(self, key):
+        pos = self._view_pos(key)
+        if pos is None:
+            return
+        if pos < self.offset or pos >= self.offset + self.page_size:
+            self.offset = pos
+            self.refresh()
+
+    # -------------------------
+    # Treeview overrides
+    # -------------------------
+
+    def item(self, item, option=None, **kw):
+        if "values" in kw and self._pos.get(self._maybe_key(item)) is not None:
+            key = self.key_of(item)
+            pos = self._pos[key]
+            old = self.rows[pos]
+            self.rows[pos] = tuple(kw["values"])
+            kw["values"] = self._display(self.rows[pos])
+            result = super().item(item, option, **kw)
+            if self.on_row_changed:
+                self.on_row_changed(key, old, self.rows[pos])
+            return result
+        return super().item(item, option, **kw)
+
+    def yview(self, *args):
+        total = len(self.view_keys())
+        if not args:
+            return self._fractions()
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= max(1, self.page_size - 1)
+            self.offset += step
+        self.refresh()
+
+    # -------------------------
+    # Window materialization
+    # -------------------------
+
+    def refresh(self):
+        """Rebuild the Treeview items for the current window of rows."""
+        if self._window:
+            self.event_generate("<<WindowRefresh>>")
+        view = self.view_keys()
+        total = len(view)
+        self.offset = max(0, min(self.offset, total - self.page_size))
+        self._sync_selection()
+
+        if self._window:
+            super().delete(*[str(k) for k in self._window])
+        end = min(total, self.offset + self.page_size)
+        self._window = view[self.offset:end]
+        for key in self._window:
+            super().insert("", "end", iid=str(key), values=self._display(self.rows[self._pos[key]]))
+
+        visible_sel = [str(k) for k in self._window if k in self._selected]
+        if visible_sel:
+            self.selection_set(visible_sel)
+        if self._yscroll:
+            self._yscroll(*self._fractions())
+
+    def _display(self, values):
+        return self.formatter(values) if self.formatter else values
+
+    def _fractions(self):
+        total = len(self.view_keys())
+        if not total:
+            return 0.0, 1.0
+        return self.offset / total, min(1.0, (self.offset + self.page_size) / total)
+
+    def _view_pos(self, key):
+        if self._filter is None:
+            return self._pos.get(key)
+        try:
+            return self.view_keys().index(key)
+        except ValueError:
+            return None
+
+    def _maybe_key(self, iid):
+        try:
+            return int(iid)
+        except (TypeError, ValueError):
+            return None
+
+    def _sync_selection(self):
+        visible = set(self._window)
+        current = {self.key_of(i) for i in self.selection()}
+        self._selected = (self._selected - visible) | current
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or event.delta > 0:
+            self.yview("scroll", -3, "units")
+        else:
+            self.yview("scroll", 3, "units")
+        return "break"
+
+    def _on_arrow(self, step):
+        focus = self.focus()
+        if not focus or not self._window:
+            return None
+        pos = self._view_pos(self.key_of(focus))
+        if pos is None:
+            return None
+        view = self.view_keys()
+        new = pos + step
+        if new < 0 or new >= len(view):
+            return "break"
+        if self.offset <= new < self.offset + self.page_size:
+            return None  # default Treeview navigation inside the window
+        self.selection_remove(self.selection())
+        self._selected = {view[new]}
+        self.offset += step
+        self.refresh()
+        self.focus(str(view[new]))
+        return "break"
+
+    def _on_configure(self, event):
+        if not self._window:
+            return
+        bbox = self.bbox(str(self._window[0]))
+        if not bbox:
+            return
+        _, y0, _, row_h = bbox
+        fit = max(1, (event.height - y0) // max(1, row_h))
+        if fit != self.page_size:
+            self.page_size = fit
+            self.refresh()
@@ -1,15 +1,18 @@
 # widgets/compare_tab.py
 import os
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from PIL import Image, ImageTk
 from constants import FONTS_DIRNAME
 
 
 
 from utils.file_io import load_csv
+from utils.lexicon import get_lexicon
+from utils.virtual_tree import VirtualTreeview
+from utils.conjugations import TENSES
+from utils.batch_translate import translate_lines
 from constants import (
-    DICT_FILE, DICT_FIELDS,
     PHONO_FILE, PHONO_FIELDS,
     GRAMMAR_TEXT,
     NUMBERS_FILE,
@@ -46,7 +49,7 @@ def build_compare_tab(app):
 
     # Translation
     frame_trans = ttk.Frame(subnb); subnb.add(frame_trans, text="Translation")
-    build_translation_compare(frame_trans)
+    build_translation_compare(frame_trans, app)
 
 
 # -------------------------
@@ -78,21 +81,15 @@ def build_dict_compare(frame):
         dict_a = load_lang_dict(la)
         dict_b = load_lang_dict(lb)
         tree.delete(*tree.get_children())
-        all_eng = sorted(set(dict_a.keys()) | set(dict_b.keys()))
+        all_eng = sorted(set(dict_a.entries) | set(dict_b.entries))
         for eng in all_eng:
-            tree.insert("", "end", values=(eng, dict_a.get(eng,""), dict_b.get(eng,"")))
+            tree.insert("", "end", values=(eng, dict_a.conlang_for(eng), dict_b.conlang_for(eng)))
     ttk.Button(top, text="Compare", command=compare).pack(side="left", padx=6)
 
 
 def load_lang_dict(lang):
-    path = os.path.join(LANG_ROOT, lang, DICT_FILE)
-    rows = load_csv(path, DICT_FIELDS)
-    d = {}
-    for r in rows:
-        eng = (r.get("english") or "").strip().lower()
-        if eng:
-            d[eng] = r.get("conlang","")
-    return d
+    """The language's Lexicon, cached until its dictionary files change."""
+    return get_lexicon(lang)
 
 
 # -------------------------
@@ -275,53 +272,128 @@ def make_thumbnail(path):
         return None
 
 
-def build_translation_compare(frame):
-    top = ttk.Frame(frame); top.pack(fill="x", padx=6, pady=6)
-
-    ttk.Label(top, text="Language A:").pack(side="left")
-    lang_a = ttk.Combobox(top, values=get_languages(), width=20); lang_a.pack(side="left", padx=4)
-
-    ttk.Label(top, text="Language B:").pack(side="left")
-    lang_b = ttk.Combobox(top, values=get_languages(), width=20); lang_b.pack(side="left", padx=4)
+COMPARE_CHUNK_LINES = 200     # lines per process-pool job
+COMPARE_MAX_LINES = 20000     # lines of a file shown side by side
 
-    ttk.Label(top, text="English Input:").pack(side="left", padx=(12,0))
-    input_entry = tk.Entry(top, width=40); input_entry.pack(side="left", padx=4)
 
-    ttk.Button(top, text="Compare Translation",
-               command=lambda: compare()).pack(side="left", padx=6)
+def build_translation_compare(frame, app):
+    top = ttk.Frame(frame); top.pack(fill="x", padx=6, pady=6)
 
-    # Output text areas
+    ttk.Label(top, text="Languages:").pack(side="left", anchor="n")
+    langs_box = tk.Listbox(top, selectmode="multiple", exportselection=False, height=5, width=22)
+    langs_box.pack(side="left", padx=4)
+    for lang in get_languages():
+        langs_box.insert(tk.END, lang)
+
+    side = ttk.Frame(top); side.pack(side="left", fill="x", expand=True, padx=(12, 0))
+    row = ttk.Frame(side); row.pack(fill="x")
+    ttk.Label(row, text="English Input:").pack(side="left")
+    ttk.Label(row, text="Tense:").pack(side="left", padx=(12, 0))
+    tense_var = tk.StringVar(value="present")
+    ttk.Combobox(row, textvariable=tense_var, values=list(TENSES), width=10,
+                 state="readonly").pack(side="left", padx=4)
+    status = ttk.Label(row, text=""); status.pack(side="left", padx=8)
+    input_text = tk.Text(side, height=3, wrap="word",
+                         bg="#1b1b1b", fg="#eaeaea", insertbackground="white")
+    input_text.pack(fill="x", pady=4)
+    btns = ttk.Frame(side); btns.pack(fill="x")
+    ttk.Button(btns, text="Compare Translation",
+               command=lambda: compare_phrase()).pack(side="left")
+    ttk.Button(btns, text="Compare File…",
+               command=lambda: compare_file()).pack(side="left", padx=6)
+
+    # Results: one row per input line, one column per language
     out_frame = ttk.Frame(frame); out_frame.pack(fill="both", expand=True, padx=6, pady=6)
-    text_a = tk.Text(out_frame, height=8, wrap="word",
-                     bg="#1b1b1b", fg="#eaeaea", insertbackground="white")
-    text_b = tk.Text(out_frame, height=8, wrap="word",
-                     bg="#1b1b1b", fg="#eaeaea", insertbackground="white")
-    text_a.pack(side="left", fill="both", expand=True, padx=4)
-    text_b.pack(side="left", fill="both", expand=True, padx=4)
-
-    def compare():
-        la, lb = lang_a.get(), lang_b.get()
-        phrase = input_entry.get().strip().lower()
-        if not la or not lb or la == lb:
-            messagebox.showwarning("Select", "Choose two different languages.")
+    scroll = ttk.Scrollbar(out_frame, orient="vertical")
+    scroll.pack(side="right", fill="y")
+    state = {"langs": [], "results": {}, "jobs": [], "pending": 0}
+
+    def display(vals):
+        i, english = vals
+        return (english,) + tuple(state["results"][lang].get(i, "…") for lang in state["langs"])
+
+    tree = VirtualTreeview(out_frame, show="headings", height=16,
+                           yscrollcommand=scroll.set, formatter=display)
+    tree.pack(side="left", fill="both", expand=True)
+    scroll.configure(command=tree.yview)
+
+    def selected_languages():
+        langs = [langs_box.get(i) for i in langs_box.curselection()]
+        if not langs:
+            messagebox.showwarning("Select", "Choose one or more languages.")
+        return langs
+
+    def compare_phrase():
+        langs = selected_languages()
+        lines = [l.strip() for l in input_text.get("1.0", tk.END).splitlines() if l.strip()]
+        if langs and lines:
+            run(langs, lines)
+
+    def compare_file():
+        langs = selected_languages()
+        if not langs:
             return
-        if not phrase:
+        path = filedialog.askopenfilename(title="English text to compare",
+                                          filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if not path:
             return
-
-        # Load dictionaries
-        dict_a = load_lang_dict(la)
-        dict_b = load_lang_dict(lb)
-
-        # Translate word by word
-        def translate(phrase, d):
-            words = phrase.split()
-            out = []
-            for w in words:
-                out.append(d.get(w, f"[{w}]"))
-            return " ".join(out)
-
-        trans_a = translate(phrase, dict_a)
-        trans_b = translate(phrase, dict_b)
-
-        text_a.delete("1.0", tk.END); text_a.insert(tk.END, f"{la}:\n{trans_a}")
-        text_b.delete("1.0", tk.END); text_b.insert(tk.END, f"{lb}:\n{trans_b}")
+        lines = []
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if len(lines) >= COMPARE_MAX_LINES:
+                    messagebox.showinfo("Compare", f"Showing the first {COMPARE_MAX_LINES} lines.")
+                    break
+                lines.append(line.rstrip("\r\n"))
+        if lines:
+            run(langs, lines)
+
+    def run(langs, lines):
+        """Translate lines into every language at once, one process-pool job per language and chunk."""
+        for job in state["jobs"]:
+            job.cancel()
+        # workers read languages from disk: write out pending edits of the open one first
+        if app.current_language in langs:
+            from widgets.dictionary_tab import flush_dictionary_changes
+            flush_dictionary_changes(app)
+            app.autosave.flush()
+
+        tense = tense_var.get()
+        state.update(langs=langs, results={lang: {} for lang in langs}, jobs=[])
+        tree["columns"] = ("english",) + tuple(f"lang{i}" for i in range(len(langs)))
+        tree.heading("english", text="English")
+        tree.column("english", width=220)
+        for i, lang in enumerate(langs):
+            tree.heading(f"lang{i}", text=lang)
+            tree.column(f"lang{i}", width=200)
+        tree.set_rows(list(enumerate(lines)))
+
+        chunks = [(start, lines[start:start + COMPARE_CHUNK_LINES])
+                  for start in range(0, len(lines), COMPARE_CHUNK_LINES)]
+        state["pending"] = len(chunks) * len(langs)
+        status.configure(text="Translating…")
+        for lang in langs:
+            for start, chunk in chunks:
+                state["jobs"].append(app.executor.submit_process(
+                    translate_lines, lang, tense, chunk,
+                    on_done=lambda res, lang=lang, start=start: chunk_done(lang, start, res),
+                    on_error=lambda err, lang=lang: chunk_failed(lang, err)))
+
+    def chunk_done(lang, start, results):
+        column = state["results"][lang]
+        for i, (out, _, _) in enumerate(results, start):
+            column[i] = out
+        finish_one()
+
+    def chunk_failed(lang, err):
+        for job in state["jobs"]:
+            job.cancel()
+        state["pending"] = 0
+        status.configure(text="")
+        messagebox.showerror("Compare", f"Translating into {lang} failed:\n{err}")
+
+    def finish_one():
+        state["pending"] -= 1
+        tree.refresh()
+        if state["pending"] <= 0:
+            state["jobs"] = []
+            status.configure(text=f"{len(tree.rows)} lines × {len(state['langs'])} languages")
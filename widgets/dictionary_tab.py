@@ -5,6 +5,15 @@ import tkinter as tk
 
 from utils.file_io import load_csv, save_csv, ensure_language_dir
 from utils.audio_utils import play_audio_file
+from utils.consistency import get_consistency_engine
+from utils.ipa_segmenter import get_ipa_audio_files, get_pronunciation_segmenter
+from utils.virtual_tree import VirtualTreeview
+from utils.dict_store import STORE_FIELDS, open_dictionary_store
+from utils.dict_journal import DictionaryJournal
+from utils.text_index import InvertedIndex
+from utils.fuzzy import distance_for
+from utils.conjugations import set_conjugations
+from utils.lexicon import Lexicon
 from constants import DICT_FILE, DICT_FIELDS, CONJ_FILE, CONJ_FIELDS, GRAMMAR_TEXT
 
 
@@ -23,10 +32,34 @@ def build_dictionary_tab(app):
     ttk.Button(ctrl, text="Recheck Consistency", command=lambda: recheck_consistency(app)).pack(side="left", padx=4)
     ttk.Button(ctrl, text="Auto-sync Conjugations", command=lambda: sync_conjugations_with_dictionary(app)).pack(side="left", padx=4)
     ttk.Button(ctrl, text="Play Pronunciation (selected)", command=lambda: play_selected_pronunciation(app)).pack(side="left", padx=6)
+    ttk.Button(ctrl, text="Convert to SQLite", command=lambda: convert_dictionary_to_sqlite(app)).pack(side="left", padx=4)
+    ttk.Button(ctrl, text="Export CSV", command=lambda: export_dictionary_csv(app)).pack(side="left", padx=4)
+
+    # Search-as-you-type over english/conlang/definition (see utils/text_index.py)
+    search = ttk.Frame(tab)
+    search.pack(fill="x", padx=6)
+    ttk.Label(search, text="Search:").pack(side="left")
+    app.dict_index = InvertedIndex()
+    app.dict_search_var = tk.StringVar()
+    app.dict_search_var.trace_add("write", lambda *_: apply_dictionary_filter(app))
+    ttk.Entry(search, textvariable=app.dict_search_var, width=40).pack(side="left", padx=6)
+    ttk.Button(search, text="Clear", command=lambda: app.dict_search_var.set("")).pack(side="left")
+    # "Did you mean" suggestions from the fuzzy conlang/pronunciation index when nothing matches
+    app.dict_suggest_label = ttk.Label(search, text="", foreground="lightblue", cursor="hand2")
+    app.dict_suggest_label.pack(side="left", padx=8)
+    app.dict_suggest_label.bind("<Button-1>", lambda e: accept_dictionary_suggestion(app))
+    app.dict_suggestion = None
 
-    
     cols = ("english","conlang","pos","gender","definition","pronunciation","loanword","cons_phon","cons_spell")
-    app.dict_tree = ttk.Treeview(tab, columns=cols, show="headings", height=20)
+    # Only the visible window of rows exists as Treeview items (see utils/virtual_tree.py)
+    table = ttk.Frame(tab)
+    table.pack(fill="both", expand=True, padx=6, pady=6)
+    scroll = ttk.Scrollbar(table, orient="vertical")
+    app.dict_tree = VirtualTreeview(table, columns=cols, show="headings", height=20,
+                                    yscrollcommand=scroll.set,
+                                    formatter=lambda vals: with_consistency(app, vals))
+    scroll.configure(command=app.dict_tree.yview)
+    app.dict_tree.on_row_changed = lambda key, old, new: on_dict_row_changed(app, key, old, new)
 
     headers = [
         ("english","English"),("conlang","Conlang"),("pos","Part of Speech"),
@@ -40,9 +73,10 @@ def build_dictionary_tab(app):
     for (col,txt),w in zip(headers,widths):
         app.dict_tree.heading(col, text=txt)
         app.dict_tree.column(col, width=w)
-    app.dict_tree.pack(fill="both", expand=True, padx=6, pady=6)
+    scroll.pack(side="right", fill="y")
+    app.dict_tree.pack(side="left", fill="both", expand=True)
     from utils.table_edit import enable_treeview_editing
-    enable_treeview_editing(app.dict_tree, save_callback=save_dictionary, app=app)
+    enable_treeview_editing(app.dict_tree, save_callback=autosave_dictionary, app=app)
 
 # -------------------------
 # Helper functions
@@ -58,26 +92,28 @@ def load_dictionary(app, lang):
     app.current_language = lang
     app.title(f"Conlang Assistant - {lang}")
     langdir = ensure_language_dir(lang)
-    rows = load_csv(os.path.join(langdir, DICT_FILE), DICT_FIELDS)
-    app.dictionary = {}
-    for r in rows:
+
+    # SQLite store if the language has been converted, else dictionary.csv + journal
+    close_dictionary(app)
+    app.dict_store = open_dictionary_store(langdir)
+    if app.dict_store:
+        keyed = app.dict_store.all_rows()
+    else:
+        app.dict_journal = DictionaryJournal(langdir)
+        keyed = [(None, r) for r in app.dict_journal.load_rows()]
+
+    # app.dictionary is the lexicon's headword table; edits go through app.lexicon
+    app.lexicon = Lexicon()
+    for key, r in keyed:
         eng = (r.get("english") or "").strip()
         if not eng:
             continue
-        app.dictionary[eng.lower()] = {
-            "conlang": r.get("conlang",""),
-            "pos": r.get("pos",""),
-            "gender": r.get("gender",""),
-            "definition": r.get("definition",""),
-            "pronunciation": r.get("pronunciation",""),
-            "loanword": r.get("loanword","NO"),   # default NO
-            "consistent_phon": r.get("consistent_phon",""),
-            "consistent_spell": r.get("consistent_spell","")
-        }
+        app.lexicon.put(eng.lower(), entry_from_record(r, key))
+    app.dictionary = app.lexicon.entries
 
     # load conjugations too
     conj_path = os.path.join(langdir, CONJ_FILE)
-    app.conjugations = load_csv(conj_path, CONJ_FIELDS) if os.path.exists(conj_path) else []
+    set_conjugations(app, load_csv(conj_path, CONJ_FIELDS) if os.path.exists(conj_path) else [])
 
     # load grammar text if present
     gf = os.path.join(langdir, GRAMMAR_TEXT)
@@ -88,28 +124,102 @@ def load_dictionary(app, lang):
 
     update_dict_table(app)
 
+def entry_from_record(r, key=None):
+    """Build an app.dictionary entry from a STORE_FIELDS row (key = SQLite row id)."""
+    entry = {
+        "conlang": r.get("conlang",""),
+        "pos": r.get("pos",""),
+        "gender": r.get("gender",""),
+        "definition": r.get("definition",""),
+        "pronunciation": r.get("pronunciation",""),
+        "loanword": r.get("loanword") or "NO",   # default NO
+        "consistent_phon": r.get("consistent_phon",""),
+        "consistent_spell": r.get("consistent_spell","")
+    }
+    if key is not None:
+        entry["id"] = key
+    return entry
+
+
+def record_from_values(vals):
+    """Turn a 9-column dictionary table row into a STORE_FIELDS dict."""
+    eng, con, pos, gen, defi, pron, loan, phon_cons, spell_cons = vals
+    return {
+        "english": eng, "conlang": con, "pos": pos, "gender": gen,
+        "definition": defi, "pronunciation": pron,
+        "loanword": loan,
+        "consistent_phon": phon_cons, "consistent_spell": spell_cons
+    }
+
+
+def record_from_entry(eng, data):
+    return dict(english=eng, **{k: data.get(k, "") for k in STORE_FIELDS if k != "english"})
+
+
 def update_dict_table(app):
-    app.dict_tree.delete(*app.dict_tree.get_children())
-    for eng, data in app.dictionary.items():
-        pron = data["pronunciation"]
-        conlang = data["conlang"]
-        loan = data.get("loanword","NO")
+    # consistency columns are filled in by with_consistency() as rows become visible
+    rows = [
+        (eng, data["conlang"], data["pos"], data["gender"],
+         data["definition"], data["pronunciation"], data.get("loanword","NO"),
+         data.get("consistent_phon",""), data.get("consistent_spell",""))
+        for eng, data in app.dictionary.items()
+    ]
+    keys = [data.get("id") for data in app.dictionary.values()]
+    app.dict_tree.set_rows(rows, keys=None if None in keys else keys)
+    app.dict_index.rebuild((key, index_texts(vals)) for key, vals in app.dict_tree.iter_rows())
+    apply_dictionary_filter(app)
+
+
+def index_texts(vals):
+    """The fields of a dictionary row that the search box looks at."""
+    return (vals[0], vals[1], vals[4])  # english, conlang, definition
+
+
+def apply_dictionary_filter(app):
+    """Narrow the table to rows matching the search box (all rows when it is empty)."""
+    query = app.dict_search_var.get()
+    keys = app.dict_index.search(query)
+    app.dict_tree.set_filter(keys)
+    show_dictionary_suggestion(app, query if keys is not None and not keys else "")
+
 
-        # recompute consistency
-        phon_cons = "PASS" if check_phonology_consistency(app, pron) else "FAIL"
-        spell_cons = "PASS" if check_spelling_consistency(app, conlang, pron) else "FAIL"
+def show_dictionary_suggestion(app, query):
+    """Offer the nearest conlang form or pronunciation for a query that found nothing."""
+    app.dict_suggestion = None
+    words = query.split()
+    if len(words) == 1 and app.current_language:
+        hits = app.lexicon.fuzzy_index().lookup(words[0], distance_for(words[0]), limit=3)
+        if hits:
+            app.dict_suggestion = sorted(hits[0][2])[0]
+            shown = ", ".join(f"{term} ({'/'.join(sorted(eng))})" for _, term, eng in hits)
+            app.dict_suggest_label.configure(text=f"Did you mean: {shown}?")
+            return
+    app.dict_suggest_label.configure(text="")
 
-        app.dict_tree.insert("", "end", values=(
-            eng, conlang, data["pos"], data["gender"],
-            data["definition"], pron, loan,
-            phon_cons, spell_cons
-        ))
+
+def accept_dictionary_suggestion(app):
+    if app.dict_suggestion:
+        app.dict_search_var.set(app.dict_suggestion)
+
+
+def with_consistency(app, vals):
+    """Return a dictionary row with its consistency columns recomputed."""
+    if not app.current_language:
+        return vals
+    eng, con, pos, gen, defi, pron, loan = vals[:7]
+    phon_cons, spell_cons = get_consistency_engine(app.current_language).check_row(con, pron)
+    return (eng, con, pos, gen, defi, pron, loan, phon_cons, spell_cons)
 
 
 def add_word(app):
-    # 8 columns: english, conlang, pos, gender, definition, pronunciation, consistent_phon, consistent_spell
-    empty = ("NEW", "", "", "", "", "", "", "")
-    app.dict_tree.insert("", "end", values=empty)
+    # 9 columns: english, conlang, pos, gender, definition, pronunciation, loanword, cons_phon, cons_spell
+    empty = ("NEW", "", "", "", "", "", "NO", "", "")
+    key = app.dict_store.insert(record_from_values(empty)) if app.dict_store else None
+    key = app.dict_tree.append_row(empty, key=key)
+    app.dict_index.add(key, index_texts(empty))
+    if not app.dict_store:
+        app.dict_dirty[key] = None  # journalled as a new row on the next save
+    app.dict_tree.see_row(key)
     
 
 def add_word_button(app):
@@ -121,23 +231,44 @@ def add_word_button(app):
     gen = simpledialog.askstring("Gender", "Gender:")
     defi = simpledialog.askstring("Definition", "Definition:")
     pron = simpledialog.askstring("Pronunciation", "Pronunciation:")
-    app.dictionary[eng.lower()] = {
+    flush_dictionary_changes(app)
+    data = {
         "conlang": con or "", "pos": pos or "", "gender": gen or "",
         "definition": defi or "", "pronunciation": pron or "",
         "consistent_phon": "", "consistent_spell": ""
     }
-    save_dictionary(app)
-    update_dict_table(app)
+    existing = app.dictionary.get(eng.lower())
+    if app.dict_store:
+        if existing is not None and "id" in existing:
+            # same headword: overwrite its row rather than adding a duplicate
+            data["id"] = existing["id"]
+            app.dict_store.update(data["id"], record_from_entry(eng, data))
+        else:
+            data["id"] = app.dict_store.insert(record_from_entry(eng, data))
+    if existing is not None:
+        app.lexicon.put(eng.lower(), data)
+        update_dict_table(app)  # replaces an existing headword's row
+    else:
+        app.lexicon.put(eng.lower(), data)
+        vals = (eng, data["conlang"], data["pos"], data["gender"], data["definition"],
+                data["pronunciation"], "NO", "", "")
+        key = app.dict_tree.append_row(vals, key=data.get("id"))
+        app.dict_index.add(key, index_texts(vals))
+        app.dict_tree.see_row(key)
+    if app.dict_journal:
+        app.dict_journal.put(eng, record_from_entry(eng, data))
+        app.dict_journal.flush()
 
 def edit_word_button(app):
     sel = app.dict_tree.selection()
     if not sel:
         messagebox.showwarning("Select", "Select a word to edit")
         return
+    flush_dictionary_changes(app)
     item = sel[0]
     vals = app.dict_tree.item(item, "values")
     eng = vals[0]
-    data = app.dictionary.get(eng.lower(), {})
+    data = dict(app.dictionary.get(eng.lower(), {}))
     con = simpledialog.askstring("Conlang", "Conlang word:", initialvalue=data.get("conlang",""))
     if con is None: return
     data["conlang"] = con
@@ -145,9 +276,17 @@ def edit_word_button(app):
     data["gender"] = simpledialog.askstring("Gender", "Gender:", initialvalue=data.get("gender","")) or ""
     data["definition"] = simpledialog.askstring("Definition", "Definition:", initialvalue=data.get("definition","")) or ""
     data["pronunciation"] = simpledialog.askstring("Pronunciation", "Pronunciation:", initialvalue=data.get("pronunciation","")) or ""
-    app.dictionary[eng.lower()] = data
-    save_dictionary(app)
-    update_dict_table(app)
+    app.lexicon.put(eng.lower(), data)
+    key = app.dict_tree.key_of(item)
+    new = (vals[0], data["conlang"], data["pos"], data["gender"], data["definition"],
+           data["pronunciation"]) + tuple(vals[6:7]) + ("", "")
+    app.dict_tree.set_row(key, new)
+    app.dict_index.update(key, index_texts(new))
+    if app.dict_store and "id" in data:
+        app.dict_store.update(data["id"], record_from_entry(eng, data))
+    elif app.dict_journal:
+        app.dict_journal.put(eng, record_from_entry(eng, data))
+        app.dict_journal.flush()
 
 def delete_word_button(app):
     sel = app.dict_tree.selection()
@@ -157,26 +296,128 @@ def delete_word_button(app):
     item = sel[0]
     eng = app.dict_tree.item(item, "values")[0]
     if messagebox.askyesno("Delete", f"Delete word '{eng}'?"):
-        app.dictionary.pop(eng.lower(), None)
-        save_dictionary(app)
-        update_dict_table(app)
+        flush_dictionary_changes(app)
+        key = app.dict_tree.key_of(item)
+        app.lexicon.pop(eng.lower())
+        if app.dict_store:
+            app.dict_store.delete(key)
+        elif app.dict_journal:
+            app.dict_journal.delete(eng)
+            app.dict_journal.flush()
+        app.dict_tree.delete_row(key)
+        app.dict_index.remove(key)
 
 def save_dictionary(app):
     if not app.current_language:
         return
+    engine = get_consistency_engine(app.current_language)
     rows = []
-    for iid in app.dict_tree.get_children():
-        eng, con, pos, gen, defi, pron, loan, _, _ = app.dict_tree.item(iid, "values")
-        phon_cons = "PASS" if check_phonology_consistency(app, pron) else "FAIL"
-        spell_cons = "PASS" if check_spelling_consistency(app, con, pron) else "FAIL"
-        rows.append({
+    for key, vals in app.dict_tree.iter_rows():
+        eng, con, pos, gen, defi, pron, loan, _, _ = vals
+        phon_cons, spell_cons = engine.check_row(con, pron)
+        rows.append((key, {
             "english": eng, "conlang": con, "pos": pos, "gender": gen,
             "definition": defi, "pronunciation": pron,
             "loanword": loan,
             "consistent_phon": phon_cons, "consistent_spell": spell_cons
-        })
+        }))
+    app.dict_dirty.clear()
+    if app.dict_store:
+        with app.dict_store.batch():
+            for key, row in rows:
+                app.dict_store.update(key, row)
+        return
+    langdir = ensure_language_dir(app.current_language)
+    save_csv(os.path.join(langdir, DICT_FILE), DICT_FIELDS, [row for _, row in rows])
+    if app.dict_journal:
+        app.dict_journal.reset()
+
+
+def autosave_dictionary(app):
+    """Save after a cell edit: only the rows marked dirty are written."""
+    flush_dictionary_changes(app)
+
+
+def on_dict_row_changed(app, key, old, new):
+    """Re-check an edited table row, sync app.dictionary and mark the row dirty."""
+    new = with_consistency(app, new)
+    app.dict_tree.set_row(key, new)
+    app.dict_index.update(key, index_texts(new))
+    rec = record_from_values(new)
+
+    old_eng = (old[0] or "").strip().lower()
+    eng = (rec["english"] or "").strip().lower()
+    if old_eng != eng:
+        app.lexicon.pop(old_eng)
+    if eng:
+        app.lexicon.put(eng, entry_from_record(rec, key if app.dict_store else None))
+    # remember the headword the row had when it was last saved
+    app.dict_dirty.setdefault(key, old[0])
+
+
+def flush_dictionary_changes(app, compact=False):
+    """
+    Write the dirty rows: one UPDATE each for the SQLite store, one journal
+    line each for dictionary.csv. The journal is compacted into the CSV once
+    it grows past COMPACT_AFTER entries, or when compact is set.
+    """
+    dirty, app.dict_dirty = app.dict_dirty, {}
+    if app.dict_store:
+        with app.dict_store.batch():
+            for key in dirty:
+                app.dict_store.update(key, record_from_values(app.dict_tree.row(key)))
+        return
+    if not app.dict_journal:
+        return
+    for key, orig_eng in dirty.items():
+        app.dict_journal.put(orig_eng, record_from_values(app.dict_tree.row(key)))
+    app.dict_journal.flush()
+    if app.dict_journal.pending and (compact or app.dict_journal.needs_compaction()):
+        app.dict_journal.compact([record_from_values(vals) for _, vals in app.dict_tree.iter_rows()])
+
+
+def close_dictionary(app):
+    """Flush and compact pending changes, then release the current backend."""
+    if getattr(app, "recheck_job", None) is not None:
+        app.recheck_job.cancel()  # its rows belong to the dictionary being closed
+        app.recheck_job = None
+    flush_dictionary_changes(app, compact=True)
+    if app.dict_journal:
+        app.dict_journal.close()
+        app.dict_journal = None
+    if app.dict_store:
+        app.dict_store.close()
+        app.dict_store = None
+
+
+def convert_dictionary_to_sqlite(app):
+    """Move the current language's dictionary into a SQLite store (dictionary.db)."""
+    if not app.current_language:
+        messagebox.showwarning("No language", "Select a language first.")
+        return
+    if app.dict_store:
+        messagebox.showinfo("SQLite", f"{app.current_language} already uses {app.dict_store.path}")
+        return
+    save_dictionary(app)
     langdir = ensure_language_dir(app.current_language)
-    save_csv(os.path.join(langdir, DICT_FILE), DICT_FIELDS, rows)
+    store = open_dictionary_store(langdir, create=True)
+    store.import_csv(os.path.join(langdir, DICT_FILE))
+    store.close()
+    load_dictionary(app, app.current_language)
+    messagebox.showinfo("SQLite", f"Dictionary for {app.current_language} now stored in SQLite.")
+
+
+def export_dictionary_csv(app):
+    """Write the SQLite store back out to dictionary.csv."""
+    if not app.current_language:
+        messagebox.showwarning("No language", "Select a language first.")
+        return
+    if not app.dict_store:
+        save_dictionary(app)
+        return
+    langdir = ensure_language_dir(app.current_language)
+    app.dict_store.export_csv(os.path.join(langdir, DICT_FILE))
+    messagebox.showinfo("Exported", f"Dictionary exported to {DICT_FILE}.")
 
 
 def sync_conjugations_with_dictionary(app):
@@ -198,31 +439,20 @@ def play_selected_pronunciation(app):
     # Root-level ipa_audio folder
     from utils.file_io import get_ipa_audio_dir
     audio_dir = get_ipa_audio_dir()
+    audio_files = get_ipa_audio_files()
+    phonemes = get_consistency_engine(app.current_language).phonemes if app.current_language else ()
 
-
-    # Iterate through each IPA character
-    for ch in pron:
-        if ch.isspace():
-            continue
-        filename = f"{ch}.mp3"  # assumes files like "a.mp3", "ʃ.mp3"
-        path = os.path.join(audio_dir, filename)
-        if os.path.exists(path):
+    # Iterate through each IPA segment (multi-character symbols like "t͡ʃ" stay whole)
+    for sym in get_pronunciation_segmenter(phonemes).segment(pron):
+        path = audio_files.get(sym, {}).get(".mp3")  # files like "a.mp3", "t͡ʃ.mp3"
+        if path:
             play_audio_file(path)
         else:
-            messagebox.showwarning("Missing", f"No audio file for IPA symbol '{ch}' in {audio_dir}")
+            messagebox.showwarning("Missing", f"No audio file for IPA symbol '{sym}' in {audio_dir}")
 
 def check_phonology_consistency(app, ipa_string):
     """Return True if all IPA symbols in the pronunciation are in the phoneme inventory."""
-    langdir = ensure_language_dir(app.current_language)
-    rows = load_csv(os.path.join(langdir, "phonology.csv"), ["ipa","example","type","notes"])
-    phonemes = {r["ipa"] for r in rows if r.get("ipa")}
-    # simple check: every character in ipa_string must be in phonemes
-    for ch in ipa_string:
-        if ch.isspace():
-            continue
-        if ch not in phonemes:
-            return False
-    return True
+    return get_consistency_engine(app.current_language).check_phonology(ipa_string)
 
 ##def check_spelling_consistency(app, conlang_word, ipa_string):
 ##    """Return True if applying spelling rules to IPA yields the conlang word."""
@@ -241,40 +471,54 @@ def check_phonology_consistency(app, ipa_string):
 
 def check_spelling_consistency(app, conlang_word, ipa_string):
     """Return True if applying spelling rules to IPA yields the conlang word."""
-    langdir = ensure_language_dir(app.current_language)
-    rules_path = os.path.join(langdir, "spelling_rules.csv")
-    if not os.path.exists(rules_path):
-        return True  # no rules defined, assume consistent
+    return get_consistency_engine(app.current_language).check_spelling(conlang_word, ipa_string)
 
-    rows = load_csv(rules_path, ["ipa", "romanization"])
-    rules = [(r["ipa"], r["romanization"]) for r in rows if r.get("ipa")]
-
-    spelling = ipa_string
-    for ipa, roman in rules:
-        if ipa and roman:
-            spelling = spelling.replace(ipa, roman)
-
-    return spelling == conlang_word
 
+RECHECK_BATCH = 500
 
 def recheck_consistency(app):
     if not app.current_language:
         messagebox.showwarning("No language", "Select a language first.")
         return
 
-    for iid in app.dict_tree.get_children():
-        vals = app.dict_tree.item(iid, "values")
-        # Now 9 columns: english, conlang, pos, gender, definition, pronunciation, loanword, cons_phon, cons_spell
-        eng, con, pos, gen, defi, pron, loan, _, _ = vals
-
-        phon_cons = "PASS" if check_phonology_consistency(app, pron) else "FAIL"
-        spell_cons = "PASS" if check_spelling_consistency(app, con, pron) else "FAIL"
-
-        app.dict_tree.item(iid, values=(
-            eng, con, pos, gen, defi, pron, loan, phon_cons, spell_cons
-        ))
+    if getattr(app, "recheck_job", None) is not None:
+        app.recheck_job.cancel()
+    engine = get_consistency_engine(app.current_language)
+    # Now 9 columns: english, conlang, pos, gender, definition, pronunciation, loanword, cons_phon, cons_spell
+    snapshot = [(key, vals[1], vals[5]) for key, vals in app.dict_tree.iter_rows()]
 
-    messagebox.showinfo("Consistency", "Rechecked dictionary consistency against phonology and spelling rules.")
+    def apply(batch):
+        for key, con, pron, phon_cons, spell_cons in batch:
+            try:
+                vals = app.dict_tree.row(key)
+            except KeyError:
+                continue  # deleted meanwhile
+            if (vals[1], vals[5]) != (con, pron):
+                continue  # edited meanwhile; on_dict_row_changed already rechecked it
+            app.dict_tree.set_row(key, vals[:7] + (phon_cons, spell_cons))
+
+    def done(batch):
+        apply(batch)
+        app.recheck_job = None
+        messagebox.showinfo("Consistency", "Rechecked dictionary consistency against phonology and spelling rules.")
+
+    def failed(err):
+        app.recheck_job = None
+        messagebox.showerror("Consistency", f"Recheck failed:\n{err}")
+
+    app.recheck_job = app.executor.submit(_recheck_rows, engine, snapshot,
+                                          on_done=done, on_error=failed, on_progress=apply)
+
+def _recheck_rows(job, engine, snapshot):
+    """Worker: check every (key, conlang, pronunciation), streaming results in batches."""
+    batch = []
+    for key, con, pron in snapshot:
+        batch.append((key, con, pron) + tuple(engine.check_row(con, pron)))
+        if len(batch) >= RECHECK_BATCH:
+            job.check()
+            job.progress(batch)
+            batch = []
+    return batch
 
 def on_dict_double_click(app, event):
     """If user double-clicks a FAIL in Consistent (Spell), jump to Spelling Rules tab."""
@@ -36,7 +36,7 @@ def build_fonts_tab(app):
     app.fonts_list.pack(fill="both", expand=True, padx=6, pady=6)
 
     from utils.table_edit import enable_treeview_editing
-    enable_treeview_editing(app.fonts_list, save_callback=save_current_font_mapping, app=app)
+    enable_treeview_editing(app.fonts_list, save_callback=autosave_font_mapping, app=app)
 
     # Bind selection to preview
     app.fonts_list.bind("<<TreeviewSelect>>", lambda e: show_font_preview(app))
@@ -110,23 +110,48 @@ def load_fonts_for_language(app):
     mapping = load_csv(mapping_file, ["symbol","filename"])
     app.fonts_list.delete(*app.fonts_list.get_children())
     app.font_thumbnails = {}
+    pending = []
     for row in mapping:
         sym = row.get("symbol","")
         fn = row.get("filename","")
-        img_path = os.path.join(folder, fn)
-        photo = None
-        if os.path.exists(img_path):
-            try:
-                img = Image.open(img_path)
-                img.thumbnail((32,32))
-                photo = ImageTk.PhotoImage(img)
-                app.font_thumbnails[sym] = photo
-            except Exception as e:
-                print("Thumbnail error:", e)
-        app.fonts_list.insert("", "end", text=sym, values=(fn,), image=photo)
+        iid = app.fonts_list.insert("", "end", text=sym, values=(fn,))
+        pending.append((iid, sym, os.path.join(folder, fn)))
 
     app.current_font = (lang, font, folder)
 
+    # Thumbnails are decoded off the Tk thread and attached as they arrive
+    if getattr(app, "font_thumb_job", None) is not None:
+        app.font_thumb_job.cancel()
+
+    def attach(batch):
+        for iid, sym, img in batch:
+            if not app.fonts_list.exists(iid):
+                continue
+            photo = ImageTk.PhotoImage(img)
+            app.font_thumbnails[sym] = photo
+            app.fonts_list.item(iid, image=photo)
+
+    app.font_thumb_job = app.executor.submit(_decode_thumbnails, pending,
+                                             on_progress=attach, on_done=attach)
+
+def _decode_thumbnails(job, pending, batch_size=32):
+    """Worker: open and shrink each glyph image, yielding (iid, symbol, PIL image) batches."""
+    batch = []
+    for iid, sym, img_path in pending:
+        job.check()
+        if not os.path.exists(img_path):
+            continue
+        try:
+            img = Image.open(img_path)
+            img.thumbnail((32,32))
+            batch.append((iid, sym, img))
+        except Exception as e:
+            print("Thumbnail error:", e)
+        if len(batch) >= batch_size:
+            job.progress(batch)
+            batch = []
+    return batch
+
 def show_font_preview(app):
     sel = app.fonts_list.selection()
     if not sel or not getattr(app, "current_font", None):
@@ -164,6 +189,7 @@ def add_font_symbol(app):
     dest = os.path.join(folder, os.path.basename(imgp))
     shutil.copyfile(imgp, dest)
     mapping_file = os.path.join(folder, "mapping.csv")
+    app.autosave.flush(mapping_file)  # land queued cell edits before reading it back
     mapping = load_csv(mapping_file, ["symbol","filename"])
     mapping.append({"symbol": symbol, "filename": os.path.basename(imgp)})
     save_csv(mapping_file, ["symbol","filename"], mapping)
@@ -185,6 +211,7 @@ def replace_font_image(app):
     dest = os.path.join(folder, os.path.basename(new))
     shutil.copyfile(new, dest)
     mapping_file = os.path.join(folder, "mapping.csv")
+    app.autosave.flush(mapping_file)  # land queued cell edits before reading it back
     mapping = load_csv(mapping_file, ["symbol","filename"])
     for m in mapping:
         if m.get("symbol") == symbol and m.get("filename") == filename:
@@ -203,6 +230,7 @@ def delete_font_symbol(app):
     lang, fontname, folder = app.current_font
     if messagebox.askyesno("Delete", f"Delete mapping {symbol} -> {filename}?"):
         mapping_file = os.path.join(folder, "mapping.csv")
+        app.autosave.flush(mapping_file)  # land queued cell edits before reading it back
         mapping = load_csv(mapping_file, ["symbol","filename"])
         mapping = [m for m in mapping if not (m.get("symbol")==symbol and m.get("filename")==filename)]
         save_csv(mapping_file, ["symbol","filename"], mapping)
@@ -218,12 +246,26 @@ def save_current_font_mapping(app):
         messagebox.showwarning("No font", "Load font mapping first")
         return
     lang, fontname, folder = app.current_font
+    path = os.path.join(folder, "mapping.csv")
+    app.autosave.cancel(path)
+    save_csv(path, ["symbol","filename"], font_mapping_rows(app))
+    messagebox.showinfo("Saved", "Font mapping saved")
+
+def autosave_font_mapping(app):
+    """Queue mapping.csv on app.autosave after a cell edit (no dialog)."""
+    if not app.current_font:
+        return
+    lang, fontname, folder = app.current_font
+    app.autosave.schedule_csv(os.path.join(folder, "mapping.csv"), ["symbol","filename"],
+                              font_mapping_rows(app))
+
+def font_mapping_rows(app):
     rows = []
     for iid in app.fonts_list.get_children():
-        sym, fn = app.fonts_list.item(iid, "values")
+        sym = app.fonts_list.item(iid, "text")
+        fn = app.fonts_list.item(iid, "values")[0]
         rows.append({"symbol": sym, "filename": fn})
-    save_csv(os.path.join(folder, "mapping.csv"), ["symbol","filename"], rows)
-    messagebox.showinfo("Saved", "Font mapping saved")
+    return rows
 
 def on_language_selected(event=None):
     lang = app.font_lang_combo.get()
@@ -1,9 +1,11 @@
 import os
+import io
 import tkinter as tk
 from tkinter import ttk, messagebox
 
 from constants import LANG_ROOT, GRAMMAR_TEXT, CONJ_FILE, CONJ_FIELDS
-from utils.file_io import ensure_language_dir, save_csv, load_csv
+from utils.file_io import ensure_language_dir, save_csv, load_csv, write_file_atomic
+from utils.conjugations import TENSES, set_conjugations
 
 
 def build_grammar_tab(app):
@@ -50,6 +52,13 @@ def build_grammar_tab(app):
 
     # Conjugations
     app.conj_tree = make_table(subnb, "Conjugations", CONJ_FIELDS, app)
+    look = ttk.Frame(app.conj_tree.master); look.pack(fill="x", padx=6, pady=(0, 6))
+    ttk.Label(look, text="Look up (English or base):").pack(side="left")
+    app.conj_lookup_var = tk.StringVar()
+    app.conj_lookup_var.trace_add("write", lambda *_: lookup_conjugation(app))
+    ttk.Entry(look, textvariable=app.conj_lookup_var, width=20).pack(side="left", padx=4)
+    app.conj_lookup_result = ttk.Label(look, text="")
+    app.conj_lookup_result.pack(side="left", padx=6)
 
     # Transforms
     frame_trans = ttk.Frame(subnb); subnb.add(frame_trans, text="Transforms")
@@ -86,37 +95,69 @@ def save_grammar(app):
         messagebox.showwarning("No language", "Select a language first.")
         return
     langdir = ensure_language_dir(app.current_language)
-    path = os.path.join(langdir, GRAMMAR_TEXT)
+    for p in (os.path.join(langdir, GRAMMAR_TEXT), os.path.join(langdir, CONJ_FILE)):
+        app.autosave.cancel(p)  # written below; drop any older queued copy
 
-    with open(path, "w", encoding="utf-8") as f:
-        # Save user notes
-        f.write("[NOTES]\n" + app.grammar_notes.get("1.0", tk.END).strip() + "\n\n")
+    write_file_atomic(os.path.join(langdir, GRAMMAR_TEXT), lambda f: f.write(grammar_text(app)))
+    # Save conjugations separately as CSV
+    set_conjugations(app, conjugation_rows(app))
+    save_csv(os.path.join(langdir, CONJ_FILE), CONJ_FIELDS, app.conjugations)
 
-        # Save each rule table
-        dump_tree(app.prefix_tree, "PREFIXES", f)
-        dump_tree(app.suffix_tree, "SUFFIXES", f)
-        dump_tree(app.noun_tree, "NOUNS", f)
-        dump_tree(app.articles_tree, "ARTICLES", f)
-        dump_tree(app.pron_tree, "PRONOUNS", f)
-        dump_tree(app.poss_tree, "POSSESSION", f)
-        dump_tree(app.verbs_tree, "VERBS", f)
-        dump_tree(app.conj_tree, "CONJUGATIONS", f)
+    # Refresh summary after saving
+    update_summary(app)
 
-        # Save transforms
-        f.write("[TRANSFORMS]\n" + app.transforms_editor.get("1.0", tk.END).strip() + "\n")
+    messagebox.showinfo("Saved", f"Grammar saved for {app.current_language}")
 
-    # Save conjugations separately as CSV
+
+def autosave_grammar(app):
+    """Queue grammar.txt and conjugations.csv on app.autosave (no dialog)."""
+    if not app.current_language:
+        return
+    langdir = ensure_language_dir(app.current_language)
+    app.autosave.schedule_text(os.path.join(langdir, GRAMMAR_TEXT), grammar_text(app))
+    set_conjugations(app, conjugation_rows(app))
+    app.autosave.schedule_csv(os.path.join(langdir, CONJ_FILE), CONJ_FIELDS, app.conjugations)
+    update_summary(app)
+
+
+def grammar_text(app):
+    """The grammar.txt contents for the current state of the Grammar tab."""
+    f = io.StringIO()
+    # Save user notes
+    f.write("[NOTES]\n" + app.grammar_notes.get("1.0", tk.END).strip() + "\n\n")
+
+    # Save each rule table
+    dump_tree(app.prefix_tree, "PREFIXES", f)
+    dump_tree(app.suffix_tree, "SUFFIXES", f)
+    dump_tree(app.noun_tree, "NOUNS", f)
+    dump_tree(app.articles_tree, "ARTICLES", f)
+    dump_tree(app.pron_tree, "PRONOUNS", f)
+    dump_tree(app.poss_tree, "POSSESSION", f)
+    dump_tree(app.verbs_tree, "VERBS", f)
+    dump_tree(app.conj_tree, "CONJUGATIONS", f)
+
+    # Save transforms
+    f.write("[TRANSFORMS]\n" + app.transforms_editor.get("1.0", tk.END).strip() + "\n")
+    return f.getvalue()
+
+
+def conjugation_rows(app):
     rows = []
     for iid in app.conj_tree.get_children():
         vals = app.conj_tree.item(iid, "values")
         rows.append({c: vals[i] for i, c in enumerate(CONJ_FIELDS)})
-    save_csv(os.path.join(langdir, CONJ_FILE), CONJ_FIELDS, rows)
+    return rows
 
-    # Refresh summary after saving
-    update_summary(app)
-
-    messagebox.showinfo("Saved", f"Grammar saved for {app.current_language}")
 
+def lookup_conjugation(app):
+    """Show the conjugated forms for the word typed in the Conjugations lookup box."""
+    q = app.conj_lookup_var.get().strip()
+    row = app.conj_index.find(english=q, base=q) if q else None
+    if row is None:
+        app.conj_lookup_result.configure(text="(no match)" if q else "")
+        return
+    forms = " | ".join(f"{t}: {app.conj_index.form(row, t) or '—'}" for t in TENSES)
+    app.conj_lookup_result.configure(text=f"{row.get('english','')} / {row.get('base','')} → {forms}")
 
 
 def dump_tree(tree, header, f):
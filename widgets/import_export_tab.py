@@ -72,13 +72,20 @@ def export_language_zip(self):
     if not dest:
         return
     srcdir = os.path.join(LANG_ROOT, lang)
+    self.executor.submit(
+        _write_language_zip, srcdir, dest,
+        on_done=lambda _: messagebox.showinfo("Exported", f"Exported {lang} to {dest}"),
+        on_error=lambda e: messagebox.showerror("Export failed", f"Could not export {lang}:\n{e}"))
+
+def _write_language_zip(job, srcdir, dest):
+    """Worker: zip a language folder (paths relative to LANG_ROOT)."""
     with zipfile.ZipFile(dest, "w") as z:
         for root, dirs, files in os.walk(srcdir):
             for f in files:
+                job.check()
                 full = os.path.join(root, f)
                 rel = os.path.relpath(full, start=LANG_ROOT)
                 z.write(full, rel)
-    messagebox.showinfo("Exported", f"Exported {lang} to {dest}")
 
 def import_language_zip(self):
     path = filedialog.askopenfilename(filetypes=[("Zip files","*.zip")])
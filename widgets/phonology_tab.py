@@ -4,6 +4,7 @@ import tkinter as tk
 from tkinter import ttk, simpledialog, messagebox
 
 from utils.file_io import load_csv, save_csv, ensure_language_dir
+from utils.consistency import invalidate_consistency_engine
 from constants import LANG_ROOT, PHONO_FILE, PHONO_FIELDS, PHONOTEXT
 
 
@@ -140,6 +141,7 @@ def save_phonology_files(app):
             vals = tree.item(iid, "values")
             rows.append({"ipa": vals[0], "example": vals[1], "type": vals[2], "notes": vals[3]})
     save_csv(os.path.join(langdir, PHONO_FILE), PHONO_FIELDS, rows)
+    invalidate_consistency_engine(app.current_language)
     with open(os.path.join(langdir, PHONOTEXT), "w", encoding="utf-8") as f:
         f.write(app.syllable_text.get("1.0", tk.END))
     with open(os.path.join(langdir, "spelling_rules.txt"), "w", encoding="utf-8") as f:
@@ -250,4 +252,5 @@ def save_spelling_rules(app):
         rows.append({"ipa": ipa, "romanization": roman})
 
     save_csv(rules_path, ["ipa", "romanization"], rows)
+    invalidate_consistency_engine(app.current_language)
     messagebox.showinfo("Saved", f"Spelling rules saved for {app.current_language}.")
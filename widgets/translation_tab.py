@@ -2,14 +2,26 @@
 import os
 import re
 import tkinter as tk
-from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
+from functools import lru_cache
+from tkinter import ttk, messagebox, filedialog
 
-from constants import (
-    LANG_ROOT, GRAMMAR_TEXT, CONJ_FILE, CONJ_FIELDS,
-    FONTS_DIRNAME, DICT_FILE, DICT_FIELDS
-)
-from utils.file_io import load_csv
+from constants import LANG_ROOT, GRAMMAR_TEXT, CONJ_FILE
+from utils.consistency import get_consistency_engine
+from utils.ipa_segmenter import get_ipa_audio_files, get_pronunciation_segmenter
+from utils.conjugations import ConjugationIndex
+from utils.grammar import get_compiled_grammar, compile_grammar_text, TransformEngine
+from utils.translator import Translator
+from utils.translation_memory import get_translation_memory
+from utils.batch_translate import translate_file
+from utils.glyph_atlas import get_glyph_atlas, first_font_dir
+from utils.glyph_layout import GlyphLayout
+from utils.glyph_canvas import GlyphView
+
+BATCH_PARALLEL_BYTES = 1 << 20   # files larger than this are translated in a process pool
+LIVE_DELAY_MS = 250              # typing pause before live mode re-translates
+
+# Live mode works sentence by sentence: a break is whitespace after ".", "!" or "?"
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
 
 
 def build_translation_tab(app):
@@ -31,14 +43,30 @@ def build_translation_tab(app):
         width=10,
         state="readonly"
     ).pack(side="left", padx=4)
+    app.tm_persist_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(tense_frame, text="Keep translation memory on disk",
+                    variable=app.tm_persist_var,
+                    command=lambda: translation_memory(app)).pack(side="left", padx=(12, 0))
 
     # English → Conlang
     ttk.Label(tab, text="English → Conlang").pack(anchor="w", padx=8)
     app.trans_input = tk.Text(tab, height=4, wrap="word",
                               bg="#1b1b1b", fg="#eaeaea", insertbackground="white")
     app.trans_input.pack(fill="x", padx=8, pady=4)
-    ttk.Button(tab, text="Translate to Conlang",
-               command=lambda: translate_to_conlang(app)).pack(anchor="w", padx=8, pady=(0, 6))
+    conlang_btns = ttk.Frame(tab)
+    conlang_btns.pack(fill="x", padx=8, pady=(0, 6))
+    ttk.Button(conlang_btns, text="Translate to Conlang",
+               command=lambda: translate_to_conlang(app)).pack(side="left")
+    ttk.Button(conlang_btns, text="Translate File…",
+               command=lambda: translate_file_dialog(app)).pack(side="left", padx=(6, 0))
+    app.trans_live_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(conlang_btns, text="Live", variable=app.trans_live_var,
+                    command=lambda: schedule_live_translation(app)).pack(side="left", padx=(6, 0))
+    app.trans_batch_cancel = ttk.Button(conlang_btns, text="Cancel", state="disabled",
+                                        command=lambda: cancel_batch_translation(app))
+    app.trans_batch_cancel.pack(side="left", padx=(6, 0))
+    app.trans_batch_status = ttk.Label(conlang_btns, text="")
+    app.trans_batch_status.pack(side="left", padx=8)
 
     # Conlang → English
     ttk.Label(tab, text="Conlang → English").pack(anchor="w", padx=8)
@@ -67,9 +95,20 @@ def build_translation_tab(app):
 
     # Glyph preview canvas
     ttk.Label(tab, text="Glyph Preview:").pack(anchor="w", padx=8)
-    app.trans_canvas = tk.Canvas(tab, bg="white", height=200)
-    app.trans_canvas.pack(fill="both", expand=True, padx=8, pady=8)
-    app.trans_canvas.image_refs = []
+    canvas_frame = ttk.Frame(tab)
+    canvas_frame.pack(fill="both", expand=True, padx=8, pady=8)
+    canvas_scroll = ttk.Scrollbar(canvas_frame, orient="vertical")
+    canvas_scroll.pack(side="right", fill="y")
+    app.trans_canvas = tk.Canvas(canvas_frame, bg="white", height=200,
+                                 yscrollcommand=canvas_scroll.set)
+    app.trans_canvas.pack(side="left", fill="both", expand=True)
+    app.glyph_view = GlyphView(app.trans_canvas)  # only rows in view become canvas items
+    canvas_scroll.configure(command=app.glyph_view.yview)
+
+    app.live_after = None
+    app.live_key = None
+    app.live_segments = []
+    app.trans_input.bind("<<Modified>>", lambda e: on_trans_input_modified(app))
 
 
 # -------------------------
@@ -87,41 +126,39 @@ def translate_to_conlang(app):
         messagebox.showwarning("No dictionary", "Load a language first.")
         return
 
-    # Parse grammar from the editor if present; else from grammar.txt
-    grammar_text = ""
-    if hasattr(app, "grammar_editor"):
-        grammar_text = app.grammar_editor.get("1.0", tk.END)
-        parsed = parse_grammar_text(grammar_text)
-    else:
-        parsed = parse_grammar_file(app)
+    result = conlang_translator(app).translate(text)
+    show_conlang_result(app, text, result)
 
-    # Apply phrase-level transforms (supports {placeholders} and "=>")
-    transformed_phrase = apply_phrase_transforms(text, parsed.get("transforms", []))
+    # Render glyphs
+    render_glyphs(app, result)
 
-    # Tokenize after transforms, then dictionary + word-level rules
-    out_words = []
-    for tok in transformed_phrase.split():
-        entry = app.dictionary.get(tok.lower())
-        if entry:
-            con = entry.get("conlang", "") or ""
-            pos = (entry.get("pos", "") or "").lower()
-        else:
-            con = f"[{tok}]"
-            pos = ""
 
-        # Prefixes/Suffixes from parsed grammar
-        con = apply_prefix_suffix(con, pos, parsed)
+def current_grammar(app):
+    """Compiled grammar of the current language, after writing out queued Grammar tab edits."""
+    langdir = os.path.join(LANG_ROOT, app.current_language)
+    for fn in (GRAMMAR_TEXT, CONJ_FILE):
+        app.autosave.flush(os.path.join(langdir, fn))
+    return get_compiled_grammar(app.current_language)
 
-        # Conjugations by selected tense (only for verbs)
-        if pos == "verb" and getattr(app, "conjugations", None):
-            tense = app.tense_var.get() if hasattr(app, "tense_var") else "present"
-            con = apply_conjugation_for_token(con, tok, app.conjugations, tense)
 
-        out_words.append(con)
+def conlang_translator(app):
+    """
+    Translator for the current language: transforms, longest-match dictionary
+    lookup, affixes and conjugation (selected tense) over the in-memory
+    lexicon and conjugation index.
+    """
+    # Compiled grammar from the editor if present; else from grammar.txt (cached either way)
+    if hasattr(app, "grammar_editor"):
+        grammar = compile_grammar_text(app.grammar_editor.get("1.0", tk.END), app.conjugations)
+    else:
+        grammar = current_grammar(app)
+    tense = app.tense_var.get() if hasattr(app, "tense_var") else "present"
+    return Translator(app.lexicon, grammar, app.conj_index, tense,
+                      app.current_language, translation_memory(app))
 
-    result = " ".join(out_words)
 
-    # Output + pronunciation (first input word)
+def show_conlang_result(app, text, result):
+    """Output + pronunciation (first input word)."""
     app.trans_output.delete("1.0", tk.END)
     app.trans_output.insert(tk.END, result)
 
@@ -129,8 +166,157 @@ def translate_to_conlang(app):
     pron = app.dictionary.get(first_word.lower(), {}).get("pronunciation", "") if first_word else ""
     app.trans_pron.configure(text=pron or "—")
 
-    # Render glyphs
-    render_glyphs(app, result)
+
+# -------------------------
+# Live translation
+# -------------------------
+
+class LiveSegment:
+    """One input sentence in live mode, its translation and the glyph layout of that."""
+
+    __slots__ = ("source", "output", "layout")
+
+    def __init__(self, source, output, layout=None):
+        self.source = source
+        self.output = output
+        self.layout = layout
+
+
+def split_sentences(text):
+    return [seg for seg in SENTENCE_BREAK.split(text.strip()) if seg]
+
+
+def on_trans_input_modified(app):
+    app.trans_input.edit_modified(False)  # re-arm <<Modified>>
+    if app.trans_live_var.get():
+        schedule_live_translation(app)
+
+
+def schedule_live_translation(app):
+    """Debounce: translate once typing pauses for LIVE_DELAY_MS."""
+    if app.live_after is not None:
+        app.after_cancel(app.live_after)
+        app.live_after = None
+    if app.trans_live_var.get():
+        app.live_after = app.after(LIVE_DELAY_MS, lambda: live_translate(app))
+
+
+def live_translate(app):
+    """
+    Re-translate only what changed since the last live update. The input is
+    split into sentences and compared with the previous ones; the unchanged
+    sentences at the start and end keep their translations and glyph
+    layouts, only the sentences in between are translated (through the
+    translation memory) and laid out, and the glyph view redraws just the
+    rows in sight. Each sentence starts a new row of glyphs. Transforms and dictionary
+    phrases cannot reach across a sentence break (the token before it keeps
+    its punctuation) unless they contain one themselves, so the text matches
+    translating the whole input at once.
+    """
+    app.live_after = None
+    if not app.current_language or not app.dictionary:
+        return
+    text = app.trans_input.get("1.0", tk.END).strip()
+    translator = conlang_translator(app)
+    atlas = glyph_font(app)
+
+    # Anything but a text edit (tense, grammar, dictionary, font) redoes every sentence
+    key = (translator.tag, translator.tense, atlas and (atlas.fontdir, atlas.stamp))
+    old = app.live_segments
+    if key != app.live_key:
+        app.live_key = key
+        old = []
+
+    sources = split_sentences(text)
+    head = 0
+    while head < min(len(old), len(sources)) and old[head].source == sources[head]:
+        head += 1
+    tail = 0
+    while tail < min(len(old), len(sources)) - head and old[-1 - tail].source == sources[-1 - tail]:
+        tail += 1
+
+    width = app.glyph_view.width()
+    fresh = []
+    for src in sources[head:len(sources) - tail]:
+        out = translator.translate(src)
+        fresh.append(LiveSegment(src, out, GlyphLayout(atlas, out, width) if atlas else None))
+    segments = old[:head] + fresh + old[len(old) - tail:]
+    app.glyph_view.set_blocks([seg.layout for seg in segments if seg.layout is not None])
+    app.live_segments = segments
+
+    show_conlang_result(app, text, " ".join(seg.output for seg in app.live_segments))
+
+
+def translate_file_dialog(app):
+    """Translate a whole English text file into the conlang, line by line, in the background."""
+    if not app.current_language:
+        messagebox.showwarning("No language", "Load a language first.")
+        return
+    if getattr(app, "trans_batch_job", None) is not None:
+        messagebox.showinfo("Translate File", "A file translation is already running.")
+        return
+    src = filedialog.askopenfilename(title="English text to translate",
+                                     filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+    if not src:
+        return
+    lang = app.current_language
+    stem = os.path.splitext(os.path.basename(src))[0]
+    dst = filedialog.asksaveasfilename(title="Save translation as", defaultextension=".txt",
+                                       initialfile=f"{stem}_{lang}.txt",
+                                       filetypes=[("Text files", "*.txt")])
+    if not dst:
+        return
+    if os.path.abspath(dst) == os.path.abspath(src):
+        messagebox.showerror("Translate File", "Choose a different output file.")
+        return
+
+    # The batch reads the language from disk: write out pending edits first
+    from widgets.dictionary_tab import flush_dictionary_changes
+    flush_dictionary_changes(app)
+    app.autosave.flush()
+
+    tense = app.tense_var.get() if hasattr(app, "tense_var") else "present"
+    jobs = (os.cpu_count() or 1) if os.path.getsize(src) > BATCH_PARALLEL_BYTES else 1
+
+    def progress(value):
+        done, total = value
+        pct = 100 * done // total if total else 100
+        app.trans_batch_status.configure(text=f"Translating {os.path.basename(src)}: {pct}%")
+
+    def finished():
+        app.trans_batch_job = None
+        app.trans_batch_cancel.configure(state="disabled")
+
+    def done(stats):
+        finished()
+        app.trans_batch_status.configure(text=f"Translated {stats.lines} lines")
+        messagebox.showinfo("Translate File", f"Saved {dst}\n\n{stats.summary()}")
+
+    def failed(err):
+        finished()
+        app.trans_batch_status.configure(text="")
+        messagebox.showerror("Translate File", f"Translation failed:\n{err}")
+
+    app.trans_batch_status.configure(text=f"Translating {os.path.basename(src)}…")
+    app.trans_batch_cancel.configure(state="normal")
+    app.trans_batch_job = app.executor.submit(_translate_file_job, lang, src, dst, tense, jobs,
+                                              translation_memory(app),
+                                              on_done=done, on_error=failed, on_progress=progress)
+
+
+def _translate_file_job(job, lang, src, dst, tense, jobs, memory):
+    """Worker: batch-translate src into dst, reporting (bytes done, total)."""
+    return translate_file(lang, src, dst, tense=tense, jobs=jobs, memory=memory,
+                          progress=lambda done, total: job.progress((done, total)),
+                          check=job.check)
+
+
+def cancel_batch_translation(app):
+    if getattr(app, "trans_batch_job", None) is not None:
+        app.trans_batch_job.cancel()
+        app.trans_batch_job = None
+    app.trans_batch_cancel.configure(state="disabled")
+    app.trans_batch_status.configure(text="Cancelled")
 
 
 def translate_to_english(app):
@@ -141,14 +327,11 @@ def translate_to_english(app):
         messagebox.showwarning("No dictionary", "Load a language first.")
         return
 
-    # Reverse dictionary
-    rev = {v.get("conlang", "").lower(): k for k, v in app.dictionary.items() if v.get("conlang")}
-    words = text.split()
-    out = []
-    for w in words:
-        out.append(rev.get(w, f"[{w}]"))
-
-    result = " ".join(out)
+    # Reverse lookups come from app.lexicon, kept current as the dictionary is edited
+    lang = app.current_language
+    grammar = current_grammar(app)
+    result = Translator(app.lexicon, grammar, app.conj_index, lang=lang,
+                        memory=translation_memory(app)).reverse(text)
     app.trans_output.delete("1.0", tk.END)
     app.trans_output.insert(tk.END, result)
     app.trans_pron.configure(text="—")
@@ -156,160 +339,43 @@ def translate_to_english(app):
     render_glyphs(app, text)
 
 
+def translation_memory(app):
+    """The current language's translation memory, on disk if the checkbox is set."""
+    if not app.current_language:
+        return None
+    persistent = app.tm_persist_var.get() if hasattr(app, "tm_persist_var") else False
+    return get_translation_memory(app.current_language, persistent)
+
+
 # -------------------------
 # Grammar parsing
 # -------------------------
 
-def parse_grammar_text(text):
-    """
-    Parse grammar rules from freeform editor text (old style):
-    - prefix(pos): a-, b-
-    - suffix(pos): -x, -y
-    - transforms: left => right
-    """
-    prefixes = {}
-    suffixes = {}
-    transforms = []
-    notes = []
-    for ln in text.splitlines():
-        L = ln.strip()
-        if not L or L.startswith("#"):
-            continue
-
-        if L.lower().startswith("prefix(") and ":" in L:
-            try:
-                inside = L[L.index("(") + 1:L.index(")")]
-                pos = inside.strip().lower()
-                val = L.split(":", 1)[1].strip()
-                prefixes[pos] = [v.strip() for v in val.split(",") if v.strip()]
-            except Exception:
-                notes.append(L)
-            continue
-
-        if L.lower().startswith("suffix(") and ":" in L:
-            try:
-                inside = L[L.index("(") + 1:L.index(")")]
-                pos = inside.strip().lower()
-                val = L.split(":", 1)[1].strip()
-                suffixes[pos] = [v.strip() for v in val.split(",") if v.strip()]
-            except Exception:
-                notes.append(L)
-            continue
-
-        if "=>" in L:
-            left, right = L.split("=>", 1)
-            # Trim stray quotes on right side if present
-            transforms.append((left.strip(), right.strip().strip('"').strip("'")))
-            continue
-
-        notes.append(L)
-
-    return {"prefixes": prefixes, "suffixes": suffixes, "transforms": transforms, "notes": notes}
-
-
 def parse_grammar_file(app):
-    """
-    Parse grammar.txt (sectioned format saved by grammar_tab):
-    - [PREFIXES] table with header "POS,Prefixes"
-    - [SUFFIXES] table with header "POS,Suffixes"
-    - [TRANSFORMS] lines like "{owner}'s {object} => the {object} of {owner}"
-    Returns same structure as parse_grammar_text.
-    """
-    prefixes = {}
-    suffixes = {}
-    transforms = []
-
+    """Parsed grammar.txt of the current language (see utils/grammar.py)."""
     if not app.current_language:
-        return {"prefixes": prefixes, "suffixes": suffixes, "transforms": transforms}
-
-    path = os.path.join(LANG_ROOT, app.current_language, GRAMMAR_TEXT)
-    if not os.path.exists(path):
-        return {"prefixes": prefixes, "suffixes": suffixes, "transforms": transforms}
-
-    section = None
-    with open(path, "r", encoding="utf-8") as f:
-        for raw in f:
-            ln = raw.strip()
-            if not ln:
-                continue
-            if ln.startswith("[") and ln.endswith("]"):
-                section = ln.strip("[]").upper()
-                continue
-
-            # Tables
-            if section == "PREFIXES":
-                # Skip header line like "POS,Prefixes"
-                if ln.lower().startswith("pos,"):
-                    continue
-                if "," in ln:
-                    pos, pfxs = ln.split(",", 1)
-                    pos = pos.strip().lower()
-                    # split by commas, allow multiple prefixes; skip empties
-                    values = [v.strip() for v in pfxs.split(",") if v.strip()]
-                    if values:
-                        prefixes[pos] = values
-
-            elif section == "SUFFIXES":
-                if ln.lower().startswith("pos,"):
-                    continue
-                if "," in ln:
-                    pos, sfxs = ln.split(",", 1)
-                    pos = pos.strip().lower()
-                    values = [v.strip() for v in sfxs.split(",") if v.strip()]
-                    if values:
-                        suffixes[pos] = values
-
-            elif section == "TRANSFORMS":
-                # Lines like: pattern => replacement
-                if "=>" in ln:
-                    left, right = ln.split("=>", 1)
-                    transforms.append((left.strip(), right.strip().strip('"').strip("'")))
-
-    return {"prefixes": prefixes, "suffixes": suffixes, "transforms": transforms}
+        return {"prefixes": {}, "suffixes": {}, "transforms": []}
+    return current_grammar(app).as_dict()
 
 
 # -------------------------
 # Transform and word rules
 # -------------------------
 
+@lru_cache(maxsize=32)
+def _transform_engine(transforms):
+    return TransformEngine(transforms)
+
+
 def apply_phrase_transforms(sentence, transforms):
     """
     Apply transforms to the sentence.
     Supports placeholder templates like:
       "{owner}'s {object} => the {object} of {owner}"
-    Captures apostrophes inside words via [\\w']+.
+    Captures apostrophes inside words via [\\w']+. All rules are applied in
+    a single scan (see utils.grammar.TransformEngine for the priority).
     """
-    s = sentence
-    for pattern, replacement in transforms:
-        # Normalize quotes
-        pattern = pattern.strip().strip('"').strip("'")
-        replacement = replacement.strip().strip('"').strip("'")
-
-        # Find placeholders {name}
-        names = re.findall(r"\{(\w+)\}", pattern)
-        if not names:
-            # Simple literal replacement
-            s = s.replace(pattern, replacement)
-            continue
-
-        # Build regex: replace each {name} with a named group
-        regex = re.escape(pattern)
-        for name in names:
-            # Replace the escaped "{name}" with a named capture allowing apostrophes
-            regex = regex.replace(r"\{" + name + r"\}", fr"(?P<{name}>[\w']+)")
-        # Allow flexible spacing
-        regex = regex.replace(r"\ ", r"\s+")
-
-        try:
-            s = re.sub(regex, lambda m: replacement.format(**{n: m.group(n) for n in names}), s)
-        except Exception:
-            # Fallback: raw replacement if format fails
-            try:
-                s = re.sub(regex, replacement, s)
-            except Exception:
-                pass
-
-    return s
+    return _transform_engine(tuple(transforms)).apply(sentence)
 
 
 def apply_prefix_suffix(con_word, pos, parsed):
@@ -329,20 +395,11 @@ def apply_conjugation_for_token(con_word, english_token, conjugations, tense):
     Apply conjugation using the selected tense.
     Prefers matching by the English token (row['english'] == english_token).
     If not found, attempts matching by base == conlang base.
+    conjugations is a ConjugationIndex (app.conj_index) or a list of rows.
     """
-    # 1) Try English match
-    for row in conjugations:
-        if (row.get("english") or "").lower() == (english_token or "").lower():
-            val = row.get(tense, "") or ""
-            return val if val else con_word
-
-    # 2) Fallback: match by conlang base
-    for row in conjugations:
-        if (row.get("base") or "").lower() == (con_word or "").lower():
-            val = row.get(tense, "") or ""
-            return val if val else con_word
-
-    return con_word
+    if not isinstance(conjugations, ConjugationIndex):
+        conjugations = ConjugationIndex(conjugations)
+    return conjugations.conjugate(con_word, english_token, tense)
 
 
 # -------------------------
@@ -350,63 +407,20 @@ def apply_conjugation_for_token(con_word, english_token, conjugations, tense):
 # -------------------------
 
 def render_glyphs(app, text):
-    canvas = app.trans_canvas
-    canvas.delete("all")
-    canvas.image_refs = []
-
-    if not app.current_language:
+    """Lay text out as glyphs once; the glyph view draws the rows that are in view."""
+    app.live_segments = []  # live mode starts over after a full render
+    atlas = glyph_font(app) if app.current_language else None
+    if atlas is None:
+        app.glyph_view.set_blocks([])
         return
+    app.trans_canvas.yview_moveto(0)
+    app.glyph_view.set_blocks([GlyphLayout(atlas, text, app.glyph_view.width())])
 
-    fontpath = os.path.join(LANG_ROOT, app.current_language, FONTS_DIRNAME)
-    if not os.path.exists(fontpath):
-        return
-    fonts = [d for d in os.listdir(fontpath) if os.path.isdir(os.path.join(fontpath, d))]
-    if not fonts:
-        return
-    mapping = load_csv(os.path.join(fontpath, fonts[0], "mapping.csv"), ["symbol", "filename"])
-    sym_map = {m["symbol"]: m["filename"] for m in mapping if m.get("symbol")}
-
-    sorted_syms = sorted(sym_map.keys(), key=len, reverse=True)
-    x, y, line_h = 10, 10, 60
-    maxw = int(canvas.winfo_width() or 1000)
-    i = 0
-    L = len(text)
-    while i < L:
-        matched = False
-        for sym in sorted_syms:
-            if text[i:i+len(sym)] == sym:
-                fn = sym_map[sym]
-                path = os.path.join(fontpath, fonts[0], fn)
-                if os.path.exists(path):
-                    try:
-                        im = Image.open(path)
-                        desired_h = 50
-                        w, h = im.size
-                        scale = desired_h / h if h else 1.0
-                        im2 = im.resize((int(w * scale), desired_h), Image.Resampling.LANCZOS)
-                        photo = ImageTk.PhotoImage(im2)
-                        canvas.create_image(x, y, anchor="nw", image=photo)
-                        canvas.image_refs.append(photo)
-                        x += im2.width + 4
-                        line_h = max(line_h, im2.height + 5)
-                    except Exception:
-                        canvas.create_text(x, y, anchor="nw", text=sym, font=("Arial", 18))
-                        x += 12 * len(sym)
-                else:
-                    canvas.create_text(x, y, anchor="nw", text=sym, font=("Arial", 18))
-                    x += 12 * len(sym)
-                i += len(sym)
-                matched = True
-                break
-        if not matched:
-            ch = text[i]
-            canvas.create_text(x, y, anchor="nw", text=ch, font=("Arial", 18))
-            x += 12
-            i += 1
-        if x > maxw - 60:
-            x = 10
-            y += line_h
-            line_h = 60
+
+def glyph_font(app):
+    """GlyphAtlas of the current language's first font (validated), or None."""
+    fontdir = first_font_dir(app.current_language)
+    return get_glyph_atlas(fontdir) if fontdir else None
 
 
 # -------------------------
@@ -428,14 +442,17 @@ def play_pronunciation(app):
         messagebox.showinfo("No audio", f"No ipa_audio folder for {app.current_language}.")
         return
 
+    audio_files = get_ipa_audio_files()
+    phonemes = get_consistency_engine(app.current_language).phonemes
+
     played_any = False
-    for ch in ipa:
-        if ch in (" ", "/", "|"):
+    for ch in get_pronunciation_segmenter(phonemes).segment(ipa):
+        if ch in ("/", "|"):
             continue
         found = False
         for ext in (".wav", ".mp3"):
-            path = os.path.join(ipa_folder, f"{ch}{ext}")
-            if os.path.exists(path):
+            path = audio_files.get(ch, {}).get(ext)
+            if path:
                 found = True
                 played_any = True
                 try: